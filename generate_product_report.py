@@ -71,7 +71,7 @@ def get_all_products() -> list:
     products = set()
     for pillar_products in PILLAR_PRODUCTS.values():
         products.update(pillar_products)
-    return sorted(list(products))
+    return sorted(products)
 
 def parse_args():
     parser = argparse.ArgumentParser(description="RASOS Modular Product Report Generator")
@@ -197,7 +197,7 @@ if __name__ == "__main__":
                 # Extract build names
                 if hasattr(repo.ci_status.jfrog_status, 'matched_build_names') and repo.ci_status.jfrog_status.matched_build_names:
                     # Convert set to sorted list for consistent JSON output
-                    build_names_list = sorted(list(repo.ci_status.jfrog_status.matched_build_names))
+                    build_names_list = sorted(repo.ci_status.jfrog_status.matched_build_names)
                     data['build_names'] = json.dumps(build_names_list)
                 elif repo.ci_status.jfrog_status.is_exist:
                     # If JFrog CI exists but no build names (shouldn't happen with new logic), show empty list
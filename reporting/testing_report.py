@@ -57,7 +57,7 @@ class TestingReport(ProductReport):
             if hasattr(repo.ci_status, 'jfrog_status') and repo.ci_status.jfrog_status:
                 data['status_scan_dependencies_jfrog'] = repo.ci_status.jfrog_status.is_exist
                 if hasattr(repo.ci_status.jfrog_status, 'matched_build_names') and repo.ci_status.jfrog_status.matched_build_names:
-                    build_names_list = sorted(list(repo.ci_status.jfrog_status.matched_build_names))
+                    build_names_list = sorted(repo.ci_status.jfrog_status.matched_build_names)
                     data['status_build_names_jfrog'] = json.dumps(build_names_list)
                 elif repo.ci_status.jfrog_status.is_exist:
                     data['status_build_names_jfrog'] = '[]'
@@ -6,6 +6,7 @@ from .product import Product
 from .product_pillar import ProductPillar
 from .scm_info import SCMInfo
 from .hr_info import HRInfo
+from .owner import OwnerRecord
 from .ci_status import CIStatus, SonarCIStatus, JfrogCIStatus
 from .cd_status import CDStatus
 from .vulnerabilities import Vulnerabilities, CodeIssues, DependenciesVulnerabilities
@@ -18,6 +19,7 @@ __all__ = [
     'ProductPillar', 
     'SCMInfo',
     'HRInfo',
+    'OwnerRecord',
     'CIStatus',
     'SonarCIStatus',
     'JfrogCIStatus',
@@ -0,0 +1,81 @@
+"""
+OwnerRecord class - Repository owner enriched with HR data
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional
+
+# SCM-specific fields, only present for owners of the SCM that provides them
+# (access_level: GitLab, review_count: GitHub/Bitbucket)
+SCM_SPECIFIC_FIELDS = frozenset(('access_level', 'review_count'))
+
+
+class OwnerRecord(Mapping):
+    """
+    Repository owner (SCM user) enriched with HRDB information.
+    Read-only mapping with the keys of the owner dicts it replaces: SCM-specific fields that
+    were not set (access_level outside GitLab, review_count on GitLab) are left out.
+    """
+
+    __slots__ = ('name', 'access_level', 'review_count', 'general_manager', 'vp', 'title', 'department',
+                 'manager_name', 'director', 'vp2', 'c_level', 'worker_id', 'full_name')
+
+    def __init__(self, name: str, access_level: Optional[int] = None, review_count: Optional[int] = None,
+                 general_manager: Optional[str] = None, vp: Optional[str] = None, title: Optional[str] = None,
+                 department: Optional[str] = None, manager_name: Optional[str] = None,
+                 director: Optional[str] = None, vp2: Optional[str] = None, c_level: Optional[str] = None,
+                 worker_id: Optional[str] = None, full_name: Optional[str] = None):
+        """
+        Initialize OwnerRecord
+
+        Args:
+            name (str): SCM username
+            access_level (int, optional): SCM access level (GitLab)
+            review_count (int, optional): Number of recent PR reviews (GitHub/Bitbucket)
+            general_manager (str, optional): General manager
+            vp (str, optional): VP (with fallback to VP 1 / C Level)
+            title (str, optional): Job title
+            department (str, optional): Department description
+            manager_name (str, optional): Direct manager name
+            director (str, optional): Director name
+            vp2 (str, optional): Secondary VP (from VP 2)
+            c_level (str, optional): C-level executive
+            worker_id (str, optional): Employee worker ID
+            full_name (str, optional): Full employee name
+        """
+        self.name = name
+        self.access_level = access_level
+        self.review_count = review_count
+        self.general_manager = general_manager
+        self.vp = vp
+        self.title = title
+        self.department = department
+        self.manager_name = manager_name
+        self.director = director
+        self.vp2 = vp2
+        self.c_level = c_level
+        self.worker_id = worker_id
+        self.full_name = full_name
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        value = getattr(self, key)
+        if value is None and key in SCM_SPECIFIC_FIELDS:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.__slots__:
+            if key not in SCM_SPECIFIC_FIELDS or getattr(self, key) is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dict (e.g. for json.dumps)"""
+        return {key: getattr(self, key) for key in self}
+
+    def __repr__(self) -> str:
+        return f"OwnerRecord(name='{self.name}', vp='{self.vp}', title='{self.title}')"
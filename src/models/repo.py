@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 class Repo:
     """
     Central repository representation and main aggregator for all repository-related information
-    Now includes repo_owners (list of dicts with owner info) instead of hr_info.
+    Now includes repo_owners (list of OwnerRecord with owner info) instead of hr_info.
     """
 
     def __init__(self, scm_info: SCMInfo, product_name: str, 
@@ -30,7 +30,7 @@ class Repo:
         Args:
             scm_info (SCMInfo): Source control management information
             product_name (str): Product name for HR mapping
-            repo_owners (Optional[list]): List of repository owners (dicts)
+            repo_owners (Optional[list]): List of repository owners (OwnerRecord)
             is_production (bool): Whether this is a production repository
         """
         self.scm_info = scm_info
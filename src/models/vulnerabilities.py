@@ -14,8 +14,12 @@ class DeployedArtifact:
     Represents a deployed artifact with vulnerability counts
     Contains artifact metadata and vulnerability severity breakdown
     """
-    
-    def __init__(self, artifact_key: str, repo_name: str, critical_count: int = 0, 
+
+    __slots__ = ('artifact_key', 'repo_name', 'critical_count', 'high_count', 'medium_count',
+                 'low_count', 'unknown_count', 'artifact_type', 'build_name', 'build_number',
+                 'created_at', 'updated_at', 'build_timestamp', 'sha256', 'jfrog_path', 'is_latest')
+
+    def __init__(self, artifact_key: str, repo_name: str, critical_count: int = 0,
                  high_count: int = 0, medium_count: int = 0, low_count: int = 0,
                  unknown_count: int = 0, artifact_type: str = "unknown", 
                  build_name: Optional[str] = None, build_number: Optional[str] = None,
@@ -343,6 +347,8 @@ class CodeIssues:
         """
         self.issues_by_type = issues_by_type or {}
         self.secrets_count = secrets_count
+        # (total, critical/blocker) counts across all issue types, computed on first use
+        self._totals = None
         
         logger.debug("CodeIssues created with %d issue types: %s, secrets_count: %d", 
                     len(self.issues_by_type), list(self.issues_by_type.keys()), secrets_count)
@@ -356,6 +362,7 @@ class CodeIssues:
             severity_counts (dict): Dictionary of severity to count mapping
         """
         self.issues_by_type[issue_type] = severity_counts
+        self._totals = None
         logger.debug("Added issue type '%s' with counts: %s", issue_type, severity_counts)
     
     def get_issue_types(self) -> List[str]:
@@ -376,19 +383,23 @@ class CodeIssues:
         counts = self.get_counts_for_type(issue_type)
         return counts.get('CRITICAL', 0) + counts.get('BLOCKER', 0)
     
+    def _get_totals(self) -> tuple:
+        """Get (total, critical/blocker) counts across all issue types, summed in a single pass and cached"""
+        if self._totals is None:
+            total = critical = 0
+            for type_counts in self.issues_by_type.values():
+                total += sum(type_counts.values())
+                critical += type_counts.get('CRITICAL', 0) + type_counts.get('BLOCKER', 0)
+            self._totals = (total, critical)
+        return self._totals
+    
     def get_total_count(self) -> int:
         """Get total count across all issue types"""
-        total = 0
-        for type_counts in self.issues_by_type.values():
-            total += sum(type_counts.values())
-        return total
+        return self._get_totals()[0]
     
     def get_critical_count(self) -> int:
         """Get total critical/blocker count across all issue types"""
-        total = 0
-        for type_counts in self.issues_by_type.values():
-            total += type_counts.get('CRITICAL', 0) + type_counts.get('BLOCKER', 0)
-        return total
+        return self._get_totals()[1]
     
     def get_vulnerability_count(self) -> int:
         """Get total vulnerability count (for backward compatibility)"""
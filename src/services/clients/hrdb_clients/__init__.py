@@ -3,6 +3,6 @@ HRDB Clients - Human Resources Database API clients
 Contains clients for HR database integrations
 """
 
-from .hrdb_client import HRDBClient
+from .hrdb_client import HRDBClient, HR_FIELDS, get_default_hrdb
 
-__all__ = ['HRDBClient']
+__all__ = ['HRDBClient', 'HR_FIELDS', 'get_default_hrdb']
@@ -1,9 +1,13 @@
 import pandas as pd
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keys of the user data returned by HRDBClient.get_user_data, in order
+HR_FIELDS = ('general_manager', 'vp', 'title', 'department', 'manager_name',
+             'director', 'vp2', 'c_level', 'worker_id', 'full_name')
+
 class HRDBClient:
     def __init__(self, hrdb_path: str = "data/HROPS-3719.csv"):
         try:
@@ -13,6 +17,8 @@ class HRDBClient:
         except Exception as e:
             logger.error("Failed to load HRDB: %s", e)
             self.df = pd.DataFrame()
+        # Lowercased username -> user data, so repeated lookups skip the DataFrame scan
+        self._user_data_cache: Dict[str, Dict[str, Optional[str]]] = {}
 
     def _get_vp_with_fallback(self, record) -> str:
         """VP Logic: VP 2 -> VP 1 -> C Level -> ''"""
@@ -92,43 +98,88 @@ class HRDBClient:
             'full_name': ...
         }
         If not found, values are empty strings.
+        Results are cached per username for the lifetime of the client.
         """
         username_lower = username.lower()
+        user_data = self._user_data_cache.get(username_lower)
+        if user_data is None:
+            user_data = self._lookup_user_data(username_lower)
+            self._user_data_cache[username_lower] = user_data
+        return user_data
+
+    def prime_cache(self, usernames: Iterable[str]) -> int:
+        """
+        Load HR data for many usernames with a single DataFrame scan, so that the
+        following get_user_data calls for them are dictionary reads.
+
+        Args:
+            usernames: Usernames to look up (case-insensitive)
+
+        Returns:
+            int: Number of usernames newly added to the cache
+        """
+        missing = {username.lower() for username in usernames} - self._user_data_cache.keys()
+        if not missing:
+            return 0
+
+        # First record per username, as in the single-user lookup
+        matches = self.df[self.df['Username'].isin(missing)].drop_duplicates(subset='Username')
+        for _, record in matches.iterrows():
+            self._user_data_cache[record['Username']] = self._build_user_data(record)
+        for username_lower in missing - self._user_data_cache.keys():
+            self._user_data_cache[username_lower] = self._missing_user_data(username_lower)
+        return len(missing)
+
+    def _lookup_user_data(self, username_lower: str) -> Dict[str, Optional[str]]:
+        """Look up HR data for a lowercased username in the HRDB DataFrame."""
         row = self.df[self.df['Username'] == username_lower]
         if not row.empty:
-            record = row.iloc[0]
-            
-            # Helper function to safely convert and handle NaN values
-            def safe_str(value):
-                if pd.isna(value):
-                    return ''
-                str_val = str(value).strip()
-                return '' if str_val in ['nan', 'NaN'] else str_val
-            
-            # Use fallback functions for hierarchy fields
-            return {
-                'general_manager': self._get_group_manager_with_fallback(record),
-                'vp': self._get_vp_with_fallback(record),
-                'title': safe_str(record.get('Title', '')),
-                'department': safe_str(record.get('Department Desc', '')),
-                'manager_name': safe_str(record.get('Manager Name', '')),
-                'director': self._get_director_with_fallback(record),
-                'vp2': safe_str(record.get('VP 2', '')),
-                'c_level': safe_str(record.get('C Level', '')),
-                'worker_id': safe_str(record.get('Worker ID', '')),
-                'full_name': safe_str(record.get('Full Name', ''))
-            }
+            return self._build_user_data(row.iloc[0])
         else:
-            logger.warning("HRDB: No match for username %s", username_lower)
-            return {
-                'general_manager': '',
-                'vp': '',
-                'title': '',
-                'department': '',
-                'manager_name': '',
-                'director': '',
-                'vp2': '',
-                'c_level': '',
-                'worker_id': '',
-                'full_name': ''
-            }
+            return self._missing_user_data(username_lower)
+
+    @staticmethod
+    def _missing_user_data(username_lower: str) -> Dict[str, Optional[str]]:
+        """Log a username without HRDB record and return empty user data for it."""
+        logger.warning("HRDB: No match for username %s", username_lower)
+        return dict.fromkeys(HR_FIELDS, '')
+
+    def _build_user_data(self, record) -> Dict[str, Optional[str]]:
+        """Build the user data dict from an HRDB record."""
+        # Helper function to safely convert and handle NaN values
+        def safe_str(value):
+            if pd.isna(value):
+                return ''
+            str_val = str(value).strip()
+            return '' if str_val in ['nan', 'NaN'] else str_val
+
+        # Use fallback functions for hierarchy fields
+        return {
+            'general_manager': self._get_group_manager_with_fallback(record),
+            'vp': self._get_vp_with_fallback(record),
+            'title': safe_str(record.get('Title', '')),
+            'department': safe_str(record.get('Department Desc', '')),
+            'manager_name': safe_str(record.get('Manager Name', '')),
+            'director': self._get_director_with_fallback(record),
+            'vp2': safe_str(record.get('VP 2', '')),
+            'c_level': safe_str(record.get('C Level', '')),
+            'worker_id': safe_str(record.get('Worker ID', '')),
+            'full_name': safe_str(record.get('Full Name', ''))
+        }
+
+
+# Shared client for the default HRDB file, so all processors share one DataFrame and user data cache
+_DEFAULT_HRDB: Optional[HRDBClient] = None
+
+
+def get_default_hrdb() -> HRDBClient:
+    """
+    Get the shared HRDBClient for the default HRDB file, loading it on first use.
+
+    Returns:
+        HRDBClient: Shared HRDB client
+    """
+    global _DEFAULT_HRDB
+    if _DEFAULT_HRDB is None:
+        _DEFAULT_HRDB = HRDBClient()
+    return _DEFAULT_HRDB
@@ -1,11 +1,33 @@
 
 
+import json
 import logging
 import requests
-from typing import List
+from typing import Iterator, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional - fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional - fall back to buffering the whole AQL response
+    ijson = None
+
+# Errors raised while decoding an AQL response body
+AQL_DECODE_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connection pool shared by all requests of a client (covers parallel AQL batches)
+JFROG_POOL_SIZE = 16
+# Transport-level retries for rate limiting and transient gateway errors
+JFROG_MAX_RETRIES = 3
+JFROG_RETRY_STATUSES = (429, 502, 503, 504)
+
 class JfrogClient:
     """
     Client for JFrog API integration
@@ -26,6 +48,13 @@ class JfrogClient:
             'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json'
         }
+        # Reuse TLS connections across calls instead of opening a new connection per request
+        self.session = requests.Session()
+        retry = Retry(total=JFROG_MAX_RETRIES, backoff_factor=0.2, status_forcelist=JFROG_RETRY_STATUSES,
+                      allowed_methods=frozenset(["GET", "POST"]), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=JFROG_POOL_SIZE, pool_maxsize=JFROG_POOL_SIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         logger.info("JfrogClient initialized with base URL: %s", self.base_url)
     
     def test_connection(self) -> bool:
@@ -37,7 +66,7 @@ class JfrogClient:
         """
         try:
             # Use ping endpoint for connection test (no auth required)
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/xray/api/v1/system/ping",
                 timeout=10
             )
@@ -73,7 +102,7 @@ class JfrogClient:
             params = {'project': project}
             
             # Make the API request
-            response = requests.get(
+            response = self.session.get(
                 url,
                 headers=self.headers,
                 params=params,
@@ -117,7 +146,7 @@ class JfrogClient:
             params = {'project': project}
             
             # Make the API request
-            response = requests.get(
+            response = self.session.get(
                 url,
                 headers=self.headers,
                 params=params,
@@ -141,6 +170,66 @@ class JfrogClient:
             logger.error("Error processing JFrog build metadata: %s", str(e))
             return {}
     
+    def fetch_build_metadata_bulk(self, build_names: List[str], project: str) -> dict:
+        """
+        Fetch build numbers for many builds with a single AQL builds query.
+        Results are returned in the same shape as fetch_build_metadata so callers
+        can use them interchangeably; builds missing from the result should be
+        fetched individually.
+        
+        Args:
+            build_names (List[str]): Names of the builds
+            project (str): Project name
+            
+        Returns:
+            dict: Mapping of build name to metadata ({'buildsNumbers': [{'uri': '/<number>', 'started': ...}]})
+        """
+        try:
+            if not build_names:
+                return {}
+            
+            logger.info("Fetching build metadata for %d builds in project: %s (bulk AQL)", len(build_names), project)
+            
+            # Build $or conditions for each build name (project builds live in '<project>-build-info')
+            criteria = {"repo": f"{project}-build-info", "$or": [{"name": name} for name in build_names]}
+            aql_query = f'builds.find({self._aql_criteria(criteria)}).include("name", "number", "started")'
+            
+            # Build the API endpoint
+            url = f"{self.base_url}/artifactory/api/search/aql"
+            
+            # Make the API request
+            response = self.session.post(
+                url,
+                headers={**self.headers, 'Content-Type': 'text/plain'},
+                data=aql_query,
+                timeout=60
+            )
+            
+            # Check if request was successful
+            if response.status_code == 200:
+                metadata_by_build = {}
+                for result in self._decode_json(response).get('results', []):
+                    build_name = result.get('build.name')
+                    build_number = result.get('build.number')
+                    if not build_name or not build_number:
+                        continue
+                    metadata = metadata_by_build.setdefault(build_name, {'buildsNumbers': []})
+                    metadata['buildsNumbers'].append({
+                        'uri': f"/{build_number}",
+                        'started': result.get('build.started', '')
+                    })
+                logger.info("Successfully fetched bulk build metadata: %d/%d builds found", 
+                           len(metadata_by_build), len(build_names))
+                return metadata_by_build
+            else:
+                logger.error("JFrog API error fetching bulk build metadata: %s - %s", 
+                           response.status_code, response.text)
+                return {}
+                
+        except (requests.RequestException, ValueError) as e:
+            logger.error("Error fetching bulk build metadata for project %s: %s", project, str(e))
+            return {}
+    
     def fetch_build_details(self, build_name: str, build_number: str, project: str) -> dict:
         """
         Fetch detailed build information including properties and metadata
@@ -163,7 +252,7 @@ class JfrogClient:
             params = {'project': project}
             
             # Make the API request
-            response = requests.get(
+            response = self.session.get(
                 url,
                 headers=self.headers,
                 params=params,
@@ -188,6 +277,25 @@ class JfrogClient:
             logger.error("Error processing JFrog build details: %s", str(e))
             return {}
     
+    @staticmethod
+    def _decode_json(response: requests.Response):
+        """Decode a (large) JSON response body, with orjson when available"""
+        return orjson.loads(response.content) if orjson is not None else response.json()
+    
+    @staticmethod
+    def _aql_criteria(criteria: dict) -> str:
+        """
+        Serialize AQL find criteria as compact JSON. Plain values are AQL equality
+        matches (equivalent to $eq), and JSON escaping keeps names with quotes valid.
+        
+        Args:
+            criteria (dict): AQL criteria
+            
+        Returns:
+            str: Compact JSON criteria for an AQL find() call
+        """
+        return json.dumps(criteria, separators=(',', ':'))
+    
     def query_aql_artifacts(self, repo_name: str) -> dict:
         """
         Query artifacts from a single local repository using AQL API.
@@ -200,36 +308,54 @@ class JfrogClient:
             dict: AQL response with artifact data
         """
         try:
-            logger.info("Querying AQL artifacts for repository: %s", repo_name)
+            results = list(self.query_aql_artifacts_iter(repo_name))
+        except (requests.RequestException, *AQL_DECODE_ERRORS) as e:
+            logger.error("Error querying AQL artifacts for %s: %s", repo_name, str(e))
+            return {}
+        logger.info("Successfully queried AQL artifacts for %s: %d results", repo_name, len(results))
+        return {'results': results, 'range': {'start_pos': 0, 'end_pos': len(results), 'total': len(results)}}
+    
+    def query_aql_artifacts_iter(self, repo_name: str) -> Iterator[dict]:
+        """
+        Query artifacts from a single local repository using AQL API, yielding the results one by one.
+        With ijson installed the response body is parsed as it streams in, so the full
+        (multi-megabyte) JSON body is never buffered in memory.
+        
+        Args:
+            repo_name (str): Single local repository name to query
             
-            # Build AQL query for single repository
-            aql_query = f'items.find({{"repo": {{"$eq": "{repo_name}"}}, "type": "file"}}).include("property")'
+        Yields:
+            dict: AQL result entry (artifact with its properties)
             
-            # Build the API endpoint
-            url = f"{self.base_url}/artifactory/api/search/aql"
+        Raises:
+            requests.HTTPError: If the AQL query does not succeed
+        """
+        logger.info("Querying AQL artifacts for repository: %s", repo_name)
+        
+        # Build AQL query for single repository
+        aql_query = f'items.find({self._aql_criteria({"repo": repo_name, "type": "file"})}).include("property")'
+        
+        # Build the API endpoint
+        url = f"{self.base_url}/artifactory/api/search/aql"
+        
+        # Make the API request
+        with self.session.post(
+            url,
+            headers={**self.headers, 'Content-Type': 'text/plain'},
+            data=aql_query,
+            timeout=60,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise requests.HTTPError(f"AQL query failed with status {response.status_code}", response=response)
             
-            # Make the API request
-            response = requests.post(
-                url,
-                headers={**self.headers, 'Content-Type': 'text/plain'},
-                data=aql_query,
-                timeout=60
-            )
+            if ijson is None:
+                yield from self._decode_json(response).get('results', [])
+                return
             
-            # Check if request was successful
-            if response.status_code == 200:
-                data = response.json()
-                logger.info("Successfully queried AQL artifacts for %s: %d results", 
-                           repo_name, len(data.get('results', [])))
-                return data
-            else:
-                logger.error("Failed to query AQL artifacts for %s: %s", 
-                           repo_name, response.status_code)
-                return {}
-                
-        except (requests.RequestException, ValueError) as e:
-            logger.error("Error querying AQL artifacts for %s: %s", repo_name, str(e))
-            return {}
+            # Let urllib3 undo any gzip/deflate content encoding while streaming
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'results.item', use_float=True)
     
     def query_aql_specific_artifacts(self, repo_name: str, artifact_paths: List[tuple]) -> dict:
         """
@@ -251,15 +377,9 @@ class JfrogClient:
             logger.info("Querying AQL for %d specific artifacts in repository: %s", 
                        len(artifact_paths), repo_name)
             
-            # Build $or conditions for each artifact path
-            or_conditions = []
-            for path, name in artifact_paths:
-                or_conditions.append(f'{{"path": {{"$eq": "{path}"}}, "name": {{"$eq": "{name}"}}}}')
-            
-            or_clause = ', '.join(or_conditions)
-            
-            # Build AQL query with $or operator
-            aql_query = f'items.find({{"repo": {{"$eq": "{repo_name}"}}, "$or": [{or_clause}]}}).include("property")'
+            # Build AQL query with an $or condition for each artifact path
+            criteria = {"repo": repo_name, "$or": [{"path": path, "name": name} for path, name in artifact_paths]}
+            aql_query = f'items.find({self._aql_criteria(criteria)}).include("property")'
             
             logger.debug("AQL query: %s", aql_query)
             
@@ -267,7 +387,7 @@ class JfrogClient:
             url = f"{self.base_url}/artifactory/api/search/aql"
             
             # Make the API request
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers={**self.headers, 'Content-Type': 'text/plain'},
                 data=aql_query,
@@ -276,7 +396,7 @@ class JfrogClient:
             
             # Check if request was successful
             if response.status_code == 200:
-                data = response.json()
+                data = self._decode_json(response)
                 logger.info("Successfully queried %d specific artifacts for %s: %d results found", 
                            len(artifact_paths), repo_name, len(data.get('results', [])))
                 return data
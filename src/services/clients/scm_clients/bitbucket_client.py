@@ -1,9 +1,15 @@
 import logging
 import requests
 from typing import List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Transport-level retries for rate-limited (HTTP 429) requests; Retry-After is honoured when present
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_BACKOFF = 1.0
+
 class BitbucketClient:
     """
     Client for Bitbucket Server REST API for repo owner detection.
@@ -15,15 +21,21 @@ class BitbucketClient:
 
     def __init__(self, token: str):
         self.token = token
-        self.headers = {
+        self.session = requests.Session()
+        self.session.headers.update({
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
-        }
+        })
+        retry = Retry(total=RATE_LIMIT_MAX_RETRIES, status_forcelist=[429], backoff_factor=RATE_LIMIT_BACKOFF,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def test_connection(self) -> bool:
         url = f"{self.BASE_URL}/rest/api/1.0/projects?limit=1"
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             if response.status_code == 200:
                 logger.info("Bitbucket API connection test: SUCCESS")
                 return True
@@ -38,7 +50,7 @@ class BitbucketClient:
         url = f"{self.BASE_URL}/rest/api/1.0/projects/{project_key}/repos/{repo_slug}/pull-requests"
         params = {"state": "MERGED", "limit": limit}
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=15)
             if response.status_code != 200:
                 logger.warning(f"Failed to fetch PRs for {project_key}/{repo_slug}: {response.status_code} {response.text}")
                 return []
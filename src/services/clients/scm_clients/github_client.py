@@ -3,15 +3,54 @@ GitHubClient: Handles GitHub API and GraphQL queries for repo owner/reviewer det
 """
 import json as json_lib
 import datetime
+import functools
 import os
 import requests
 import logging
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+from urllib.parse import urlparse, parse_qs
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ChunkedEncodingError, RequestException
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional - fall back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Set this environment variable to dump raw GraphQL queries/responses to GITHUB_DEBUG_DIR for debugging
+GITHUB_DEBUG_DUMP_ENV = "GITHUB_DEBUG_DUMP"
+GITHUB_DEBUG_DIR = "github_api_debug"
+
+# Connection pool size of the shared session (requests defaults to 10 connections)
+GITHUB_POOL_SIZE = 32
+# Transport-level retries for rate limiting and transient gateway errors
+GITHUB_MAX_RETRIES = 3
+GITHUB_RETRY_STATUSES = (429, 502, 503, 504)
+# Statuses the reviewers query retries itself: secondary rate limits (403) and server errors
+GITHUB_GRAPHQL_RETRY_STATUSES = (403, 500)
+# Repository listing: page size and number of pages fetched concurrently
+GITHUB_REPOS_PER_PAGE = 100
+GITHUB_PAGE_WORKERS = 8
+
+@functools.lru_cache(maxsize=None)
+def _build_reviewers_query(batch_size: int) -> str:
+    """
+    Build the parameterized GraphQL query fetching PR reviewers for a batch of repositories.
+    Aliases repo0..repoN-1 query the repositories named by the $name0..$nameN-1 variables.
+    """
+    declarations = ", ".join(["$owner: String!"] + [f"$name{i}: String!" for i in range(batch_size)])
+    query_parts = []
+    for i in range(batch_size):
+        # Fetch PR reviewers (who approved PRs)
+        query_parts.append(f'''repo{i}: repository(owner: $owner, name: $name{i}) {{\n  pullRequests(last: 20, states: MERGED) {{\n    nodes {{\n      reviews(last: 10, states: APPROVED) {{\n        nodes {{\n          author {{\n            login\n          }}\n        }}\n      }}\n    }}\n  }}\n}}''')
+    return f"query({declarations}) {{\n" + "\n".join(query_parts) + "\n}"
+
+
 class GitHubClient:
     def __init__(self, token: str, org: str):
         self.token = token
@@ -23,29 +62,82 @@ class GitHubClient:
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github+json"
         })
+        retry = Retry(total=GITHUB_MAX_RETRIES, backoff_factor=2, status_forcelist=GITHUB_RETRY_STATUSES,
+                      allowed_methods=frozenset(["GET", "POST"]), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=GITHUB_POOL_SIZE, pool_maxsize=GITHUB_POOL_SIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.debug_dump = bool(os.getenv(GITHUB_DEBUG_DUMP_ENV))
+        if self.debug_dump:
+            os.makedirs(GITHUB_DEBUG_DIR, exist_ok=True)
 
     def fetch_repos(self) -> List[Dict]:
         """
-        Fetch all repositories for the organization (paginated REST API)
+        Fetch all repositories for the organization (paginated REST API).
+        The first page's Link header gives the last page number, so the remaining pages are
+        fetched concurrently; without it, pages are walked sequentially.
         """
-        repos = []
+        url = f"{self.api_url}/orgs/{self.org}/repos?page=1&per_page={GITHUB_REPOS_PER_PAGE}"
+        resp = self.session.get(url)
+        if resp.status_code != 200:
+            logger.error("Failed to fetch repos: %s %s", resp.status_code, resp.text)
+            return []
+        repos = resp.json()
+        if not repos:
+            return []
+
+        last_page = self._get_last_page(resp)
+        if last_page is not None:
+            with ThreadPoolExecutor(max_workers=GITHUB_PAGE_WORKERS) as executor:
+                for data in executor.map(self._fetch_repos_page, range(2, last_page + 1)):
+                    if not data:
+                        break
+                    repos.extend(data)
+            return repos
+
+        # No Link header: walk pages until a short page is returned
+        data = repos
         page = 1
-        per_page = 100
-        while True:
-            url = f"{self.api_url}/orgs/{self.org}/repos?page={page}&per_page={per_page}"
-            resp = self.session.get(url)
-            if resp.status_code != 200:
-                logger.error("Failed to fetch repos: %s %s", resp.status_code, resp.text)
-                break
-            data = resp.json()
+        while len(data) == GITHUB_REPOS_PER_PAGE:
+            page += 1
+            data = self._fetch_repos_page(page)
             if not data:
                 break
             repos.extend(data)
-            if len(data) < per_page:
-                break
-            page += 1
         return repos
 
+    def _fetch_repos_page(self, page: int) -> Optional[List[Dict]]:
+        """
+        Fetch a single page of organization repositories
+
+        Args:
+            page: Page number (1-based)
+
+        Returns:
+            Optional[List[Dict]]: Repositories on the page, or None if the request failed
+        """
+        url = f"{self.api_url}/orgs/{self.org}/repos?page={page}&per_page={GITHUB_REPOS_PER_PAGE}"
+        resp = self.session.get(url)
+        if resp.status_code != 200:
+            logger.error("Failed to fetch repos: %s %s", resp.status_code, resp.text)
+            return None
+        return resp.json()
+
+    @staticmethod
+    def _get_last_page(resp) -> Optional[int]:
+        """
+        Get the last page number from the rel="last" link of a paginated response
+
+        Returns:
+            Optional[int]: Last page number, or None if the response has no usable Link header
+        """
+        last_url = resp.links.get("last", {}).get("url")
+        if not last_url:
+            return None
+        page = parse_qs(urlparse(last_url).query).get("page")
+        if not page or not page[0].isdigit():
+            return None
+        return int(page[0])
+
     def fetch_repo_reviewers_batch(self, repo_names: List[str]) -> Dict[str, List[str]]:
         """
         Fetch reviewers (collaborators with push access) for multiple repos using GraphQL
@@ -56,36 +148,31 @@ class GitHubClient:
         
         for attempt in range(max_retries):
             try:
-                # GitHub GraphQL allows batching via aliases
-                query_parts = []
-                for i, repo in enumerate(repo_names):
-                    alias = f"repo{i}"
-                    # Fetch PR reviewers (who approved PRs)
-                    query_parts.append(f'''{alias}: repository(owner: "{self.org}", name: "{repo}") {{\n  pullRequests(last: 20, states: MERGED) {{\n    nodes {{\n      reviews(last: 10, states: APPROVED) {{\n        nodes {{\n          author {{\n            login\n          }}\n        }}\n      }}\n    }}\n  }}\n}}''')
-                graphql_query = "query {\n" + "\n".join(query_parts) + "\n}"
+                # GitHub GraphQL allows batching via aliases; repo names are passed as variables
+                graphql_query = _build_reviewers_query(len(repo_names))
+                variables = {"owner": self.org}
+                variables.update((f"name{i}", repo) for i, repo in enumerate(repo_names))
                 
-                # Make the request with retry logic
-                resp = self.session.post(self.graphql_url, json={"query": graphql_query}, timeout=30)
+                # Rate limiting and gateway errors are retried by the session adapter; this loop
+                # retries what it cannot see (secondary rate limits, server errors, unparsable bodies)
+                resp = self.session.post(self.graphql_url, json={"query": graphql_query, "variables": variables}, timeout=30)
+                
+                if resp.status_code in GITHUB_GRAPHQL_RETRY_STATUSES and attempt < max_retries - 1:
+                    retry_after = resp.headers.get("Retry-After")
+                    delay = int(retry_after) if retry_after and retry_after.isdigit() else base_delay * (2 ** attempt)
+                    logger.warning("GraphQL status %s on attempt %d/%d, retrying in %d seconds",
+                                   resp.status_code, attempt + 1, max_retries, delay)
+                    time.sleep(delay)
+                    continue
                 
                 if resp.status_code != 200:
                     logger.error("GraphQL error: %s %s", resp.status_code, resp.text)
-                    if attempt < max_retries - 1:
-                        time.sleep(base_delay * (2 ** attempt))
-                        continue
                     return {}
                 
                 try:
-                    json_resp = resp.json()
-                    # Save the raw GitHub GraphQL response and query to files for debugging
-                    debug_dir = "github_api_debug"
-                    os.makedirs(debug_dir, exist_ok=True)
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                    debug_file = os.path.join(debug_dir, f"graphql_response_{timestamp}.json")
-                    with open(debug_file, "w", encoding="utf-8") as f:
-                        json_lib.dump(json_resp, f, indent=2)
-                    query_file = os.path.join(debug_dir, f"graphql_query_{timestamp}.txt")
-                    with open(query_file, "w", encoding="utf-8") as f:
-                        f.write(graphql_query)
+                    json_resp = orjson.loads(resp.content) if orjson is not None else resp.json()
+                    if self.debug_dump:
+                        self._dump_debug_files(json_resp, graphql_query)
                 except (ValueError, KeyError) as e:
                     logger.error("Failed to parse GitHub GraphQL response as JSON: %s", str(e))
                     if attempt < max_retries - 1:
@@ -122,4 +209,20 @@ class GitHubClient:
         
         return {}
 
+    def _dump_debug_files(self, json_resp: Dict, graphql_query: str):
+        """
+        Save the raw GitHub GraphQL response (compact JSON) and query to files for debugging
+        """
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        debug_file = os.path.join(GITHUB_DEBUG_DIR, f"graphql_response_{timestamp}.json")
+        if orjson is not None:
+            with open(debug_file, "wb") as f:
+                f.write(orjson.dumps(json_resp))
+        else:
+            with open(debug_file, "w", encoding="utf-8") as f:
+                json_lib.dump(json_resp, f, separators=(',', ':'))
+        query_file = os.path.join(GITHUB_DEBUG_DIR, f"graphql_query_{timestamp}.txt")
+        with open(query_file, "w", encoding="utf-8") as f:
+            f.write(graphql_query)
+
     # Add more methods as needed for other GitHub queries
@@ -1,11 +1,17 @@
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 import os
 GITLAB_BASE_URL = os.environ["GITLAB_BASE_URL"]
 
+# Transport-level retries for rate-limited (HTTP 429) requests; Retry-After is honoured when present
+RATE_LIMIT_MAX_RETRIES = 5
+RATE_LIMIT_BACKOFF = 1.0
+
 class GitLabClient:
     def __init__(self, token: str):
         self.token = token
@@ -14,6 +20,11 @@ class GitLabClient:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json"
         })
+        retry = Retry(total=RATE_LIMIT_MAX_RETRIES, status_forcelist=[429], backoff_factor=RATE_LIMIT_BACKOFF,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def test_connection(self):
         url = f"{GITLAB_BASE_URL}/api/v4/projects"
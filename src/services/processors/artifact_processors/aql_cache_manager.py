@@ -1,21 +1,236 @@
 import os
 import json
+import pickle
+import time
 import logging
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional - fall back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Side-file (next to the per-repo AQL caches) mapping artifact path -> resolved build name
+ARTIFACT_BUILD_NAMES_FILE = "_artifact_build_names.json"
+
+# Side-file persisting build names that could not be mapped to any repository (negative lookups)
+UNMAPPED_BUILD_NAMES_FILE = "_unmapped_build_names.json"
+UNMAPPED_BUILD_NAMES_VERSION = 1
+# Unmapped build names expire so that mapping fixes (new repos / build names) are picked up again
+UNMAPPED_BUILD_NAMES_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Schema version of the binary AQL cache files (bump when the cached layout changes)
+AQL_CACHE_FORMAT_VERSION = 1
+AQL_CACHE_SUFFIX = f".pickle.v{AQL_CACHE_FORMAT_VERSION}"
+# Human-readable cache format for operators (debug): newline-delimited JSON, one compact AQL result per line
+NDJSON_AQL_CACHE_SUFFIX = ".jsonl"
+# Pretty-printed JSON cache format of previous versions, read once for migration
+LEGACY_AQL_CACHE_SUFFIX = ".json"
+
 
 class AqlCacheManager:
     """
     Handles AQL cache management and build info extraction.
     Extracted from Product class to follow service layer pattern.
     """
+
+    @staticmethod
+    def _read_json_file(file_path: str):
+        """
+        Read a JSON cache file (orjson when available, stdlib json otherwise)
+
+        Args:
+            file_path (str): Path to the JSON file
+
+        Returns:
+            Decoded JSON data
+        """
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json_file(file_path: str, data):
+        """
+        Write data to a compact JSON cache file (orjson when available, stdlib json otherwise)
+
+        Args:
+            file_path (str): Path to the JSON file
+            data: JSON-serializable data
+        """
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+            return
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    @staticmethod
+    def load_artifact_build_names(aql_cache_dir: str) -> dict:
+        """
+        Load the artifact path -> build name mapping persisted next to the AQL cache
+
+        Args:
+            aql_cache_dir (str): AQL cache directory
+
+        Returns:
+            dict: Mapping of artifact path to build name (empty if not found/invalid)
+        """
+        mapping_file = os.path.join(aql_cache_dir, ARTIFACT_BUILD_NAMES_FILE)
+        try:
+            if not os.path.exists(mapping_file):
+                return {}
+
+            data = AqlCacheManager._read_json_file(mapping_file)
+            return data if isinstance(data, dict) else {}
+
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load artifact build names from %s: %s", mapping_file, str(e))
+            return {}
+
+    @staticmethod
+    def save_artifact_build_names(aql_cache_dir: str, artifact_build_names: dict) -> bool:
+        """
+        Persist the artifact path -> build name mapping next to the AQL cache
+
+        Args:
+            aql_cache_dir (str): AQL cache directory
+            artifact_build_names (dict): Mapping of artifact path to build name
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        mapping_file = os.path.join(aql_cache_dir, ARTIFACT_BUILD_NAMES_FILE)
+        try:
+            os.makedirs(aql_cache_dir, exist_ok=True)
+
+            AqlCacheManager._write_json_file(mapping_file, artifact_build_names)
+            return True
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to save artifact build names to %s: %s", mapping_file, str(e))
+            return False
+
+    @staticmethod
+    def _load_unmapped_build_names_entries(aql_cache_dir: str) -> dict:
+        """Load non-expired unmapped build name entries (build name -> first seen timestamp)"""
+        unmapped_file = os.path.join(aql_cache_dir, UNMAPPED_BUILD_NAMES_FILE)
+        try:
+            if not os.path.exists(unmapped_file):
+                return {}
+
+            data = AqlCacheManager._read_json_file(unmapped_file)
+            if not isinstance(data, dict) or data.get('version') != UNMAPPED_BUILD_NAMES_VERSION:
+                return {}
+
+            expiry = time.time() - UNMAPPED_BUILD_NAMES_TTL_SECONDS
+            return {name: seen_at for name, seen_at in data.get('build_names', {}).items() if seen_at >= expiry}
+
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning("Failed to load unmapped build names from %s: %s", unmapped_file, str(e))
+            return {}
+
+    @staticmethod
+    def load_unmapped_build_names(aql_cache_dir: str) -> set:
+        """
+        Load build names persisted as unmapped by previous runs (expired entries are dropped)
+
+        Args:
+            aql_cache_dir (str): AQL cache directory
+
+        Returns:
+            set: Build names known to be unmapped
+        """
+        return set(AqlCacheManager._load_unmapped_build_names_entries(aql_cache_dir))
+
+    @staticmethod
+    def save_unmapped_build_names(aql_cache_dir: str, unmapped_build_names: set) -> bool:
+        """
+        Persist unmapped build names next to the AQL cache, keeping the first seen
+        timestamp of names that were already persisted so that they still expire
+
+        Args:
+            aql_cache_dir (str): AQL cache directory
+            unmapped_build_names (set): Build names known to be unmapped
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        unmapped_file = os.path.join(aql_cache_dir, UNMAPPED_BUILD_NAMES_FILE)
+        existing_entries = AqlCacheManager._load_unmapped_build_names_entries(aql_cache_dir)
+        now = time.time()
+        data = {
+            'version': UNMAPPED_BUILD_NAMES_VERSION,
+            'build_names': {name: existing_entries.get(name, now) for name in unmapped_build_names if name}
+        }
+        try:
+            os.makedirs(aql_cache_dir, exist_ok=True)
+
+            AqlCacheManager._write_json_file(unmapped_file, data)
+            return True
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to save unmapped build names to %s: %s", unmapped_file, str(e))
+            return False
+
+    @staticmethod
+    def get_aql_cache_path(aql_cache_dir: str, repo_name: str, debug: bool = False) -> str:
+        """
+        Get the AQL cache file path for a repository
+        
+        Args:
+            aql_cache_dir (str): AQL cache directory
+            repo_name (str): JFrog repository name
+            debug (bool): Use the human-readable NDJSON format instead of the versioned binary one
+            
+        Returns:
+            str: Path to the repository's AQL cache file
+        """
+        suffix = NDJSON_AQL_CACHE_SUFFIX if debug else AQL_CACHE_SUFFIX
+        return os.path.join(aql_cache_dir, f"{repo_name}{suffix}")
+    
+    @staticmethod
+    def _get_cache_base_path(cache_file_path: str) -> str:
+        """Strip the cache format suffix from an AQL cache file path"""
+        for suffix in (AQL_CACHE_SUFFIX, NDJSON_AQL_CACHE_SUFFIX, LEGACY_AQL_CACHE_SUFFIX):
+            if cache_file_path.endswith(suffix):
+                return cache_file_path[:-len(suffix)]
+        return cache_file_path
+    
+    @staticmethod
+    def aql_cache_exists(cache_file_path: str) -> bool:
+        """Check whether an AQL cache exists, including a legacy JSON cache awaiting migration"""
+        legacy_file_path = AqlCacheManager._get_cache_base_path(cache_file_path) + LEGACY_AQL_CACHE_SUFFIX
+        return os.path.exists(cache_file_path) or os.path.exists(legacy_file_path)
+    
+    @staticmethod
+    def _read_ndjson_cache(cache_file_path: str) -> dict:
+        """Read an NDJSON AQL cache (one AQL result per line) into AQL response data"""
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(cache_file_path, 'rb') as f:
+            results = [loads(line) for line in f if line.strip()]
+        return {'results': results, 'range': {'start_pos': 0, 'end_pos': len(results), 'total': len(results)}}
+    
+    @staticmethod
+    def _write_ndjson_cache(cache_file_path: str, aql_data: dict):
+        """Write AQL response data as an NDJSON AQL cache (one compact AQL result per line)"""
+        if orjson is not None:
+            lines = [orjson.dumps(result) for result in aql_data.get('results', [])]
+        else:
+            lines = [json.dumps(result, separators=(',', ':')).encode('utf-8') for result in aql_data.get('results', [])]
+        with open(cache_file_path, 'wb') as f:
+            for line in lines:
+                f.write(line)
+                f.write(b'\n')
     
     @staticmethod
     def load_aql_cache(cache_file_path: str) -> Optional[dict]:
         """
-        Load AQL cache from file
+        Load AQL cache from file.
+        Missing binary/NDJSON caches fall back to the legacy JSON cache, which is
+        converted to the requested format on first read.
         
         Args:
             cache_file_path (str): Path to cache file
@@ -24,13 +239,33 @@ class AqlCacheManager:
             Optional[dict]: AQL data or None if not found/invalid
         """
         try:
-            if not os.path.exists(cache_file_path):
+            if cache_file_path.endswith(LEGACY_AQL_CACHE_SUFFIX):
+                if not os.path.exists(cache_file_path):
+                    return None
+                return AqlCacheManager._read_json_file(cache_file_path)
+            
+            if cache_file_path.endswith(NDJSON_AQL_CACHE_SUFFIX) and os.path.exists(cache_file_path):
+                return AqlCacheManager._read_ndjson_cache(cache_file_path)
+            
+            if os.path.exists(cache_file_path):
+                with open(cache_file_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if not isinstance(cached, dict) or cached.get('version') != AQL_CACHE_FORMAT_VERSION:
+                    logger.warning("Ignoring AQL cache %s with unsupported format version", cache_file_path)
+                    return None
+                return cached.get('data')
+            
+            legacy_file_path = AqlCacheManager._get_cache_base_path(cache_file_path) + LEGACY_AQL_CACHE_SUFFIX
+            if not os.path.exists(legacy_file_path):
                 return None
             
-            with open(cache_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            aql_data = AqlCacheManager._read_json_file(legacy_file_path)
+            if AqlCacheManager.save_aql_cache(cache_file_path, aql_data):
+                os.remove(legacy_file_path)
+                logger.info("💾 Converted legacy AQL cache %s to %s", legacy_file_path, cache_file_path)
+            return aql_data
                 
-        except (OSError, ValueError, KeyError) as e:
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError, EOFError) as e:
             logger.warning("Failed to load AQL cache from %s: %s", cache_file_path, str(e))
             return None
     
@@ -51,43 +286,127 @@ class AqlCacheManager:
             results = aql_data.get('results', [])
             for result in results:
                 if result.get('path') == path and result.get('name') == name:
-                    build_name = None
-                    build_number = None
-                    build_timestamp = None
-                    sha256 = None
-                    properties = result.get('properties', [])
-                    for prop in properties:
-                        if prop.get('key') == 'build.name':
-                            build_name_value = prop.get('value')
-                            if build_name_value:
-                                if '/' in build_name_value:
-                                    parts = build_name_value.split('/')
-                                    if len(parts) >= 2:
-                                        build_name = parts[1]
-                                    else:
-                                        build_name = parts[0]
-                                else:
-                                    build_name = build_name_value
-                        elif prop.get('key') == 'build.number':
-                            build_number = prop.get('value')
-                        elif prop.get('key') == 'build.timestamp':
-                            build_timestamp = prop.get('value')
-                        elif prop.get('key') == 'sha256':
-                            sha256 = prop.get('value')
-                    return build_name, build_number, build_timestamp, sha256
+                    return AqlCacheManager._extract_build_info_from_result(result)
             return None
         except (ValueError, KeyError, IndexError) as e:
             logger.debug("Error extracting build info in AQL data: %s", str(e))
             return None
     
     @staticmethod
-    def save_aql_cache(cache_file_path: str, aql_data: dict) -> bool:
+    def _extract_build_info_from_result(result: dict) -> tuple:
         """
-        Save AQL data to cache file
+        Extract build info (name, number, timestamp, sha256) from a single AQL result entry
+        
+        Args:
+            result (dict): AQL result entry with properties
+            
+        Returns:
+            tuple: (build_name, build_number, build_timestamp, sha256)
+        """
+        build_name = None
+        build_number = None
+        build_timestamp = None
+        sha256 = None
+        properties = result.get('properties', [])
+        for prop in properties:
+            if prop.get('key') == 'build.name':
+                build_name_value = prop.get('value')
+                if build_name_value:
+                    if '/' in build_name_value:
+                        parts = build_name_value.split('/')
+                        if len(parts) >= 2:
+                            build_name = parts[1]
+                        else:
+                            build_name = parts[0]
+                    else:
+                        build_name = build_name_value
+            elif prop.get('key') == 'build.number':
+                build_number = prop.get('value')
+            elif prop.get('key') == 'build.timestamp':
+                build_timestamp = prop.get('value')
+            elif prop.get('key') == 'sha256':
+                sha256 = prop.get('value')
+        return build_name, build_number, build_timestamp, sha256
+    
+    @staticmethod
+    def aql_index_key(path: str, name: str) -> str:
+        """Build the AQL index key for an artifact ('|' delimited path and name)"""
+        return f"{path}|{name}"
+    
+    @staticmethod
+    def build_aql_index(aql_data: dict) -> dict:
+        """
+        Build an index of AQL results keyed by artifact path and name
+        
+        Args:
+            aql_data (dict): AQL response data
+            
+        Returns:
+            dict: Mapping of 'path|name' to (build_name, build_number, build_timestamp, sha256)
+        """
+        aql_index = {}
+        for result in aql_data.get('results', []):
+            key = AqlCacheManager.aql_index_key(result.get('path'), result.get('name'))
+            # Keep the first entry for duplicated artifacts, matching the linear lookup
+            if key not in aql_index:
+                aql_index[key] = AqlCacheManager._extract_build_info_from_result(result)
+        return aql_index
+    
+    @staticmethod
+    def get_aql_index_path(cache_file_path: str) -> str:
+        """Get the index sidecar path for an AQL cache file ('<repo>.json' -> '<repo>.idx.json')"""
+        return AqlCacheManager._get_cache_base_path(cache_file_path) + ".idx.json"
+    
+    @staticmethod
+    def save_aql_index(cache_file_path: str, aql_index: dict) -> bool:
+        """
+        Save AQL index sidecar next to the AQL cache file
+        
+        Args:
+            cache_file_path (str): Path to the AQL cache file
+            aql_index (dict): Index built by build_aql_index
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        index_file_path = AqlCacheManager.get_aql_index_path(cache_file_path)
+        try:
+            AqlCacheManager._write_json_file(index_file_path, aql_index)
+            return True
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to save AQL index to %s: %s", index_file_path, str(e))
+            return False
+    
+    @staticmethod
+    def load_aql_index(cache_file_path: str) -> Optional[dict]:
+        """
+        Load AQL index sidecar for an AQL cache file
+        
+        Args:
+            cache_file_path (str): Path to the AQL cache file
+            
+        Returns:
+            Optional[dict]: Mapping of 'path|name' to build info, or None if the sidecar is missing/invalid
+        """
+        index_file_path = AqlCacheManager.get_aql_index_path(cache_file_path)
+        try:
+            if os.path.exists(index_file_path):
+                aql_index = AqlCacheManager._read_json_file(index_file_path)
+                if isinstance(aql_index, dict):
+                    return aql_index
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load AQL index from %s: %s", index_file_path, str(e))
+        return None
+    
+    @staticmethod
+    def save_aql_cache(cache_file_path: str, aql_data: dict, aql_index: Optional[dict] = None) -> bool:
+        """
+        Save AQL data to cache file and refresh its index sidecar
         
         Args:
             cache_file_path (str): Path to cache file
             aql_data (dict): AQL response data to cache
+            aql_index (Optional[dict]): Prebuilt index for aql_data (built if not provided)
             
         Returns:
             bool: True if successful, False otherwise
@@ -96,10 +415,20 @@ class AqlCacheManager:
             # Ensure directory exists
             os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
             
-            with open(cache_file_path, 'w', encoding='utf-8') as f:
-                json.dump(aql_data, f, indent=2)
+            if cache_file_path.endswith(NDJSON_AQL_CACHE_SUFFIX):
+                AqlCacheManager._write_ndjson_cache(cache_file_path, aql_data)
+            elif cache_file_path.endswith(LEGACY_AQL_CACHE_SUFFIX):
+                AqlCacheManager._write_json_file(cache_file_path, aql_data)
+            else:
+                with open(cache_file_path, 'wb') as f:
+                    pickle.dump({'version': AQL_CACHE_FORMAT_VERSION, 'data': aql_data}, f,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+            
+            if aql_index is None:
+                aql_index = AqlCacheManager.build_aql_index(aql_data)
+            AqlCacheManager.save_aql_index(cache_file_path, aql_index)
             return True
-        except (OSError, ValueError) as e:
+        except (OSError, ValueError, pickle.PicklingError) as e:
             logger.warning("Failed to save AQL cache to %s: %s", cache_file_path, str(e))
             return False
     
@@ -118,20 +447,17 @@ class AqlCacheManager:
         existing_results = existing_cache.get('results', [])
         new_results = new_cache.get('results', [])
         
-        # Create a set of existing artifacts for deduplication (path + name combination)
-        existing_artifacts = set()
-        for result in existing_results:
-            key = (result.get('path', ''), result.get('name', ''))
-            existing_artifacts.add(key)
+        # Existing artifacts for deduplication (path + name combination)
+        existing_artifacts = {(result.get('path', ''), result.get('name', '')) for result in existing_results}
         
-        # Add new results that don't already exist
-        added_count = 0
+        # New results keyed by artifact, keeping the first occurrence and skipping existing artifacts
+        added_results = {}
         for new_result in new_results:
             key = (new_result.get('path', ''), new_result.get('name', ''))
             if key not in existing_artifacts:
-                existing_results.append(new_result)
-                existing_artifacts.add(key)
-                added_count += 1
+                added_results.setdefault(key, new_result)
+        existing_results.extend(added_results.values())
+        added_count = len(added_results)
         
         # Return merged cache
         return {
@@ -1,11 +1,17 @@
 import os
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from .artifact_parser import ArtifactParser
 from .aql_cache_manager import AqlCacheManager
 from .deployed_artifact_processor import DeployedArtifactProcessor
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (path, name) pairs sent in a single specific-artifact AQL query
+# (small $or clauses keep the AQL planner fast; batches run in parallel)
+AQL_SPECIFIC_BATCH_SIZE = 50
+
 
 class ArtifactCoordinator:
     """
@@ -13,17 +19,23 @@ class ArtifactCoordinator:
     Extracted from Product class to follow service layer pattern.
     """
     
-    def __init__(self, product_name: str):
+    def __init__(self, product_name: str, max_workers: int = 4, debug: bool = False):
         """
         Initialize artifact coordinator.
         
         Args:
             product_name: Name of the product
+            max_workers: Maximum number of concurrent AQL queries per repository
+            debug: Keep AQL caches in human-readable NDJSON instead of the binary format
         """
         self.product_name = product_name
+        self.max_workers = max_workers
+        self.debug = debug
         self.parser = ArtifactParser()
         self.cache_manager = AqlCacheManager()
         self.artifact_processor = DeployedArtifactProcessor()
+        # artifact path -> build name, persisted next to the AQL cache across runs
+        self.artifact_path_to_build_name_cache = {}
     
     def fetch_missing_artifacts_from_aql(self, missing_artifacts_by_repo: dict, jfrog_client,
                                        aql_cache_dir: str, build_name_to_repo_map: dict,
@@ -32,103 +44,147 @@ class ArtifactCoordinator:
         """
         Fetch missing artifacts from AQL API and update cache using optimized approach.
         Uses specific artifact queries when cache exists, full refresh when cache is missing.
+        Artifacts whose previously resolved build name is known to be unmapped are skipped
+        before AQL extraction. Unmapped build names are persisted across runs (with a TTL)
+        in the AQL cache directory.
         """
+        if not self.artifact_path_to_build_name_cache:
+            self.artifact_path_to_build_name_cache = self.cache_manager.load_artifact_build_names(aql_cache_dir)
+        build_name_cache = self.artifact_path_to_build_name_cache
+        # Seed negative lookups from previous runs, except build names that are mapped now
+        persisted_unmapped = self.cache_manager.load_unmapped_build_names(aql_cache_dir)
+        unmapped_build_names.update(persisted_unmapped.difference(build_name_to_repo_map))
+        # Resolve the debug level once instead of per artifact in the processing loop
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # Drop artifacts whose cached build name is known to be unmapped, and repositories left empty,
+        # so that their AQL queries are never issued
+        candidate_artifacts_by_repo = {}
+        skipped_count = 0
         for repo_name, missing_paths in missing_artifacts_by_repo.items():
-            try:
-                cache_file = os.path.join(aql_cache_dir, f"{repo_name}.json")
-                cache_exists = os.path.exists(cache_file)
+            candidate_paths = [p for p in missing_paths
+                               if (name := build_name_cache.get(p)) is None or name not in unmapped_build_names]
+            skipped_count += len(missing_paths) - len(candidate_paths)
+            if candidate_paths:
+                candidate_artifacts_by_repo[repo_name] = candidate_paths
+
+        if skipped_count:
+            logger.info("⏭️ Skipped %d artifacts with known unmapped build names (%d/%d repositories left to query)",
+                       skipped_count, len(candidate_artifacts_by_repo), len(missing_artifacts_by_repo))
+
+        try:
+            for repo_name, missing_paths in candidate_artifacts_by_repo.items():
+                try:
+                    cache_file = self.cache_manager.get_aql_cache_path(aql_cache_dir, repo_name, self.debug)
+                    cache_exists = self.cache_manager.aql_cache_exists(cache_file)
+                    aql_index = None
                 
-                logger.info("🔍 Processing repository '%s' (%d artifacts need processing)", 
-                           repo_name, len(missing_paths))
+                    logger.info("🔍 Processing repository '%s' (%d artifacts need processing)", 
+                               repo_name, len(missing_paths))
 
-                if not cache_exists:
-                    # No cache exists - do full repository query
-                    logger.info("No cache found for repository '%s', performing full repository query", repo_name)
-                    aql_response = jfrog_client.query_aql_artifacts(repo_name)
-                    
-                    if not aql_response or not aql_response.get('results'):
-                        logger.warning("No AQL data returned for repository '%s'", repo_name)
-                        continue
-
-                    # Cache the AQL response (create new cache)
-                    if self.cache_manager.save_aql_cache(cache_file, aql_response):
-                        logger.info("💾 Created AQL cache for repository '%s' (%d artifacts in cache)", 
-                                   repo_name, len(aql_response.get('results', [])))
-                        
-                else:
-                    # Cache exists - use optimized specific artifact query
-                    logger.info("Cache exists for repository '%s', using optimized specific artifact query", repo_name)
-                    
-                    # Parse missing paths into (path, name) tuples
-                    artifact_paths = []
+                    # Parse missing paths once into (missing_path, path, name) tuples
+                    parsed_paths = []
                     for missing_path in missing_paths:
-                        path_parts = missing_path.split('/')
+                        path_parts = missing_path.split('/', 1)
                         if len(path_parts) < 2:
                             continue
-                        name = path_parts[-1]
-                        path = '/'.join(path_parts[1:-1]) if len(path_parts) > 2 else ""
-                        artifact_paths.append((path, name))
-                    
-                    if not artifact_paths:
-                        logger.warning("No valid artifact paths found for repository '%s'", repo_name)
-                        continue
-                    
-                    # Query only specific missing artifacts
-                    specific_aql_response = jfrog_client.query_aql_specific_artifacts(repo_name, artifact_paths)
-                    
-                    if not specific_aql_response or not specific_aql_response.get('results'):
-                        logger.warning("No specific AQL data returned for repository '%s'", repo_name)
-                        continue
-                    
-                    # Load existing cache
-                    existing_cache = self.cache_manager.load_aql_cache(cache_file)
-                    if not existing_cache:
-                        logger.warning("Failed to load existing cache for repository '%s'", repo_name)
-                        # Fallback to full query if cache is corrupted
-                        logger.info("Falling back to full repository query due to cache corruption")
+                        path, _, name = path_parts[1].rpartition('/')
+                        parsed_paths.append((missing_path, path, name))
+
+                    if not cache_exists:
+                        # No cache exists - do full repository query
+                        logger.info("No cache found for repository '%s', performing full repository query", repo_name)
                         aql_response = jfrog_client.query_aql_artifacts(repo_name)
+                    
                         if not aql_response or not aql_response.get('results'):
                             logger.warning("No AQL data returned for repository '%s'", repo_name)
                             continue
-                        # Use the fallback response directly
+
+                        # Cache the AQL response (create new cache) along with its index
+                        aql_index = self.cache_manager.build_aql_index(aql_response)
+                        if self.cache_manager.save_aql_cache(cache_file, aql_response, aql_index):
+                            logger.info("💾 Created AQL cache for repository '%s' (%d artifacts in cache)", 
+                                       repo_name, len(aql_response.get('results', [])))
+                        
                     else:
-                        # Merge new results with existing cache
-                        merged_cache = self.cache_manager.merge_aql_caches(existing_cache, specific_aql_response)
-                        added_count = merged_cache.pop('added_count', 0)
+                        # Cache exists - use optimized specific artifact query
+                        logger.info("Cache exists for repository '%s', using optimized specific artifact query", repo_name)
+                    
+                        artifact_paths = [(path, name) for _, path, name in parsed_paths]
+                        if not artifact_paths:
+                            logger.warning("No valid artifact paths found for repository '%s'", repo_name)
+                            continue
+                    
+                        # Query only specific missing artifacts
+                        specific_aql_response = self._query_specific_artifacts_batched(jfrog_client, repo_name, artifact_paths)
+                    
+                        if not specific_aql_response or not specific_aql_response.get('results'):
+                            logger.warning("No specific AQL data returned for repository '%s'", repo_name)
+                            continue
+                    
+                        # Load existing cache
+                        existing_cache = self.cache_manager.load_aql_cache(cache_file)
+                        if not existing_cache:
+                            logger.warning("Failed to load existing cache for repository '%s'", repo_name)
+                            # Fallback to full query if cache is corrupted
+                            logger.info("Falling back to full repository query due to cache corruption")
+                            aql_response = jfrog_client.query_aql_artifacts(repo_name)
+                            if not aql_response or not aql_response.get('results'):
+                                logger.warning("No AQL data returned for repository '%s'", repo_name)
+                                continue
+                            # Use the fallback response directly
+                        else:
+                            # Merge new results with existing cache
+                            merged_cache = self.cache_manager.merge_aql_caches(existing_cache, specific_aql_response)
+                            added_count = merged_cache.pop('added_count', 0)
                         
-                        # Save updated cache
-                        if self.cache_manager.save_aql_cache(cache_file, merged_cache):
-                            logger.info("💾 Updated AQL cache for repository '%s' (added %d new artifacts, total: %d)", 
-                                       repo_name, added_count, len(merged_cache.get('results', [])))
+                            # Extend the persisted index with the newly fetched artifacts instead of rebuilding it;
+                            # without a sidecar, index the cache already in memory
+                            aql_index = self.cache_manager.load_aql_index(cache_file)
+                            if aql_index is None:
+                                aql_index = self.cache_manager.build_aql_index(existing_cache)
+                            for key, build_info in self.cache_manager.build_aql_index(specific_aql_response).items():
+                                aql_index.setdefault(key, build_info)
                         
-                        # Use merged cache for processing
-                        aql_response = merged_cache
-
-                # Process missing artifacts with the new AQL data
-                processed_count = 0
-                matched_count = 0
-
-                for artifact_path in missing_paths:
-                    processed_count += 1
-                    try:
-                        # Parse the artifact path
-                        path_parts = artifact_path.split('/')
-                        if len(path_parts) < 2:
-                            continue
+                            # Save updated cache
+                            if self.cache_manager.save_aql_cache(cache_file, merged_cache, aql_index):
+                                logger.info("💾 Updated AQL cache for repository '%s' (added %d new artifacts, total: %d)", 
+                                           repo_name, added_count, len(merged_cache.get('results', [])))
+                        
+                            # Use merged cache for processing
+                            aql_response = merged_cache
 
-                        name = path_parts[-1]
-                        path = '/'.join(path_parts[1:-1]) if len(path_parts) > 2 else ""
+                    if aql_index is None:
+                        aql_index = self.cache_manager.build_aql_index(aql_response)
 
-                        # Find build name in AQL data
-                        build_info = self.cache_manager.extract_artifact_build_info_from_aql(aql_response, path, name)
+                    # Process missing artifacts with the new AQL data
+                    processed_count = 0
+                    matched_count = 0
+                    repo_artifacts = defaultdict(list)
+
+                    for artifact_path, path, name in parsed_paths:
+                        processed_count += 1
+
+                        # Skip artifacts whose cached build name is already known to be unmapped
+                        cached_build_name = build_name_cache.get(artifact_path)
+                        if cached_build_name is not None and cached_build_name in unmapped_build_names:
+                            continue
+
+                        # Find build name in AQL index
+                        build_info = aql_index.get(self.cache_manager.aql_index_key(path, name))
 
                         if not build_info:
-                            logger.debug("No build name found for artifact: %s", artifact_path)
+                            if debug_enabled:
+                                logger.debug("No build name found for artifact: %s", artifact_path)
                             continue
 
+                        if build_info[0]:
+                            build_name_cache[artifact_path] = build_info[0]
+
                         # Skip if build name is already known to be unmapped
                         if build_info[0] in unmapped_build_names:
-                            logger.debug("Skipping build name '%s' as it is already known to be unmapped", build_info[0])
+                            if debug_enabled:
+                                logger.debug("Skipping build name '%s' as it is already known to be unmapped", build_info[0])
                             continue
 
                         # Match build name to repository
@@ -147,11 +203,14 @@ class ArtifactCoordinator:
                                 break
 
                         if not original_artifact_key:
-                            logger.debug("Original artifact key not found for path: %s", artifact_path)
+                            if debug_enabled:
+                                logger.debug("Original artifact key not found for path: %s", artifact_path)
                             continue
 
                         # Get vulnerability data
-                        vuln_data = jfrog_vulnerabilities[original_artifact_key]
+                        vuln_data = jfrog_vulnerabilities.get(original_artifact_key)
+                        if vuln_data is None:
+                            continue
                         vulnerabilities = vuln_data.get('vulnerabilities', {})
                         updated_at = vuln_data.get('updated_at')
 
@@ -161,23 +220,56 @@ class ArtifactCoordinator:
                             updated_at, build_info[0], artifact_path
                         )
 
-                        # Add to artifacts by repo
-                        if repo not in artifacts_by_repo:
-                            artifacts_by_repo[repo] = []
-                        artifacts_by_repo[repo].append(deployed_artifact)
+                        repo_artifacts[repo].append(deployed_artifact)
 
                         matched_count += 1
-                        logger.debug("✅ Processed missing artifact '%s' for repo '%s'", 
-                                   original_artifact_key, repo)
+                        if debug_enabled:
+                            logger.debug("✅ Processed missing artifact '%s' for repo '%s'", 
+                                       original_artifact_key, repo)
+
+                    # Add to artifacts by repo
+                    for repo, items in repo_artifacts.items():
+                        artifacts_by_repo.setdefault(repo, []).extend(items)
 
-                    except (ValueError, KeyError) as e:
-                        logger.error("❌ Error processing missing artifact '%s': %s", artifact_path, str(e))
-                        continue
+                    # Log summary for this repository
+                    logger.info("📊 Repository '%s' cache refresh: %d/%d artifacts successfully processed", 
+                               repo_name, matched_count, processed_count)
 
-                # Log summary for this repository
-                logger.info("📊 Repository '%s' cache refresh: %d/%d artifacts successfully processed", 
-                           repo_name, matched_count, processed_count)
+                except (ValueError, KeyError, OSError) as e:
+                    logger.error("❌ Error fetching AQL data for repository '%s': %s", repo_name, str(e))
+                    continue
+        finally:
+            # Persist lookups (including negative ones) even if processing was interrupted
+            self.cache_manager.save_artifact_build_names(aql_cache_dir, build_name_cache)
+            self.cache_manager.save_unmapped_build_names(aql_cache_dir, unmapped_build_names)
 
-            except (ValueError, KeyError, OSError) as e:
-                logger.error("❌ Error fetching AQL data for repository '%s': %s", repo_name, str(e))
-                continue
+    def _query_specific_artifacts_batched(self, jfrog_client, repo_name: str, artifact_paths: list) -> dict:
+        """
+        Query specific artifacts in bounded batches, issuing the batches in parallel.
+        
+        Args:
+            jfrog_client: JfrogClient instance
+            repo_name: Repository name to query
+            artifact_paths: List of (path, name) tuples
+            
+        Returns:
+            dict: AQL response with the merged results of all batches
+        """
+        batches = [artifact_paths[i:i + AQL_SPECIFIC_BATCH_SIZE]
+                   for i in range(0, len(artifact_paths), AQL_SPECIFIC_BATCH_SIZE)]
+        if len(batches) == 1:
+            return jfrog_client.query_aql_specific_artifacts(repo_name, batches[0])
+        
+        logger.info("Splitting %d specific artifacts for repository '%s' into %d AQL batches", 
+                   len(artifact_paths), repo_name, len(batches))
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+            futures = [executor.submit(jfrog_client.query_aql_specific_artifacts, repo_name, batch)
+                       for batch in batches]
+            for future in futures:
+                response = future.result()
+                if response:
+                    results.extend(response.get('results', []))
+        
+        return {'results': results} if results else {}
@@ -3,6 +3,9 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Repository name suffixes of local (as opposed to remote/virtual) Artifactory repositories
+LOCAL_REPO_SUFFIXES = ('-local',)
+
 
 class ArtifactParser:
     """
@@ -21,31 +24,18 @@ class ArtifactParser:
         Returns:
             Optional[tuple]: (repo_name, path, name, full_path) or None if malformed
         """
-        try:
-            # Split by '/' to get components
-            parts = artifact_key.split('/')
-            
-            if len(parts) < 2:
-                return None
-            
-            repo_name = parts[0]  # First part is repo name
-            name = parts[-1]      # Last part is artifact name
-            
-            # Path is everything between repo and name (without leading/trailing slashes)
-            if len(parts) > 2:
-                path = '/'.join(parts[1:-1])
-            else:
-                path = ""
-            
-            return repo_name, path, name, artifact_key
-            
-        except (ValueError, IndexError):
+        # First segment is the repo name, last segment is the artifact name and the path is
+        # everything in between (without leading/trailing slashes)
+        repo_name, sep, rest = artifact_key.partition('/')
+        if not sep:
             return None
+        path, _, name = rest.rpartition('/')
+        return repo_name, path, name, artifact_key
     
     @staticmethod
     def is_local_repo(repo_name: str) -> bool:
         """
-        Check if repository is local (contains "local" after last '-')
+        Check if repository is local (name ends with a local suffix, e.g. '-local')
         
         Args:
             repo_name (str): Repository name
@@ -53,18 +43,7 @@ class ArtifactParser:
         Returns:
             bool: True if local repository
         """
-        try:
-            # Find the last '-' in the repo name
-            last_dash_index = repo_name.rfind('-')
-            if last_dash_index == -1:
-                return False
-            
-            # Check if everything after the last '-' contains "local"
-            suffix = repo_name[last_dash_index + 1:]
-            return 'local' in suffix
-            
-        except (ValueError, IndexError):
-            return False
+        return repo_name.endswith(LOCAL_REPO_SUFFIXES)
     
     @staticmethod
     def match_build_name_to_repo(build_name: str, repo_build_names_map: dict) -> Optional[str]:
@@ -88,3 +67,20 @@ class ArtifactParser:
         except (ValueError, KeyError) as e:
             logger.debug("Error matching build name '%s' to repository: %s", build_name, str(e))
             return None
+    
+    @staticmethod
+    def invert_build_names_map(repo_build_names_map: dict) -> dict:
+        """
+        Invert a repository to build names mapping for constant-time build name matching
+        
+        Args:
+            repo_build_names_map (dict): Repository to build names mapping
+            
+        Returns:
+            dict: Build name to repository mapping (the first repository wins, as in match_build_name_to_repo)
+        """
+        build_name_to_repo = {}
+        for repo_name, build_names_set in repo_build_names_map.items():
+            for build_name in build_names_set:
+                build_name_to_repo.setdefault(build_name, repo_name)
+        return build_name_to_repo
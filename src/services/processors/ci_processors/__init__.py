@@ -1,8 +1,10 @@
+from .build_details_cache import BuildDetailsCache
 from .jfrog_ci_processor import JfrogCiProcessor
 from .sonar_ci_processor import SonarCiProcessor
 from .ci_coordinator import CiCoordinator
 
 __all__ = [
+    'BuildDetailsCache',
     'JfrogCiProcessor',
     'SonarCiProcessor', 
     'CiCoordinator'
@@ -0,0 +1,143 @@
+import os
+import json
+import fnmatch
+import sqlite3
+import logging
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # optional - fall back to the stdlib json module
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Single SQLite file (per JFrog project cache directory) holding the cached build details
+BUILD_DETAILS_DB_FILE = "builds.sqlite"
+# Schema version stored in PRAGMA user_version; databases below 1 still have legacy JSON caches to remove
+BUILD_DETAILS_DB_VERSION = 1
+# Per-build details files of the previous cache layout (<project cache dir>/<build name>/details_<timestamp>.json)
+LEGACY_DETAILS_FILE_PATTERN = "details_*.json"
+# Subdirectory of the project cache directory holding the AQL caches (never part of the legacy layout)
+AQL_CACHE_SUBDIR = "cache_repo_responses"
+
+
+class BuildDetailsCache:
+    """
+    Caches JFrog build details in a single SQLite database keyed by (build name, lastStarted).
+    Replaces the per-build directories of timestamped details JSON files.
+    """
+
+    def __init__(self, product_cache_dir: str):
+        """
+        Open (and create if needed) the build details database.
+
+        Args:
+            product_cache_dir (str): JFrog project cache directory
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or initialized (e.g. locked, read-only)
+        """
+        self.db_path = os.path.join(product_cache_dir, BUILD_DETAILS_DB_FILE)
+        self.conn = sqlite3.connect(self.db_path)
+        try:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS builds ("
+                "name TEXT NOT NULL, started TEXT NOT NULL, blob BLOB NOT NULL, "
+                "PRIMARY KEY (name, started))"
+            )
+            self.conn.commit()
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] < BUILD_DETAILS_DB_VERSION:
+                self._remove_legacy_cache_dirs(product_cache_dir)
+                self.conn.execute(f"PRAGMA user_version = {BUILD_DETAILS_DB_VERSION}")
+        except sqlite3.Error:
+            self.conn.close()
+            raise
+
+    @staticmethod
+    def _remove_legacy_cache_dirs(product_cache_dir: str):
+        """
+        Remove the per-build details JSON files of the previous cache layout, and the build
+        directories they leave empty. Runs once per database; the AQL caches are left untouched.
+
+        Args:
+            product_cache_dir (str): JFrog project cache directory
+        """
+        removed_files = 0
+        for dir_path, dir_names, file_names in os.walk(product_cache_dir, topdown=False):
+            rel_path = os.path.relpath(dir_path, product_cache_dir)
+            if rel_path == AQL_CACHE_SUBDIR or rel_path.startswith(AQL_CACHE_SUBDIR + os.sep):
+                continue
+            for file_name in fnmatch.filter(file_names, LEGACY_DETAILS_FILE_PATTERN):
+                try:
+                    os.remove(os.path.join(dir_path, file_name))
+                    removed_files += 1
+                except OSError as e:
+                    logger.warning("Failed to remove legacy build details file %s: %s", file_name, str(e))
+            if dir_path == product_cache_dir:
+                continue
+            try:
+                if not os.listdir(dir_path):
+                    os.rmdir(dir_path)
+            except OSError as e:
+                logger.warning("Failed to remove legacy build cache directory %s: %s", dir_path, str(e))
+        if removed_files:
+            logger.info("🧹 Removed %d legacy build details files from %s", removed_files, product_cache_dir)
+
+    def get_cached_keys(self) -> set:
+        """
+        Get the (build name, lastStarted) keys of all cached build runs with a single query,
+        so callers can skip lookups for builds that are not cached
+
+        Returns:
+            set: Set of (build_name, last_started) tuples
+        """
+        return set(self.conn.execute("SELECT name, started FROM builds"))
+
+    def get(self, build_name: str, last_started: str) -> Optional[dict]:
+        """
+        Get cached build details for a build run
+
+        Args:
+            build_name (str): Build name
+            last_started (str): lastStarted timestamp of the build
+
+        Returns:
+            Optional[dict]: Cached build details or None if not cached/invalid
+        """
+        row = self.conn.execute(
+            "SELECT blob FROM builds WHERE name = ? AND started = ?", (build_name, last_started)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+        except ValueError as e:
+            logger.warning("Failed to decode cached details for build '%s': %s", build_name, str(e))
+            return None
+
+    def put(self, build_name: str, last_started: str, build_details: dict):
+        """
+        Cache build details for a build run, dropping details of older runs of the same build
+
+        Args:
+            build_name (str): Build name
+            last_started (str): lastStarted timestamp of the build
+            build_details (dict): Build details returned by the JFrog API
+        """
+        blob = orjson.dumps(build_details) if orjson is not None else \
+            json.dumps(build_details, separators=(',', ':')).encode('utf-8')
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO builds (name, started, blob) VALUES (?, ?, ?)",
+                (build_name, last_started, blob)
+            )
+            self.conn.execute(
+                "DELETE FROM builds WHERE name = ? AND started <> ?", (build_name, last_started)
+            )
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
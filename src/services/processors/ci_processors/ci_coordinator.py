@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from .jfrog_ci_processor import JfrogCiProcessor
 from .sonar_ci_processor import SonarCiProcessor
@@ -42,16 +43,23 @@ class CiCoordinator:
         """
         logger.info("Loading CI data for product '%s'", self.product_name)
         
-        # Load JFrog CI data
-        jfrog_results = self.jfrog_processor.process_ci_data(repos)
-        
-        # Update product instance with build mapping if provided
-        if product_instance and 'build_name_to_repo_map' in jfrog_results:
-            product_instance.build_name_to_repo_map.update(jfrog_results['build_name_to_repo_map'])
-            product_instance.unmapped_build_names.update(jfrog_results['unmapped_build_names'])
+        # Fetch Sonar projects in the background while JFrog CI data loads; repositories are only
+        # updated on this thread (JFrog first, then Sonar), so no CI status is written concurrently
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sonar_future = executor.submit(self.sonar_processor.fetch_sonar_projects)
+            
+            # Load JFrog CI data
+            jfrog_results = self.jfrog_processor.process_ci_data(repos)
+            
+            # Update product instance with build mapping if provided
+            if product_instance and 'build_name_to_repo_map' in jfrog_results:
+                product_instance.build_name_to_repo_map.update(jfrog_results['build_name_to_repo_map'])
+                product_instance.unmapped_build_names.update(jfrog_results['unmapped_build_names'])
+            
+            sonar_data = sonar_future.result()
         
         # Load Sonar CI data
-        sonar_results = self.sonar_processor.process_ci_data(repos)
+        sonar_results = self.sonar_processor.process_ci_data(repos, sonar_data)
         
         logger.info("CI data loading completed for product '%s': JFrog=%d, Sonar=%d repos updated", 
                    self.product_name, jfrog_results['updated_count'], sonar_results['updated_count'])
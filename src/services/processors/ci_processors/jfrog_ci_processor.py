@@ -1,13 +1,46 @@
 import os
 import json
-import glob
+import sqlite3
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List
 from src.services.clients.jfrog_clients.jfrog_client import JfrogClient
+from .build_details_cache import BuildDetailsCache
+
+try:
+    import orjson
+except ImportError:  # optional - fall back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of build names resolved by a single bulk build-metadata AQL query
+BUILD_METADATA_BULK_SIZE = 200
+
+
+def _latest(items: List[dict], key: str):
+    """
+    Return the first item with the greatest value for key (missing values count as '').
+    Single-pass equivalent of max(items, key=lambda b: b.get(key, '')) without the key callable.
+    
+    Args:
+        items (List[dict]): Items to reduce
+        key (str): Key to compare on
+        
+    Returns:
+        dict: Latest item, or None if items is empty
+    """
+    best = None
+    best_value = ''
+    for item in items:
+        value = item.get(key, '')
+        if best is None or value > best_value:
+            best = item
+            best_value = value
+    return best
+
 
 class JfrogCiProcessor:
     """
@@ -15,16 +48,23 @@ class JfrogCiProcessor:
     Extracted from Product class to follow service layer pattern.
     """
     
-    def __init__(self, product_name: str):
+    def __init__(self, product_name: str, max_workers: int = 16):
         """
         Initialize JFrog CI processor for a product.
         
         Args:
             product_name: Name of the product
+            max_workers: Maximum number of concurrent JFrog build detail fetches
         """
         self.product_name = product_name
+        self.max_workers = max_workers
         self.build_name_to_repo_map = {}
         self.unmapped_build_names = set()
+        # Repository name index and prefix trie, reused while the same repos list is processed
+        self._indexed_repos = None
+        self._indexed_repos_count = 0
+        self._repo_by_name = {}
+        self._repo_name_trie = {}
     
     def process_ci_data(self, repos: List) -> Dict:
         """
@@ -88,9 +128,8 @@ class JfrogCiProcessor:
         
         # Setup build info cache directory
         cache_dir = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'build_info_cache_dir')
-        os.makedirs(cache_dir, exist_ok=True)
         
-        # Create product-specific cache directory using project name
+        # Create product-specific cache directory (and its parents) once, using project name
         product_cache_dir = os.path.join(cache_dir, jfrog_project)
         os.makedirs(product_cache_dir, exist_ok=True)
         
@@ -102,22 +141,20 @@ class JfrogCiProcessor:
         # Save the current build list (replace any existing file)
         build_list_file = os.path.join(product_cache_dir, "build_list_current.json")
         try:
-            with open(build_list_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': current_timestamp,
-                    'product': self.product_name,
-                    'jfrog_project': jfrog_project,
-                    'total_builds': len(builds),
-                    'builds': builds
-                }, f, indent=2)
+            self._write_json_file(build_list_file, {
+                'timestamp': current_timestamp,
+                'product': self.product_name,
+                'jfrog_project': jfrog_project,
+                'total_builds': len(builds),
+                'builds': builds
+            })
             logger.info("💾 Saved current build list to: %s (%d builds)", build_list_file, len(builds))
-        except (OSError, ValueError) as e:
+        except (OSError, ValueError, TypeError) as e:
             logger.warning("Failed to save current build list: %s", str(e))
         
-        # Track repository matches
-        repo_matches = {}  # repo_name -> list of build info
+        # Track repository matches (metadata and fallback, distinguished by 'match_type')
+        all_repo_matches = defaultdict(list)  # repo_name -> list of build info
         unmatched_source_repos = {}  # source_repo -> list of build names that reference it
-        fallback_repo_matches = {}  # repo_name -> list of build info (matched via fallback)
         
         # Progress tracking
         processed_builds = 0
@@ -131,219 +168,199 @@ class JfrogCiProcessor:
         # Debug tracking: builds with repo info but no match
         builds_with_repo_info_but_no_match = []  # List of build info that have SOURCE_REPO but no match
         
-        # Create a set of all repository names in the product for quick lookup
-        product_repo_names = set()
-        for repo in repos:
-            if repo.scm_info and repo.scm_info.repo_name:
-                product_repo_names.add(repo.scm_info.repo_name)
+        # Index product repositories by name for O(1) lookup and longest-prefix matching
+        repo_by_name, repo_name_trie = self._get_repo_index(repos)
+        
+        # Keep builds with a build name ('/<name>' uri) and a lastStarted timestamp
+        valid_builds = [(build['uri'][1:], build['lastStarted']) for build in builds
+                        if build.get('uri', '').startswith('/') and build['uri'][1:] and build.get('lastStarted')]
         
-        for build in builds:
-            uri = build.get('uri', '')
-            last_started = build.get('lastStarted', '')
+        # Phase 1: resolve builds from the build details cache, collecting the ones that need JFrog API calls
+        build_entries = []  # [build_name, last_started, build_details] in build list order
+        builds_to_fetch = []  # entries of uncached builds
+        # Without the database (locked, read-only filesystem...) every build is a cache miss
+        try:
+            details_cache = BuildDetailsCache(product_cache_dir)
+        except sqlite3.Error as e:
+            logger.warning("Failed to open the build details cache, continuing without it: %s", str(e))
+            details_cache = None
+        try:
+            # Fetch the cached keys once instead of probing the database for every uncached build
+            cached_keys = set()
+            if details_cache is not None:
+                try:
+                    cached_keys = details_cache.get_cached_keys()
+                except sqlite3.Error as e:
+                    logger.warning("Failed to list cached build details: %s", str(e))
             
-            if uri.startswith('/') and last_started:
-                build_name = uri[1:]  # Remove leading slash
-                if build_name:
-                    processed_builds += 1
-                    
-                    # Log progress every 25 builds (more frequent updates)
-                    if processed_builds % 25 == 0:
-                        logger.info("🔄 Progress: %d/%d builds processed (%d%%), %d API calls, %d cache hits, %d with repo info", 
-                                  processed_builds, len(builds), 
-                                  int((processed_builds / len(builds)) * 100),
-                                  api_calls_made, cache_hits, builds_with_repo_info)
-                    
-                    # Also log every 10 builds for more visibility
-                    elif processed_builds % 10 == 0:
-                        logger.info("⏳ Processing build %d/%d: %s (last: %s)", processed_builds, len(builds), build_name, last_started)
-                    
-                    # Create build-specific directory for this build
-                    build_cache_dir = os.path.join(product_cache_dir, build_name)
-                    os.makedirs(build_cache_dir, exist_ok=True)
-                    
-                    # Create cache filename based on lastStarted timestamp
-                    # Sanitize timestamp for filesystem (replace : and . with -)
-                    safe_timestamp = last_started.replace(':', '-').replace('.', '-').replace('+', '-')
-                    details_cache_file = os.path.join(build_cache_dir, f"details_{safe_timestamp}.json")
-                    
-                    # Check if we have cached details for this exact timestamp
-                    cached_details = None
-                    if os.path.exists(details_cache_file):
-                        try:
-                            with open(details_cache_file, 'r', encoding='utf-8') as f:
-                                cached_details = json.load(f)
-                            logger.debug("📁 Using cached details for build '%s' (timestamp: %s)", build_name, last_started)
-                            cache_hits += 1
-                        except (OSError, ValueError) as e:
-                            logger.warning("Failed to read cached details for build '%s': %s", build_name, str(e))
-                            cached_details = None
+            for build_name, last_started in valid_builds:
+                processed_builds += 1
+                
+                # Log progress every 25 builds (more frequent updates)
+                if processed_builds % 25 == 0:
+                    logger.info("🔄 Progress: %d/%d builds checked (%d%%), %d cache hits", 
+                              processed_builds, len(valid_builds), 
+                              int((processed_builds / len(valid_builds)) * 100), cache_hits)
+                
+                # Check if we have cached details for this exact timestamp
+                cached_details = None
+                if (build_name, last_started) in cached_keys:
+                    try:
+                        cached_details = details_cache.get(build_name, last_started)
+                    except sqlite3.Error as e:
+                        logger.warning("Failed to read cached details for build '%s': %s", build_name, str(e))
+                
+                entry = [build_name, last_started, cached_details]
+                build_entries.append(entry)
+                if cached_details:
+                    logger.debug("📁 Using cached details for build '%s' (timestamp: %s)", build_name, last_started)
+                    cache_hits += 1
+                    builds_with_metadata += 1  # Count as having metadata since we have cached data
+                else:
+                    builds_to_fetch.append(entry)
+
+            # Phase 2: fetch uncached build details concurrently (I/O bound)
+            if builds_to_fetch:
+                logger.info("🌐 Fetching details for %d uncached builds from JFrog API (%d workers)", 
+                           len(builds_to_fetch), self.max_workers)
+                
+                # Resolve latest build numbers in bulk; builds missing from the bulk result fall back to per-build calls
+                uncached_build_names = [entry[0] for entry in builds_to_fetch]
+                bulk_metadata = {}
+                for i in range(0, len(uncached_build_names), BUILD_METADATA_BULK_SIZE):
+                    bulk_metadata.update(jfrog_client.fetch_build_metadata_bulk(
+                        uncached_build_names[i:i + BUILD_METADATA_BULK_SIZE], jfrog_project))
+                    api_calls_made += 1
+                
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {
+                        executor.submit(self._fetch_build_details, jfrog_client, jfrog_project,
+                                        entry[0], bulk_metadata.get(entry[0])): entry
+                        for entry in builds_to_fetch
+                    }
+                    for fetched_count, future in enumerate(as_completed(futures), 1):
+                        entry = futures[future]
+                        build_name, last_started = entry[0], entry[1]
+                        build_details, calls_made, has_metadata = future.result()
+                        entry[2] = build_details
+                        api_calls_made += calls_made
+                        if has_metadata:
+                            builds_with_metadata += 1
+                        
+                        # Cache the details (the database is only used from this thread)
+                        if build_details and details_cache is not None:
+                            try:
+                                details_cache.put(build_name, last_started, build_details)
+                                logger.debug("💾 Cached build details for build '%s' with timestamp %s", build_name, last_started)
+                            except (sqlite3.Error, ValueError, TypeError) as e:
+                                logger.warning("Failed to cache build details for build '%s': %s", build_name, str(e))
+                        
+                        if fetched_count % 25 == 0:
+                            logger.info("🔄 Progress: %d/%d uncached builds fetched, %d API calls", 
+                                      fetched_count, len(builds_to_fetch), api_calls_made)
+        finally:
+            if details_cache is not None:
+                details_cache.close()
+        
+        # Phase 3: match build details to repositories (serially, in build list order)
+        for build_name, last_started, build_details in build_entries:
+            # Process build details if we have them
+            if build_details and 'buildInfo' in build_details:
+                build_info = build_details['buildInfo']
+                properties = build_info.get('properties', {})
+                
+                # Extract repository information
+                source_repo = properties.get('buildInfo.env.SOURCE_REPO')
+                source_branch = properties.get('buildInfo.env.SOURCE_BRANCH')
+                job_url = build_info.get('url')
+                
+                if source_repo:
+                    builds_with_repo_info += 1
                     
-                    # Get build details (from cache or API)
-                    if cached_details:
-                        build_details = cached_details
-                        builds_with_metadata += 1  # Count as having metadata since we have cached data
+                    # Check if this SOURCE_REPO matches any repository in the product
+                    repo = repo_by_name.get(source_repo)
+                    if repo:
+                        # Matched repository via metadata
+                        all_repo_matches[source_repo].append({
+                            'build_name': build_name,
+                            'build_number': build_name,  # Use build name as identifier
+                            'branch': source_branch,
+                            'job_url': job_url,
+                            'started': last_started,  # Use lastStarted from build list
+                            'match_type': 'metadata'
+                        })
+                        
+                        metadata_matches += 1
+                        logger.debug("✅ Matched build '%s' to repo '%s' via metadata (branch: %s)", 
+                                   build_name, source_repo, source_branch)
                     else:
-                        # No cache or cache miss - need to make API calls
-                        logger.debug("🔄 Cache miss for build '%s' (timestamp: %s) - fetching from API", build_name, last_started)
+                        # SOURCE_REPO not found in product repos - add to unmatched list
+                        if source_repo not in unmatched_source_repos:
+                            unmatched_source_repos[source_repo] = []
+                        unmatched_source_repos[source_repo].append(build_name)
                         
-                        # First get metadata to find the latest build number
-                        metadata = jfrog_client.fetch_build_metadata(build_name, jfrog_project)
-                        api_calls_made += 1
+                        # Add to debug tracking
+                        builds_with_repo_info_but_no_match.append({
+                            'build_name': build_name,
+                            'source_repo': source_repo,
+                            'source_branch': source_branch,
+                            'job_url': job_url,
+                            'started': last_started
+                        })
                         
-                        if metadata and 'buildsNumbers' in metadata:
-                            builds_numbers = metadata['buildsNumbers']
-                            if builds_numbers:
-                                builds_with_metadata += 1
-                                # Sort by timestamp to get latest build
-                                latest_build = max(builds_numbers, 
-                                                 key=lambda b: b.get('started', ''))
-                                
-                                # Extract build number from URI
-                                build_number_uri = latest_build.get('uri', '')
-                                if build_number_uri.startswith('/'):
-                                    build_number = build_number_uri[1:]
-                                    
-                                    # Get detailed build information
-                                    build_details = jfrog_client.fetch_build_details(
-                                        build_name, build_number, jfrog_project)
-                                    api_calls_made += 1
-                                    
-                                    # Clean old details files and cache new one with timestamp
-                                    self._clean_old_cache_files(build_cache_dir, "details_*.json")
-                                    try:
-                                        with open(details_cache_file, 'w', encoding='utf-8') as f:
-                                            json.dump(build_details, f, indent=2)
-                                        logger.debug("💾 Cached build details for build '%s' with timestamp %s", build_name, last_started)
-                                    except (OSError, ValueError) as e:
-                                        logger.warning("Failed to cache build details for build '%s': %s", build_name, str(e))
-                                else:
-                                    logger.debug("No valid build number URI found for build '%s'", build_name)
-                                    continue
-                            else:
-                                logger.debug("No builds numbers found in metadata for build '%s'", build_name)
-                                continue
-                        else:
-                            logger.debug("No metadata found for build '%s'", build_name)
-                            continue
+                        logger.debug("❌ SOURCE_REPO '%s' from build '%s' not found in product repos", 
+                                   source_repo, build_name)
+                else:
+                    # FALLBACK: No SOURCE_REPO found, try longest-prefix matching with build name
+                    logger.debug("No SOURCE_REPO found for build '%s', trying fallback longest-prefix matching", build_name)
                     
-                    # Process build details if we have them
-                    if build_details and 'buildInfo' in build_details:
-                        build_info = build_details['buildInfo']
-                        properties = build_info.get('properties', {})
-                        
-                        # Extract repository information
-                        source_repo = properties.get('buildInfo.env.SOURCE_REPO')
-                        source_branch = properties.get('buildInfo.env.SOURCE_BRANCH')
-                        job_url = build_info.get('url')
+                    # Find the repository with the longest name that is a prefix of the build name
+                    # (a build named exactly like a repository is always the longest match)
+                    if build_name in repo_by_name:
+                        best_match = build_name
+                    else:
+                        best_match = self._find_longest_prefix_repo(repo_name_trie, build_name)
+                    best_match_length = len(best_match) if best_match else 0
+                    
+                    if best_match:
+                        # Found a fallback match
+                        builds_with_repo_info += 1  # Count this as having repo info
+                        fallback_matches += 1
                         
-                        if source_repo:
-                            builds_with_repo_info += 1
-                            
-                            # Check if this SOURCE_REPO matches any repository in the product
-                            repo = next((r for r in repos if r.scm_info and r.scm_info.repo_name == source_repo), None)
-                            if repo:
-                                # Matched repository via metadata
-                                if source_repo not in repo_matches:
-                                    repo_matches[source_repo] = []
-                                
-                                repo_matches[source_repo].append({
-                                    'build_name': build_name,
-                                    'build_number': build_name,  # Use build name as identifier
-                                    'branch': source_branch,
-                                    'job_url': job_url,
-                                    'started': last_started,  # Use lastStarted from build list
-                                    'match_type': 'metadata'
-                                })
-                                
-                                metadata_matches += 1
-                                logger.debug("✅ Matched build '%s' to repo '%s' via metadata (branch: %s)", 
-                                           build_name, source_repo, source_branch)
-                            else:
-                                # SOURCE_REPO not found in product repos - add to unmatched list
-                                if source_repo not in unmatched_source_repos:
-                                    unmatched_source_repos[source_repo] = []
-                                unmatched_source_repos[source_repo].append(build_name)
-                                
-                                # Add to debug tracking
-                                builds_with_repo_info_but_no_match.append({
-                                    'build_name': build_name,
-                                    'source_repo': source_repo,
-                                    'source_branch': source_branch,
-                                    'job_url': job_url,
-                                    'started': last_started
-                                })
-                                
-                                logger.debug("❌ SOURCE_REPO '%s' from build '%s' not found in product repos", 
-                                           source_repo, build_name)
-                        else:
-                            # FALLBACK: No SOURCE_REPO found, try longest-prefix matching with build name
-                            logger.debug("No SOURCE_REPO found for build '%s', trying fallback longest-prefix matching", build_name)
-                            
-                            # Find the repository with the longest name that is a prefix of the build name
-                            best_match = None
-                            best_match_length = 0
+                        repo = repo_by_name.get(best_match)
+                        if repo:
+                            all_repo_matches[best_match].append({
+                                'build_name': build_name,
+                                'build_number': build_name,  # Use build name as identifier
+                                'branch': None,  # No branch info in fallback mode
+                                'job_url': job_url,  # URL should still be available
+                                'started': last_started,  # Use lastStarted from build list
+                                'match_type': 'fallback'
+                            })
                             
-                            for repo_name in product_repo_names:
-                                # Check if repo name is a prefix of build name
-                                if build_name.startswith(repo_name):
-                                    # Check if this is a longer match than current best
-                                    if len(repo_name) > best_match_length:
-                                        # Ensure this is a word boundary (followed by - or end of string)
-                                        if len(repo_name) == len(build_name) or build_name[len(repo_name)] == '-':
-                                            best_match = repo_name
-                                            best_match_length = len(repo_name)
-                            
-                            if best_match:
-                                # Found a fallback match
-                                builds_with_repo_info += 1  # Count this as having repo info
-                                fallback_matches += 1
-                                
-                                repo = next((r for r in repos if r.scm_info and r.scm_info.repo_name == best_match), None)
-                                if repo:
-                                    if best_match not in fallback_repo_matches:
-                                        fallback_repo_matches[best_match] = []
-                                    
-                                    fallback_repo_matches[best_match].append({
-                                        'build_name': build_name,
-                                        'build_number': build_name,  # Use build name as identifier
-                                        'branch': None,  # No branch info in fallback mode
-                                        'job_url': job_url,  # URL should still be available
-                                        'started': last_started,  # Use lastStarted from build list
-                                        'match_type': 'fallback'
-                                    })
-                                    
-                                    logger.debug("🔄 FALLBACK: Matched build '%s' to repo '%s' via longest-prefix (prefix: '%s', length: %d)", 
-                                               build_name, best_match, best_match, best_match_length)
-                            else:
-                                self.unmapped_build_names.add(build_name)
-                                logger.debug("❌ FALLBACK: No prefix match found for build '%s'", build_name)
+                            logger.debug("🔄 FALLBACK: Matched build '%s' to repo '%s' via longest-prefix (prefix: '%s', length: %d)", 
+                                       build_name, best_match, best_match, best_match_length)
                     else:
-                        logger.debug("No buildInfo found in build details for '%s'", build_name)
-        
-        # Combine metadata and fallback matches for total counts
-        all_repo_matches = {}
-        all_repo_matches.update(repo_matches)
-        
-        # Add fallback matches to the total
-        for repo_name, build_list in fallback_repo_matches.items():
-            if repo_name not in all_repo_matches:
-                all_repo_matches[repo_name] = []
-            all_repo_matches[repo_name].extend(build_list)
-        
+                        self.unmapped_build_names.add(build_name)
+                        logger.debug("❌ FALLBACK: No prefix match found for build '%s'", build_name)
+            else:
+                logger.debug("No buildInfo found in build details for '%s'", build_name)
+
         # Final progress summary
         logger.info("✅ Metadata analysis completed: %d builds processed, %d API calls made, %d cache hits", 
                    processed_builds, api_calls_made, cache_hits)
         logger.info("📈 Build processing results: %d builds with valid data, %d builds with repo info", 
                    builds_with_metadata, builds_with_repo_info)
-        logger.info("🔗 Found matches for %d unique repositories (%d via metadata, %d via fallback)", 
-                   len(all_repo_matches), len(repo_matches), len(fallback_repo_matches))
+        logger.info("🔗 Found matches for %d unique repositories (%d builds via metadata, %d builds via fallback)", 
+                   len(all_repo_matches), metadata_matches, fallback_matches)
         
         # Calculate total builds matched
         total_matched_builds = sum(len(builds) for builds in all_repo_matches.values())
         logger.info("🎯 Total builds matched to repositories: %d builds across %d repositories", 
                    total_matched_builds, len(all_repo_matches))
         
-        # Update repository CI status based on matches (both metadata and fallback)
+        # Update repository CI status based on matches (both metadata and fallback); iterate the repos
+        # themselves so that every repository sharing a matched name (e.g. across GitLab groups) is updated
         updated_count = 0
         for repo in repos:
             # Ensure CI status is initialized
@@ -351,48 +368,48 @@ class JfrogCiProcessor:
                 from src.models.ci_status import CIStatus
                 repo.update_ci_status(CIStatus())
 
-            if repo.scm_info and repo.scm_info.repo_name:
-                repo_name = repo.scm_info.repo_name
+            repo_name = repo.scm_info.repo_name if repo.scm_info else None
+            builds_for_repo = all_repo_matches.get(repo_name) if repo_name else None
+            if not builds_for_repo:
+                continue
 
-                if repo_name in all_repo_matches:
-                    # Find the most recent build for this repository
-                    builds_for_repo = all_repo_matches[repo_name]
-                    latest_build = max(builds_for_repo, key=lambda b: b.get('started', ''))
+            # Find the most recent build for this repository
+            latest_build = _latest(builds_for_repo, 'started')
 
-                    # Extract all build names for this repository as a set
-                    build_names = {build['build_name'] for build in builds_for_repo}
+            # Extract all build names for this repository as a set
+            build_names = {build['build_name'] for build in builds_for_repo}
 
-                    # Build mapping method dict for this repo's builds
-                    build_name_mapping_methods = {}
-                    for build in builds_for_repo:
-                        build_name = build['build_name']
-                        match_type = build.get('match_type', 'not_mapped')
-                        # Use 'metadata' or 'longest_prefix' for clarity
-                        if match_type == 'metadata':
-                            build_name_mapping_methods[build_name] = 'source_repo'
-                        elif match_type == 'fallback':
-                            build_name_mapping_methods[build_name] = 'longest_prefix'
-                        else:
-                            build_name_mapping_methods[build_name] = 'not_mapped'
+            # Build mapping method dict for this repo's builds
+            build_name_mapping_methods = {}
+            for build in builds_for_repo:
+                build_name = build['build_name']
+                match_type = build.get('match_type', 'not_mapped')
+                # Use 'metadata' or 'longest_prefix' for clarity
+                if match_type == 'metadata':
+                    build_name_mapping_methods[build_name] = 'source_repo'
+                elif match_type == 'fallback':
+                    build_name_mapping_methods[build_name] = 'longest_prefix'
+                else:
+                    build_name_mapping_methods[build_name] = 'not_mapped'
 
-                    # Update JFrog CI status with metadata, build names, and mapping methods
-                    repo.ci_status.jfrog_status.set_exists(
-                        True,
-                        branch=latest_build.get('branch'),
-                        job_url=latest_build.get('job_url'),
-                        matched_build_names=build_names,
-                        build_name_mapping_methods=build_name_mapping_methods
-                    )
+            # Update JFrog CI status with metadata, build names, and mapping methods
+            repo.ci_status.jfrog_status.set_exists(
+                True,
+                branch=latest_build.get('branch'),
+                job_url=latest_build.get('job_url'),
+                matched_build_names=build_names,
+                build_name_mapping_methods=build_name_mapping_methods
+            )
 
-                    # Populate build_name_to_repo_map for vulnerability matching
-                    for build_name in build_names:
-                        self.build_name_to_repo_map[build_name] = repo
+            # Populate build_name_to_repo_map for vulnerability matching
+            for build_name in build_names:
+                self.build_name_to_repo_map[build_name] = repo
 
-                    updated_count += 1
+            updated_count += 1
 
-                    match_type = latest_build.get('match_type', 'unknown')
-                    logger.debug("Updated JFrog CI status for repo '%s' with %s match and %d build names: %s", 
-                               repo_name, match_type, len(build_names), list(build_names)[:3])
+            match_type = latest_build.get('match_type', 'unknown')
+            logger.debug("Updated JFrog CI status for repo '%s' with %s match and %d build names: %s", 
+                       repo_name, match_type, len(build_names), list(build_names)[:3])
         
         logger.info("✅ Updated JFrog CI status for %d/%d repositories in product '%s' using metadata and fallback", 
                    updated_count, len(repos), self.product_name)
@@ -408,26 +425,135 @@ class JfrogCiProcessor:
             'unmapped_build_names': self.unmapped_build_names
         }
     
-    def _clean_old_cache_files(self, cache_dir: str, pattern: str):
+    def _get_repo_index(self, repos: List) -> tuple:
         """
-        Clean old cache files matching the pattern, keeping only the latest one
+        Get the repository name index and prefix trie for the repos list,
+        rebuilding them only when a different (or resized) list is passed in
         
         Args:
-            cache_dir (str): Directory to clean
-            pattern (str): Glob pattern to match files
+            repos: List of repository objects
+            
+        Returns:
+            tuple: (repo_by_name dict, repository name trie)
         """
+        if repos is not self._indexed_repos or len(repos) != self._indexed_repos_count:
+            # Name lookups only (first repository wins on duplicate names); CI status updates
+            # iterate the repos list so that repositories sharing a name are all updated
+            repo_by_name = {}
+            for repo in repos:
+                if repo.scm_info and repo.scm_info.repo_name:
+                    repo_by_name.setdefault(repo.scm_info.repo_name, repo)
+            
+            self._indexed_repos = repos
+            self._indexed_repos_count = len(repos)
+            self._repo_by_name = repo_by_name
+            self._repo_name_trie = self._build_repo_name_trie(repo_by_name)
         
-        # Find all files matching the pattern
-        files = glob.glob(os.path.join(cache_dir, pattern))
+        return self._repo_by_name, self._repo_name_trie
+    
+    @staticmethod
+    def _build_repo_name_trie(repo_names) -> dict:
+        """
+        Build a character trie of repository names for longest-prefix matching
         
-        if len(files) > 1:
-            # Sort by modification time and keep only the latest
-            files.sort(key=os.path.getmtime, reverse=True)
-            files_to_delete = files[1:]  # Keep the first (latest), delete the rest
+        Args:
+            repo_names: Iterable of repository names
             
-            for file_path in files_to_delete:
-                try:
-                    os.remove(file_path)
-                    logger.debug("Removed old cache file: %s", file_path)
-                except OSError as e:
-                    logger.warning("Failed to remove old cache file %s: %s", file_path, str(e))
+        Returns:
+            dict: Nested dict trie; the '' key of a node holds the repository name ending there
+        """
+        trie = {}
+        for repo_name in repo_names:
+            node = trie
+            for char in repo_name:
+                node = node.setdefault(char, {})
+            node[''] = repo_name
+        return trie
+    
+    @staticmethod
+    def _find_longest_prefix_repo(trie: dict, build_name: str):
+        """
+        Find the longest repository name that is a prefix of the build name on a word boundary
+        (followed by '-' or the end of the build name)
+        
+        Args:
+            trie (dict): Trie built by _build_repo_name_trie
+            build_name (str): Build name
+            
+        Returns:
+            Optional[str]: Longest matching repository name or None
+        """
+        best_match = None
+        node = trie
+        for char in build_name:
+            if char == '-' and '' in node:
+                best_match = node['']
+            node = node.get(char)
+            if node is None:
+                return best_match
+        return node.get('', best_match)
+    
+    def _fetch_build_details(self, jfrog_client, jfrog_project: str, build_name: str,
+                             metadata: dict = None) -> tuple:
+        """
+        Fetch details of the latest run of a build from the JFrog API
+        
+        Args:
+            jfrog_client: JfrogClient instance
+            jfrog_project (str): JFrog project name
+            build_name (str): Build name
+            metadata (dict): Build metadata already fetched in bulk (fetched per build if None)
+            
+        Returns:
+            tuple: (build_details or None, number of API calls made, whether build metadata was found)
+        """
+        logger.debug("🔄 Cache miss for build '%s' - fetching from API", build_name)
+        
+        # First get metadata to find the latest build number
+        api_calls_made = 0
+        if metadata is None:
+            metadata = jfrog_client.fetch_build_metadata(build_name, jfrog_project)
+            api_calls_made += 1
+        
+        if not metadata or 'buildsNumbers' not in metadata:
+            logger.debug("No metadata found for build '%s'", build_name)
+            return None, api_calls_made, False
+        
+        builds_numbers = metadata['buildsNumbers']
+        if not builds_numbers:
+            logger.debug("No builds numbers found in metadata for build '%s'", build_name)
+            return None, api_calls_made, False
+        
+        # Sort by timestamp to get latest build
+        latest_build = _latest(builds_numbers, 'started')
+        
+        # Extract build number from URI
+        build_number_uri = latest_build.get('uri', '')
+        if not build_number_uri.startswith('/'):
+            logger.debug("No valid build number URI found for build '%s'", build_name)
+            return None, api_calls_made, True
+        build_number = build_number_uri[1:]
+        
+        # Get detailed build information
+        build_details = jfrog_client.fetch_build_details(build_name, build_number, jfrog_project)
+        api_calls_made += 1
+        
+        return build_details, api_calls_made, True
+    
+    @staticmethod
+    def _write_json_file(file_path: str, data):
+        """
+        Write data to a compact JSON cache file in a single write call
+        (orjson when available, stdlib json otherwise)
+        
+        Args:
+            file_path (str): Path to the JSON file
+            data: JSON-serializable data
+        """
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data))
+            return
+        encoded = json.dumps(data, separators=(',', ':'))
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(encoded)
@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from src.services.data_loader import DataLoader
 
 logger = logging.getLogger(__name__)
@@ -24,13 +24,28 @@ class SonarCiProcessor:
         self.organization_id = organization_id
         self.data_loader = DataLoader(compass_token=compass_token)
     
-    def process_ci_data(self, repos: List) -> Dict:
+    def fetch_sonar_projects(self) -> List:
+        """
+        Fetch the product's Sonar projects from Compass API (no repository is touched, safe to run in a thread).
+        
+        Returns:
+            List of Sonar project dicts (empty on error)
+        """
+        try:
+            logger.info("Loading Sonar CI data for product '%s'", self.product_name)
+            return self.data_loader.load_repositories("sonarqube", self.organization_id) or []
+        except (ValueError, KeyError, OSError) as e:
+            logger.error("Error loading Sonar CI data for product '%s': %s", self.product_name, str(e))
+            return []
+    
+    def process_ci_data(self, repos: List, sonar_data: Optional[List] = None) -> Dict:
         """
         Process Sonar CI data for all repositories in the product.
         Updates SonarCIStatus.is_exist and project_key for matching repositories.
         
         Args:
             repos: List of repository objects
+            sonar_data: Sonar projects prefetched with fetch_sonar_projects (fetched here when omitted)
             
         Returns:
             Dict containing processing results
@@ -39,10 +54,9 @@ class SonarCiProcessor:
         # Currently only checking if projects exist, but should also verify which branches are being scanned
         # and update the is_main_branch_scanned field accordingly.
         try:
-            logger.info("Loading Sonar CI data for product '%s'", self.product_name)
-            
-            # Fetch Sonar projects from Compass API using "sonarqube" type
-            sonar_data = self.data_loader.load_repositories("sonarqube", self.organization_id)
+            if sonar_data is None:
+                # Fetch Sonar projects from Compass API using "sonarqube" type
+                sonar_data = self.fetch_sonar_projects()
             
             if not sonar_data:
                 logger.info("No Sonar projects found for product '%s'", self.product_name)
@@ -2,7 +2,9 @@ import os
 import logging
 from typing import List
 from collections import Counter
-from src.services.clients.hrdb_clients.hrdb_client import HRDBClient
+from concurrent.futures import ThreadPoolExecutor
+from src.models.owner import OwnerRecord
+from src.services.clients.hrdb_clients.hrdb_client import HR_FIELDS, get_default_hrdb
 
 logger = logging.getLogger(__name__)
 
@@ -13,16 +15,18 @@ class BitbucketRepoProcessor:
     Extracted from Product class to follow service layer pattern.
     """
     
-    def __init__(self, product_name: str):
+    def __init__(self, product_name: str, max_workers: int = 16):
         """
         Initialize Bitbucket repository processor.
         
         Args:
             product_name: Name of the product
+            max_workers: Maximum number of repositories whose owners are fetched concurrently
         """
         self.product_name = product_name
+        self.max_workers = max_workers
         self.bitbucket_client = None
-        self.hrdb_client = HRDBClient()
+        self.hrdb_client = get_default_hrdb()
         
     def initialize_client(self):
         """Initialize Bitbucket client with product-specific configuration."""
@@ -57,50 +61,57 @@ class BitbucketRepoProcessor:
             if not self.initialize_client():
                 return 0
         
+        # First pass: fetch PR reviewers concurrently, as it is network-bound
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            top_reviewers_by_repo = list(executor.map(self._fetch_top_reviewers, repos))
+
+        # Look up all distinct reviewers in HRDB at once
+        self.hrdb_client.prime_cache(
+            username for top_reviewers in top_reviewers_by_repo for username, _ in top_reviewers
+        )
+
+        # Second pass: enrich reviewers from the cached HR data
         processed_count = 0
-        for repo in repos:
-            self._populate_single_repo_owners(repo)
+        for repo, top_reviewers in zip(repos, top_reviewers_by_repo):
+            self._populate_single_repo_owners(repo, top_reviewers)
             processed_count += 1
             
         logger.info("✅ Processed Bitbucket repository owners for %d repositories in product '%s'", 
                    processed_count, self.product_name)
         return processed_count
     
-    def _populate_single_repo_owners(self, repo):
+    def _fetch_top_reviewers(self, repo) -> List[tuple]:
         """
-        Populate the repo_owners field for a single Bitbucket repo using PR reviewers and HRDB info.
+        Fetch the most frequent recent PR reviewers of a single Bitbucket repo.
+
+        Args:
+            repo: Repository object
+
+        Returns:
+            List[tuple]: Up to 3 (username, review_count) tuples (empty if none were found)
         """
         # Parse project_key and repo_slug from scm_info.full_name
         try:
             project_key, repo_slug = repo.scm_info.full_name.split('/', 1)
         except (ValueError, AttributeError) as e:
             logger.warning("Failed to parse project/repo from full_name '%s': %s", repo.scm_info.full_name, str(e))
-            repo.repo_owners = []
-            return
+            return []
 
         reviewers = self.bitbucket_client.fetch_recent_merged_pr_reviewers(project_key, repo_slug)
         if not reviewers:
             logger.warning("No reviewers found for repo '%s'", repo.scm_info.full_name)
-            repo.repo_owners = []
-            return
+            return []
 
-        counts = Counter(reviewers)
-        top_reviewers = counts.most_common(3)
+        return Counter(reviewers).most_common(3)
 
+    def _populate_single_repo_owners(self, repo, top_reviewers: List[tuple]):
+        """
+        Populate the repo_owners field for a single Bitbucket repo using its top PR reviewers and HRDB info.
+        """
         repo.repo_owners = []
         for username, review_count in top_reviewers:
             hr_info = self.hrdb_client.get_user_data(username)
-            repo.repo_owners.append({
-                'name': username,
-                'review_count': review_count,
-                'general_manager': hr_info['general_manager'],
-                'vp': hr_info['vp'],
-                'title': hr_info.get('title'),
-                'department': hr_info.get('department'),
-                'manager_name': hr_info.get('manager_name'),
-                'director': hr_info.get('director'),
-                'vp2': hr_info.get('vp2'),
-                'c_level': hr_info.get('c_level'),
-                'worker_id': hr_info.get('worker_id'),
-                'full_name': hr_info.get('full_name')
-            })
+            repo.repo_owners.append(OwnerRecord(
+                username, review_count=review_count,
+                **{field: hr_info.get(field) for field in HR_FIELDS}
+            ))
@@ -2,7 +2,9 @@ import os
 import logging
 from typing import List
 from collections import Counter
-from src.services.clients.hrdb_clients.hrdb_client import HRDBClient
+from concurrent.futures import ThreadPoolExecutor
+from src.models.owner import OwnerRecord
+from src.services.clients.hrdb_clients.hrdb_client import HR_FIELDS, get_default_hrdb
 
 logger = logging.getLogger(__name__)
 
@@ -13,16 +15,18 @@ class GitHubRepoProcessor:
     Extracted from Product class to follow service layer pattern.
     """
     
-    def __init__(self, product_name: str):
+    def __init__(self, product_name: str, max_workers: int = 4):
         """
         Initialize GitHub repository processor.
         
         Args:
             product_name: Name of the product
+            max_workers: Maximum number of GraphQL reviewer batches fetched concurrently
         """
         self.product_name = product_name
+        self.max_workers = max_workers
         self.github_client = None
-        self.hrdb_client = HRDBClient()
+        self.hrdb_client = get_default_hrdb()
         
     def initialize_client(self):
         """Initialize GitHub client with product-specific configuration."""
@@ -73,25 +77,38 @@ class GitHubRepoProcessor:
             logger.warning("No GitHub repositories found for owner detection in product '%s'", self.product_name)
             return 0
 
-        # Batch fetch reviewers for all repos in chunks of 30
+        # Batch fetch reviewers for all repos in chunks of 30, running the batches concurrently
         batch_size = 30
+        batches = [repo_names[i:i + batch_size] for i in range(0, len(repo_names), batch_size)]
         reviewers_by_repo = {}
 
-        for i in range(0, len(repo_names), batch_size):
-            batch = repo_names[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(repo_names) + batch_size - 1) // batch_size
-            
-            logger.info("🔄 Fetching GitHub PR reviewers for batch %d/%d (%d repos)...", 
-                       batch_num, total_batches, len(batch))
-            
-            batch_results = self.github_client.fetch_repo_reviewers_batch(batch)
-            reviewers_by_repo.update(batch_results)
+        logger.info("🔄 Fetching GitHub PR reviewers in %d batches (%d repos)...", 
+                   len(batches), len(repo_names))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch_results in executor.map(self.github_client.fetch_repo_reviewers_batch, batches):
+                reviewers_by_repo.update(batch_results)
 
         if not reviewers_by_repo:
             logger.warning("No reviewers returned from GitHub batch queries for product '%s'", self.product_name)
             return 0
 
+        # First pass: pick the top reviewers per repo and collect the distinct usernames
+        top_reviewers_by_repo = {}
+        all_usernames = set()
+        for repo_name, reviewers in reviewers_by_repo.items():
+            if repo_name not in repo_map or not reviewers:
+                continue
+            # Count reviewers by frequency, normalizing usernames that start with 'chkp-'
+            top_reviewers = [(self._normalize_username(username), review_count)
+                             for username, review_count in self._top_reviewers(reviewers, 3)]
+            top_reviewers_by_repo[repo_name] = top_reviewers
+            all_usernames.update(username for username, _ in top_reviewers)
+
+        # Look up each user in HRDB once, however many repositories they review
+        hr_info_by_username = {username: self.hrdb_client.get_user_data(username) for username in all_usernames}
+
+        # Second pass: build the enriched owners from the in-memory HR data
         processed_count = 0
         for repo_name, reviewers in reviewers_by_repo.items():
             repo = repo_map.get(repo_name)
@@ -101,35 +118,43 @@ class GitHubRepoProcessor:
                 repo.repo_owners = []
                 continue
 
-            # Count reviewers by frequency
-            counts = Counter(reviewers)
-            top_reviewers = counts.most_common(3)
-
             enriched_owners = []
-            for username, review_count in top_reviewers:
-                # Normalize username if it starts with 'chkp-'
-                if username and username.startswith('chkp-'):
-                    normalized_username = username[len('chkp-'):]
-                else:
-                    normalized_username = username
-                hr_info = self.hrdb_client.get_user_data(normalized_username)
-                enriched_owners.append({
-                    'name': normalized_username,
-                    'review_count': review_count,
-                    'general_manager': hr_info.get('general_manager'),
-                    'vp': hr_info.get('vp'),
-                    'title': hr_info.get('title'),
-                    'department': hr_info.get('department'),
-                    'manager_name': hr_info.get('manager_name'),
-                    'director': hr_info.get('director'),
-                    'vp2': hr_info.get('vp2'),
-                    'c_level': hr_info.get('c_level'),
-                    'worker_id': hr_info.get('worker_id'),
-                    'full_name': hr_info.get('full_name')
-                })
+            for normalized_username, review_count in top_reviewers_by_repo[repo_name]:
+                hr_info = hr_info_by_username[normalized_username]
+                enriched_owners.append(OwnerRecord(
+                    normalized_username, review_count=review_count,
+                    **{field: hr_info.get(field) for field in HR_FIELDS}
+                ))
             repo.repo_owners = enriched_owners
             processed_count += 1
             
         logger.info("✅ Processed GitHub repository owners for %d repositories in product '%s'", 
                    processed_count, self.product_name)
         return processed_count
+
+    @staticmethod
+    def _top_reviewers(reviewers: List[str], limit: int) -> List[tuple]:
+        """
+        Get the most frequent reviewers with their review counts (same order as Counter.most_common).
+        Small reviewer lists (the common case) are counted directly without building a Counter.
+        
+        Args:
+            reviewers: Reviewer usernames, one entry per review
+            limit: Maximum number of reviewers to return
+            
+        Returns:
+            List[tuple]: (username, review_count) pairs, most frequent first
+        """
+        if len(reviewers) <= limit:
+            # dict.fromkeys keeps first-seen order; the stable sort keeps it among equal counts
+            counted = [(username, reviewers.count(username)) for username in dict.fromkeys(reviewers)]
+            counted.sort(key=lambda item: item[1], reverse=True)
+            return counted
+        return Counter(reviewers).most_common(limit)
+
+    @staticmethod
+    def _normalize_username(username: str) -> str:
+        """Strip the 'chkp-' prefix used by GitHub accounts to get the HRDB username."""
+        if username and username.startswith('chkp-'):
+            return username[len('chkp-'):]
+        return username
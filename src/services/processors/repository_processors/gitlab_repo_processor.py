@@ -1,8 +1,10 @@
 import os
 import logging
 from typing import List
-from collections import Counter
-from src.services.clients.hrdb_clients.hrdb_client import HRDBClient
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from src.models.owner import OwnerRecord
+from src.services.clients.hrdb_clients.hrdb_client import HR_FIELDS, get_default_hrdb
 
 logger = logging.getLogger(__name__)
 
@@ -13,16 +15,18 @@ class GitLabRepoProcessor:
     Extracted from Product class to follow service layer pattern.
     """
     
-    def __init__(self, product_name: str):
+    def __init__(self, product_name: str, max_workers: int = 16):
         """
         Initialize GitLab repository processor.
         
         Args:
             product_name: Name of the product
+            max_workers: Maximum number of repositories whose owners are fetched concurrently
         """
         self.product_name = product_name
+        self.max_workers = max_workers
         self.gitlab_client = None
-        self.hrdb_client = HRDBClient()
+        self.hrdb_client = get_default_hrdb()
         
     def initialize_client(self):
         """Initialize GitLab client with product-specific configuration."""
@@ -59,31 +63,54 @@ class GitLabRepoProcessor:
             if not self.initialize_client():
                 return 0
         
+        # First pass: fetch project owners concurrently, as it is network-bound
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            owners_by_repo = list(executor.map(self._fetch_repo_owners, repos))
+
+        # Look up all distinct owners in HRDB at once
+        self.hrdb_client.prime_cache(
+            owner['username'] for owners in owners_by_repo for owner in owners if owner.get('username')
+        )
+
+        # Second pass: enrich and sort owners from the cached HR data
         processed_count = 0
-        for repo in repos:
-            self._populate_single_repo_owners(repo)
+        for repo, owners in zip(repos, owners_by_repo):
+            self._populate_single_repo_owners(repo, owners)
             processed_count += 1
             
         logger.info("✅ Processed GitLab repository owners for %d repositories in product '%s'", 
                    processed_count, self.product_name)
         return processed_count
     
-    def _populate_single_repo_owners(self, repo):
+    def _fetch_repo_owners(self, repo) -> List[dict]:
         """
-        Populate the repo_owners field for a single GitLab repo using project owners and HRDB info.
-        Sort owners so that those with the most frequent (case-insensitive) 'vp' value appear first.
-        Owners with vp=None or 'unknown' (case-insensitive) are always at the end.
+        Fetch the project owners of a single GitLab repo.
+
+        Args:
+            repo: Repository object
+
+        Returns:
+            List[dict]: Owners with keys username, access_level (empty if none were found)
         """
         project_id = getattr(repo.scm_info, 'id', None)
         if not project_id:
             logger.warning("No project_id found for repo '%s', skipping owner detection.", 
                           getattr(repo.scm_info, 'full_name', 'unknown'))
-            repo.repo_owners = []
-            return
+            return []
 
         owners = self.gitlab_client.fetch_project_owners(project_id)
         if not owners:
             logger.warning("No owners found for GitLab project_id '%s'", project_id)
+            return []
+        return owners
+
+    def _populate_single_repo_owners(self, repo, owners: List[dict]):
+        """
+        Populate the repo_owners field for a single GitLab repo using its project owners and HRDB info.
+        Sort owners so that those with the most frequent (case-insensitive) 'vp' value appear first.
+        Owners with vp=None or 'unknown' (case-insensitive) are always at the end.
+        """
+        if not owners:
             repo.repo_owners = []
             return
 
@@ -92,20 +119,10 @@ class GitLabRepoProcessor:
             username = owner.get('username')
             access_level = owner.get('access_level')
             hr_info = self.hrdb_client.get_user_data(username)
-            enriched_owners.append({
-                'name': username,
-                'access_level': access_level,
-                'general_manager': hr_info.get('general_manager'),
-                'vp': hr_info.get('vp'),
-                'title': hr_info.get('title'),
-                'department': hr_info.get('department'),
-                'manager_name': hr_info.get('manager_name'),
-                'director': hr_info.get('director'),
-                'vp2': hr_info.get('vp2'),
-                'c_level': hr_info.get('c_level'),
-                'worker_id': hr_info.get('worker_id'),
-                'full_name': hr_info.get('full_name')
-            })
+            enriched_owners.append(OwnerRecord(
+                username, access_level=access_level,
+                **{field: hr_info.get(field) for field in HR_FIELDS}
+            ))
 
         # Sorting logic (case-insensitive for vp)
         # 1. Group owners by vp (case-insensitive, except None/unknown)
@@ -120,23 +137,19 @@ class GitLabRepoProcessor:
                 return None
             return vp.strip().lower() if isinstance(vp, str) else vp
 
-        # Build list of normalized vps (excluding None/unknown)
-        vps = [normalize_vp(owner['vp']) for owner in enriched_owners if normalize_vp(owner['vp']) is not None]
-        vp_counter = Counter(vps)
+        # Normalize each owner's vp once, then count them (excluding None/unknown)
+        vp_norms = [normalize_vp(owner['vp']) for owner in enriched_owners]
+        vp_counter = Counter(vp for vp in vp_norms if vp is not None)
 
-        # For each owner, assign a sort key:
-        #   - (-(vp_count), original_index) for owners with a valid vp
-        #   - (float('inf'), original_index) for owners with vp None/unknown (always at end)
-        def owner_sort_key(owner_with_index):
-            idx, owner = owner_with_index
-            vp_norm = normalize_vp(owner['vp'])
+        # Bucket owners by vp count (stable within a bucket, i.e. original order among ties);
+        # owners with vp None/unknown go to the tail (always at end)
+        buckets = defaultdict(list)
+        tail = []
+        for owner, vp_norm in zip(enriched_owners, vp_norms):
             if vp_norm is None:
-                return (float('inf'), idx)
-            # Negative count for descending sort
-            return (-vp_counter[vp_norm], idx)
-
-        # Attach original index to preserve order among ties
-        owners_with_index = list(enumerate(enriched_owners))
-        sorted_owners = [owner for idx, owner in sorted(owners_with_index, key=owner_sort_key)]
+                tail.append(owner)
+            else:
+                buckets[vp_counter[vp_norm]].append(owner)
+        sorted_owners = [owner for count in sorted(buckets, reverse=True) for owner in buckets[count]] + tail
 
         repo.repo_owners = sorted_owners
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Optional
 from src.services.data_loader import DataLoader
 from src.models.repo import Repo
 from .github_repo_processor import GitHubRepoProcessor
@@ -30,12 +30,27 @@ class RepositoryCoordinator:
         self.organization_id = organization_id
         self.data_loader = DataLoader(compass_token=compass_token)
         
-        # Initialize SCM-specific processors
-        self.processors = {
-            'github': GitHubRepoProcessor(product_name),
-            'gitlab': GitLabRepoProcessor(product_name),
-            'bitbucket_server': BitbucketRepoProcessor(product_name)
+        # SCM-specific processor classes; only the one for this product's SCM type is created, on first use
+        self._processor_class_map = {
+            'github': GitHubRepoProcessor,
+            'gitlab': GitLabRepoProcessor,
+            'bitbucket_server': BitbucketRepoProcessor
         }
+        self._processor = None
+
+    @property
+    def processor(self) -> Optional[object]:
+        """
+        SCM-specific repository processor for this product's SCM type, created on first access.
+        
+        Returns:
+            Processor instance, or None if the SCM type is not supported
+        """
+        if self._processor is None:
+            processor_class = self._processor_class_map.get(self.scm_type)
+            if processor_class:
+                self._processor = processor_class(self.product_name)
+        return self._processor
     
     def load_repositories(self) -> List[Repo]:
         """
@@ -56,13 +71,14 @@ class RepositoryCoordinator:
             logger.info("📦 Found %d repositories for product '%s'. Starting repo owner retrieval...", 
                        total_repos, self.product_name)
             
+            # Progress logging every 10 repos (every 5% for large organizations), and always for first and last
+            progress_interval = max(10, total_repos // 20)
             processed_repos = 0
             for repo_json in repo_data:
                 try:
                     repo = Repo.from_json(repo_json, self.product_name)
                     processed_repos += 1
-                    # Progress logging every 10 repos, and always for first and last
-                    if processed_repos == 1 or processed_repos == total_repos or processed_repos % 10 == 0:
+                    if processed_repos == 1 or processed_repos == total_repos or processed_repos % progress_interval == 0:
                         logger.info("🔄 Progress: %d/%d repositories processed for owner detection (%.1f%%)",
                                     processed_repos, total_repos, (processed_repos/total_repos)*100)
                     
@@ -89,7 +105,7 @@ class RepositoryCoordinator:
         Args:
             repos: List of repository objects to populate
         """
-        processor = self.processors.get(self.scm_type)
+        processor = self.processor
         
         if not processor:
             logger.warning("No processor available for SCM type '%s'", self.scm_type)
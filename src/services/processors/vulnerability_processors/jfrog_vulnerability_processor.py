@@ -4,11 +4,17 @@ Handles fetching and processing JFrog vulnerability data with AQL caching
 """
 
 import os
+import functools
 import logging
 from typing import List, Dict, Optional, Tuple, Any
+from src.services.processors.artifact_processors.aql_cache_manager import AqlCacheManager
+from src.services.processors.artifact_processors.artifact_parser import ArtifactParser
 
 logger = logging.getLogger(__name__)
 
+# Parsed artifact paths memoized across processors (products of an organization share its artifacts)
+ARTIFACT_PATH_CACHE_SIZE = 65536
+
 
 class JfrogVulnerabilityProcessor:
     """Processes JFrog vulnerability data for repositories using enhanced AQL cache logic"""
@@ -156,6 +162,8 @@ class JfrogVulnerabilityProcessor:
         
         missing_artifacts_by_repo = {}  # repo_name -> [artifact_paths]
         artifacts_by_repo = {}  # repo_name -> [DeployedArtifact objects]
+        aql_indexes = {}  # repo_name -> AQL entries by (path, name), or None if not cached
+        build_name_to_repo = ArtifactParser.invert_build_names_map(repo_build_names_map)
         
         # Process each vulnerability artifact
         for artifact_key, vuln_data in jfrog_vulnerabilities.items():
@@ -170,8 +178,8 @@ class JfrogVulnerabilityProcessor:
             
             # Parse and process artifact
             result = self._process_single_artifact(
-                artifact_key, vuln_data, repo_build_names_map, aql_cache_dir,
-                missing_artifacts_by_repo, artifacts_by_repo
+                artifact_key, vuln_data, build_name_to_repo, aql_cache_dir,
+                missing_artifacts_by_repo, artifacts_by_repo, aql_indexes
             )
             
             if result == "malformed":
@@ -195,9 +203,10 @@ class JfrogVulnerabilityProcessor:
         
         return updated_count
     
-    def _process_single_artifact(self, artifact_key: str, vuln_data: Dict, repo_build_names_map: Dict,
-                               aql_cache_dir: str, missing_artifacts_by_repo: Dict, artifacts_by_repo: Dict) -> str:
-        """Process a single artifact and categorize it"""
+    def _process_single_artifact(self, artifact_key: str, vuln_data: Dict, build_name_to_repo: Dict,
+                               aql_cache_dir: str, missing_artifacts_by_repo: Dict, artifacts_by_repo: Dict,
+                               aql_indexes: Dict) -> str:
+        """Process a single artifact and categorize it (AQL caches are loaded and indexed once per repository)"""
         
         # Parse artifact structure
         parsed_artifact = self._parse_artifact_path(artifact_key)
@@ -213,10 +222,13 @@ class JfrogVulnerabilityProcessor:
             return "skipped"
         
         # Check AQL cache for this repository
-        aql_cache_file = os.path.join(aql_cache_dir, f"{repo_name}.json")
-        aql_data = self._load_aql_cache(aql_cache_file)
+        if repo_name not in aql_indexes:
+            aql_cache_file = AqlCacheManager.get_aql_cache_path(aql_cache_dir, repo_name)
+            aql_data = self._load_aql_cache(aql_cache_file)
+            aql_indexes[repo_name] = self._index_aql(aql_data) if aql_data is not None else None
+        aql_index = aql_indexes[repo_name]
         
-        if aql_data is None:
+        if aql_index is None:
             # Cache miss - add to missing artifacts list
             if repo_name not in missing_artifacts_by_repo:
                 missing_artifacts_by_repo[repo_name] = []
@@ -226,109 +238,107 @@ class JfrogVulnerabilityProcessor:
         # Try to match artifact using cached AQL data
         matched_repo = self._match_artifact_to_repository(
             artifact_key, vuln_data, repo_name, path, name, 
-            aql_data, repo_build_names_map, artifacts_by_repo
+            aql_index, build_name_to_repo, artifacts_by_repo
         )
         
         return "matched" if matched_repo else "local"
     
-    def _parse_artifact_path(self, artifact_key: str) -> Optional[Tuple[str, str, str, str]]:
-        """Parse artifact path into components (simplified version of Product._parse_artifact_path)"""
-        # This is a simplified implementation - you may need to implement the full parsing logic
-        # from the original Product._parse_artifact_path method
+    @staticmethod
+    @functools.lru_cache(maxsize=ARTIFACT_PATH_CACHE_SIZE)
+    def _parse_artifact_path(artifact_key: str) -> Optional[Tuple[str, str, str, str]]:
+        """Parse artifact path into components (memoized - parsing is pure)"""
         try:
             if "://" in artifact_key:
-                # Handle docker://... format
-                parts = artifact_key.split("/")
-                if len(parts) >= 3:
-                    repo_name = parts[1] if len(parts) > 1 else ""
-                    name = parts[-1] if parts else ""
-                    path = "/".join(parts[2:-1]) if len(parts) > 3 else ""
-                    return repo_name, path, name, artifact_key
-            else:
-                # Handle regular path format
-                parts = artifact_key.split("/")
-                if len(parts) >= 2:
-                    repo_name = parts[0]
-                    name = parts[-1]
-                    path = "/".join(parts[1:-1]) if len(parts) > 2 else ""
-                    return repo_name, path, name, artifact_key
+                # Handle docker://... format: the first '/' is inside '://', so the repo name is the empty
+                # segment between the slashes and the segment after the scheme lands in path
+                # ('docker://staging/scoring-manager:5f0b' -> ('', 'staging', 'scoring-manager:5f0b', ...))
+                _, _, rest = artifact_key.partition("/")
+                repo_name, _, rest = rest.partition("/")
+                path, _, name = rest.rpartition("/")
+                return repo_name, path, name, artifact_key
+            # Handle regular path format
+            return ArtifactParser.parse_artifact_path(artifact_key)
         except Exception as e:
             logger.error("Error parsing artifact path '%s': %s", artifact_key, str(e))
         
         return None
     
     def _is_local_repo(self, repo_name: str) -> bool:
-        """Check if repository is a local repository"""
-        # Simplified logic - implement based on your repository naming conventions
-        return "local" in repo_name.lower()
+        """Check if repository is a local repository (see ArtifactParser.is_local_repo)"""
+        return ArtifactParser.is_local_repo(repo_name)
     
     def _load_aql_cache(self, cache_file: str) -> Optional[Dict]:
         """Load AQL cache data from file"""
-        try:
-            if os.path.exists(cache_file):
-                import json
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            logger.error("Error loading AQL cache from '%s': %s", cache_file, str(e))
-        return None
+        return AqlCacheManager.load_aql_cache(cache_file)
+    
+    @staticmethod
+    def _index_aql(aql_data: Dict) -> Dict[Tuple[str, str], List[Dict]]:
+        """
+        Index AQL result entries by (path, name), keeping duplicated artifacts in result order
+        
+        Args:
+            aql_data (Dict): AQL response data
+            
+        Returns:
+            Dict[Tuple[str, str], List[Dict]]: AQL entries by artifact path and name
+        """
+        aql_index = {}
+        if aql_data and isinstance(aql_data, dict):
+            for aql_entry in aql_data.get('results', []):
+                key = (aql_entry.get('path', ''), aql_entry.get('name', ''))
+                aql_index.setdefault(key, []).append(aql_entry)
+        return aql_index
     
     def _match_artifact_to_repository(self, artifact_key: str, vuln_data: Dict, repo_name: str, 
-                                    path: str, name: str, aql_data: Dict, repo_build_names_map: Dict,
+                                    path: str, name: str, aql_index: Dict, build_name_to_repo: Dict,
                                     artifacts_by_repo: Dict) -> bool:
-        """Match artifact to repository using AQL data and build names"""
+        """Match artifact to repository using indexed AQL data and build names"""
         try:
-            # Search through AQL data to find which build this artifact belongs to
-            if aql_data and isinstance(aql_data, dict):
-                results = aql_data.get('results', [])
-                for aql_entry in results:
-                    # Check if this AQL entry matches our artifact
-                    aql_path = aql_entry.get('path', '')
-                    aql_name = aql_entry.get('name', '')
+            # Look up the AQL entries of this artifact to find which build it belongs to
+            if aql_index:
+                for aql_entry in aql_index.get((path, name), ()):
+                    # Found matching AQL entry, extract build name and other properties
+                    properties = aql_entry.get('properties', [])
+                    build_name = self._extract_property_value(properties, 'build.name')
+                    build_number = self._extract_property_value(properties, 'build.number')
+                    build_timestamp = self._extract_property_value(properties, 'build.timestamp')
+                    sha256 = self._extract_property_value(properties, 'sha256')
                     
-                    if aql_path == path and aql_name == name:
-                        # Found matching AQL entry, extract build name and other properties
-                        properties = aql_entry.get('properties', [])
-                        build_name = self._extract_property_value(properties, 'build.name')
-                        build_number = self._extract_property_value(properties, 'build.number')
-                        build_timestamp = self._extract_property_value(properties, 'build.timestamp')
-                        sha256 = self._extract_property_value(properties, 'sha256')
+                    if build_name:
+                        # Extract the actual build name from the full path
+                        extracted_build_name = self._extract_build_name_from_path(build_name)
                         
-                        if build_name:
-                            # Extract the actual build name from the full path
-                            extracted_build_name = self._extract_build_name_from_path(build_name)
+                        # Try to find which repository this build belongs to
+                        project_repo_name = build_name_to_repo.get(extracted_build_name)
+                        if project_repo_name is not None:
+                            # Match found! Create and add artifact to this project repository
+                            from src.models.vulnerabilities import DeployedArtifact
                             
-                            # Try to find which repository this build belongs to
-                            for project_repo_name, build_names in repo_build_names_map.items():
-                                if extracted_build_name in build_names:
-                                    # Match found! Create and add artifact to this project repository
-                                    from src.models.vulnerabilities import DeployedArtifact
-                                    
-                                    artifact = DeployedArtifact(
-                                        artifact_key=artifact_key,
-                                        repo_name=repo_name,  # Use JFrog repo name (e.g., cyberint-docker-local)
-                                        critical_count=vuln_data.get('vulnerabilities', {}).get('critical', 0),
-                                        high_count=vuln_data.get('vulnerabilities', {}).get('high', 0),
-                                        medium_count=vuln_data.get('vulnerabilities', {}).get('medium', 0),
-                                        low_count=vuln_data.get('vulnerabilities', {}).get('low', 0),
-                                        unknown_count=vuln_data.get('vulnerabilities', {}).get('unknown', 0),
-                                        artifact_type=self._determine_artifact_type(artifact_key),
-                                        build_name=extracted_build_name,  # Use extracted build name
-                                        build_number=build_number,
-                                        build_timestamp=build_timestamp,
-                                        created_at=aql_entry.get('created', ''),
-                                        updated_at=aql_entry.get('updated', ''),
-                                        sha256=sha256
-                                    )
-                                    
-                                    if project_repo_name not in artifacts_by_repo:
-                                        artifacts_by_repo[project_repo_name] = []
-                                    artifacts_by_repo[project_repo_name].append(artifact)
-                                    
-                                    logger.debug("Matched artifact '%s' to repository '%s' via build '%s' (extracted from '%s')", 
-                                               artifact_key, project_repo_name, extracted_build_name, build_name)
-                                    return True
-            
+                            artifact = DeployedArtifact(
+                                artifact_key=artifact_key,
+                                repo_name=repo_name,  # Use JFrog repo name (e.g., cyberint-docker-local)
+                                critical_count=vuln_data.get('vulnerabilities', {}).get('critical', 0),
+                                high_count=vuln_data.get('vulnerabilities', {}).get('high', 0),
+                                medium_count=vuln_data.get('vulnerabilities', {}).get('medium', 0),
+                                low_count=vuln_data.get('vulnerabilities', {}).get('low', 0),
+                                unknown_count=vuln_data.get('vulnerabilities', {}).get('unknown', 0),
+                                artifact_type=self._determine_artifact_type(artifact_key),
+                                build_name=extracted_build_name,  # Use extracted build name
+                                build_number=build_number,
+                                build_timestamp=build_timestamp,
+                                created_at=aql_entry.get('created', ''),
+                                updated_at=aql_entry.get('updated', ''),
+                                sha256=sha256
+                            )
+                            
+                            if project_repo_name not in artifacts_by_repo:
+                                artifacts_by_repo[project_repo_name] = []
+                            artifacts_by_repo[project_repo_name].append(artifact)
+                            
+                            logger.debug("Matched artifact '%s' to repository '%s' via build '%s' (extracted from '%s')", 
+                                       artifact_key, project_repo_name, extracted_build_name, build_name)
+                            return True
+        
             # No match found
             return False
             
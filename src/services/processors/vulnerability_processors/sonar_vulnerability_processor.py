@@ -7,7 +7,7 @@ Extracted from the Product class to provide specialized vulnerability processing
 
 import os
 import logging
-from typing import List
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +45,38 @@ class SonarVulnerabilityProcessor:
         except ImportError as e:
             logger.error("Failed to import CompassClient: %s", str(e))
     
-    def process_vulnerabilities(self, repositories: List) -> int:
+    def fetch_sonar_data(self) -> Tuple[dict, dict]:
+        """
+        Fetch SonarQube issues and secrets from Compass API (no repository is touched, safe to run in a thread)
+        
+        Returns:
+            Tuple[dict, dict]: (issues by project key, secrets by project key), both empty when unavailable
+        """
+        if not self.compass_client:
+            return {}, {}
+        
+        try:
+            sonar_issues = self.compass_client.fetch_sonarqube_issues(self.organization_id)
+            if not sonar_issues:
+                logger.info("No SonarQube issues data returned for organization '%s'", self.organization_id)
+                return {}, {}
+            
+            sonar_secrets = self.compass_client.fetch_sonarqube_secrets(self.organization_id)
+            logger.info("Fetched SonarQube secrets data for %d projects", len(sonar_secrets))
+            return sonar_issues, sonar_secrets
+            
+        except (ValueError, KeyError, OSError) as e:
+            logger.error("Error loading Sonar code issues data for product '%s': %s", self.product_name, str(e))
+            return {}, {}
+    
+    def process_vulnerabilities(self, repositories: List, sonar_data: Optional[Tuple[dict, dict]] = None) -> int:
         """
         Load SonarQube vulnerability data for repositories
         
         Args:
             repositories (List): List of repository objects to update
+            sonar_data (Optional[Tuple[dict, dict]]): Issues and secrets prefetched with fetch_sonar_data
+                (fetched here when omitted)
             
         Returns:
             int: Number of repositories updated with vulnerability data
@@ -60,26 +86,24 @@ class SonarVulnerabilityProcessor:
             return 0
         
         try:
-            # Fetch SonarQube issues and secrets data
-            sonar_issues = self.compass_client.fetch_sonarqube_issues(self.organization_id)
+            sonar_issues, sonar_secrets = sonar_data if sonar_data is not None else self.fetch_sonar_data()
             if not sonar_issues:
-                logger.info("No SonarQube issues data returned for organization '%s'", self.organization_id)
                 return 0
             
-            sonar_secrets = self.compass_client.fetch_sonarqube_secrets(self.organization_id)
-            logger.info("Fetched SonarQube secrets data for %d projects", len(sonar_secrets))
-            
             updated_count = 0
             
             # Get Sonar prefix for this product
             sonar_prefix = self._get_sonar_prefix()
             
+            # Index repositories by name once instead of scanning them for every Sonar project
+            repo_by_name = self._index_repositories_by_name(repositories)
+            
             # Process SonarQube issues data
             for project_key, issues_data in sonar_issues.items():
                 repo_name = self._extract_repo_name_from_project_key(project_key, sonar_prefix)
                 
                 # Find matching repository
-                matching_repo = self._find_matching_repository(repositories, repo_name)
+                matching_repo = repo_by_name.get(repo_name)
                 
                 if matching_repo:
                     # Process and update repository with Sonar issues and secrets
@@ -117,12 +141,12 @@ class SonarVulnerabilityProcessor:
             # No prefix or prefix doesn't match, use project key as-is
             return project_key
     
-    def _find_matching_repository(self, repositories: List, repo_name: str):
-        """Find repository that matches the given name"""
+    def _index_repositories_by_name(self, repositories: List) -> dict:
+        """Map repository name -> repository (the first repository wins for duplicate names)"""
+        repo_by_name = {}
         for repo in repositories:
-            if repo.get_repository_name() == repo_name:
-                return repo
-        return None
+            repo_by_name.setdefault(repo.get_repository_name(), repo)
+        return repo_by_name
     
     def _process_sonar_issues(self, repository, issues_data: dict, sonar_secrets: dict, project_key: str) -> bool:
         """Process SonarQube issues and secrets for a repository"""
@@ -6,6 +6,7 @@ This module orchestrates the loading of vulnerability data from various sources
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 logger = logging.getLogger(__name__)
@@ -64,15 +65,22 @@ class VulnerabilityCoordinator:
             'total_repos': len(repositories)
         }
         
-        # Load JFrog vulnerabilities
-        if self.jfrog_processor:
-            results['jfrog_updated'] = self.jfrog_processor.process_vulnerabilities(repositories)
-        else:
-            logger.warning("JfrogVulnerabilityProcessor not available, skipping JFrog vulnerability loading")
+        # Fetch Sonar issues and secrets in the background while JFrog vulnerabilities load; repositories
+        # are only updated on this thread (JFrog first, then Sonar), so no Vulnerabilities is created twice
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sonar_future = executor.submit(self.sonar_processor.fetch_sonar_data) if self.sonar_processor else None
+            
+            # Load JFrog vulnerabilities
+            if self.jfrog_processor:
+                results['jfrog_updated'] = self.jfrog_processor.process_vulnerabilities(repositories)
+            else:
+                logger.warning("JfrogVulnerabilityProcessor not available, skipping JFrog vulnerability loading")
+            
+            sonar_data = sonar_future.result() if sonar_future else None
         
         # Load Sonar vulnerabilities
         if self.sonar_processor:
-            results['sonar_updated'] = self.sonar_processor.process_vulnerabilities(repositories)
+            results['sonar_updated'] = self.sonar_processor.process_vulnerabilities(repositories, sonar_data)
         else:
             logger.warning("SonarVulnerabilityProcessor not available, skipping Sonar vulnerability loading")
         
@@ -2,56 +2,108 @@ import collections.abc
 from typing import Any, Set
 
 
+# Exact types dispatched with a single type() lookup; subclasses go through the isinstance checks
+_PRIMITIVE_TYPES = frozenset((type(None), bool, int, float, str))
+_SEQUENCE_TYPES = frozenset((list, tuple, set))
+
+# Class -> (attribute names, public attribute names) of the last serialized instance
+_CLASS_FIELDS = {}
+
+
+def _public_keys(obj_type: type, obj_dict: dict) -> tuple:
+    """
+    Get the public (not underscore-prefixed) attribute names of an instance, reusing the
+    names computed for the previous instance of the same class when its attributes match.
+    """
+    keys = tuple(obj_dict)
+    cached = _CLASS_FIELDS.get(obj_type)
+    if cached is None or cached[0] != keys:
+        cached = (keys, tuple(k for k in keys if not k.startswith('_')))  # skip private/protected/internal
+        _CLASS_FIELDS[obj_type] = cached
+    return cached[1]
+
+
 def serialize_recursive(obj: Any, _visited: Set[int] = None) -> Any:
     """
     Recursively serialize an object to a JSON-serializable structure (dict, list, primitives).
     Handles nested custom objects, lists, dicts, and cycle detection.
+    Nested objects are walked with an explicit stack, so depth is not bound by the recursion limit.
     Args:
         obj: The object to serialize.
         _visited: Set of object ids already visited (for cycle detection).
     Returns:
         A JSON-serializable representation of the object.
     """
-
-    # Primitives (do NOT add to _visited, avoids false cycle detection for bool/int/str/float/None)
-    if obj is None or isinstance(obj, (bool, int, float, str)):
-        return obj
-
     if _visited is None:
         _visited = set()
 
-    # Cycle detection (for non-primitives only)
-    obj_id = id(obj)
-    if obj_id in _visited:
-        return f"<cycle: {type(obj).__name__}>"
-    _visited.add(obj_id)
-
-    # List, tuple, set
-    if isinstance(obj, (list, tuple, set)):
-        return [serialize_recursive(item, _visited) for item in obj]
-
-    # Dict
-    if isinstance(obj, dict):
-        return {str(k): serialize_recursive(v, _visited) for k, v in obj.items()}
-
-    # Namedtuple
-    if isinstance(obj, tuple) and hasattr(obj, '_fields'):
-        return {field: serialize_recursive(getattr(obj, field), _visited) for field in obj._fields}
-
-    # Custom class (has __dict__ or __slots__)
-    if hasattr(obj, '__dict__'):
-        result = {}
-        for key, value in obj.__dict__.items():
-            if key.startswith('_'):
-                continue  # skip private/protected/internal
-            result[key] = serialize_recursive(value, _visited)
-        return result
-    if hasattr(obj, '__slots__'):
-        result = {}
-        for key in obj.__slots__:
-            value = getattr(obj, key, None)
-            result[key] = serialize_recursive(value, _visited)
-        return result
-
-    # Fallback: string representation
-    return str(obj)
+    # Each stack entry is (object, parent result, key in parent). Every container result is
+    # created with placeholders and filled in as its children are popped; children are pushed
+    # in reverse so they are visited in the same (depth-first, in-order) order as recursion
+    root = [None]
+    stack = [(obj, root, 0)]
+    while stack:
+        obj, parent, key = stack.pop()
+        obj_type = type(obj)
+
+        # Primitives (do NOT add to _visited, avoids false cycle detection for bool/int/str/float/None)
+        if obj_type in _PRIMITIVE_TYPES or isinstance(obj, (bool, int, float, str)):
+            parent[key] = obj
+            continue
+
+        # Primitives-only containers cannot be part of a cycle: copy them as-is, without cycle bookkeeping
+        if obj_type in _SEQUENCE_TYPES or isinstance(obj, (list, tuple, set)):
+            if all(type(item) in _PRIMITIVE_TYPES for item in obj):
+                parent[key] = list(obj)
+                continue
+        elif isinstance(obj, (dict, collections.abc.Mapping)):
+            if all(type(k) is str and type(v) in _PRIMITIVE_TYPES for k, v in obj.items()):
+                parent[key] = dict(obj)
+                continue
+
+        # Cycle detection (for non-primitives only)
+        obj_id = id(obj)
+        if obj_id in _visited:
+            parent[key] = f"<cycle: {obj_type.__name__}>"
+            continue
+        _visited.add(obj_id)
+
+        # List, tuple, set
+        if obj_type in _SEQUENCE_TYPES or isinstance(obj, (list, tuple, set)):
+            items = list(obj)
+            result = [None] * len(items)
+            children = [(item, result, index) for index, item in enumerate(items)]
+
+        # Dict (and read-only mappings such as OwnerRecord)
+        elif isinstance(obj, (dict, collections.abc.Mapping)):
+            result = {}
+            children = []
+            for k, v in obj.items():
+                str_key = str(k)
+                result[str_key] = None
+                children.append((v, result, str_key))
+
+        # Namedtuple
+        elif isinstance(obj, tuple) and hasattr(obj, '_fields'):
+            result = dict.fromkeys(obj._fields)
+            children = [(getattr(obj, field), result, field) for field in obj._fields]
+
+        # Custom class (has __dict__ or __slots__)
+        elif hasattr(obj, '__dict__'):
+            obj_dict = obj.__dict__
+            public_keys = _public_keys(obj_type, obj_dict)
+            result = dict.fromkeys(public_keys)
+            children = [(obj_dict[k], result, k) for k in public_keys]
+        elif hasattr(obj, '__slots__'):
+            result = dict.fromkeys(obj.__slots__)
+            children = [(getattr(obj, k, None), result, k) for k in obj.__slots__]
+
+        # Fallback: string representation
+        else:
+            parent[key] = str(obj)
+            continue
+
+        parent[key] = result
+        stack.extend(reversed(children))
+
+    return root[0]
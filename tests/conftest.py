@@ -0,0 +1,242 @@
+"""
+Shared pytest configuration - loads environment variables from .env
+(the repository root is put on sys.path by pytest.ini's pythonpath)
+"""
+
+import copy
+import os
+import pickle
+from contextlib import contextmanager
+from pathlib import Path
+import pytest
+from dotenv import load_dotenv
+
+try:
+    import requests_cache
+except ImportError:  # optional - only needed for --http-cache
+    requests_cache = None
+
+try:
+    import vcr
+except ImportError:  # optional - installed with pytest-recording; without it session fixtures call the live APIs
+    vcr = None
+
+# Load .env once per session, before test modules import src (which reads settings at import time)
+load_dotenv()
+
+# Offline snapshots of live integration data (recorded with --record)
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# On-disk HTTP response cache shared by live integration test runs (--http-cache)
+HTTP_CACHE_NAME = str(Path(__file__).resolve().parent / ".http_cache")
+HTTP_CACHE_EXPIRE_SECONDS = 12 * 3600  # one working day of local reruns / cassette recording
+
+# Request headers scrubbed from recorded VCR cassettes (API tokens are sent as Bearer authorization or API keys)
+VCR_FILTERED_HEADERS = ["authorization", "x-api-key"]
+
+# Cassette record mode unless --record-mode is given: replay only, or RECORD=new to append new requests
+VCR_RECORD_MODE = "new_episodes" if os.getenv('RECORD') == 'new' else "none"
+
+# Recorded HTTP traffic replayed by the integration tests (VCR cassettes)
+CASSETTE_DIR = Path(__file__).resolve().parent / "cassettes"
+
+# Bypass the recorded cassettes and call the live APIs (e.g. nightly runs)
+LIVE_API = os.getenv('LIVE_API') == '1'
+
+# Reuse the fully loaded Cyberint Product pickled by a previous run (local iteration only - CI loads fresh data)
+CACHE_PRODUCT = os.getenv('PYTEST_CACHE_PRODUCT') == '1'
+
+# Per-test limit (pytest-timeout) for integration tests without their own timeout mark, so a hung API call
+# fails the test instead of stalling the run; generous because it includes loading the shared session fixtures
+INTEGRATION_TEST_TIMEOUT_SECONDS = 600
+
+# Wall-time budget of an integration test body replayed from cassettes (fixture setup excluded);
+# a passing test over budget is reported as failed so runtime regressions are caught in CI
+INTEGRATION_TEST_BUDGET_SECONDS = 15
+
+
+def pytest_addoption(parser):
+    """Add the --record option used to refresh the offline snapshots from live integration tests"""
+    parser.addoption("--record", action="store_true", default=False,
+                     help="record live integration data as offline snapshots under tests/fixtures")
+    parser.addoption("--http-cache", "--use-requests-cache", action="store_true", default=False,
+                     help="serve repeated live API GET requests from an on-disk cache (requires requests-cache)")
+
+
+def pytest_configure(config):
+    """Install the on-disk HTTP response cache when --http-cache is given"""
+    if not config.getoption("--http-cache"):
+        return
+    if requests_cache is None:
+        raise pytest.UsageError("--http-cache requires the requests-cache package")
+    requests_cache.install_cache(HTTP_CACHE_NAME, backend='sqlite', expire_after=HTTP_CACHE_EXPIRE_SECONDS)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Apply the default timeout to integration tests (only enforced when pytest-timeout is installed)"""
+    for item in items:
+        if item.get_closest_marker("integration") and not item.get_closest_marker("timeout"):
+            item.add_marker(pytest.mark.timeout(INTEGRATION_TEST_TIMEOUT_SECONDS))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Fail replayed integration tests whose body exceeds INTEGRATION_TEST_BUDGET_SECONDS. Only enforced for
+    @pytest.mark.vcr tests that actually replay their cassette: live-only tests, LIVE_API=1 and cassettes that
+    were never recorded call the live APIs (see the disable_recording override)
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if (report.when == "call" and report.passed and vcr is not None
+            and item.get_closest_marker("integration") and item.get_closest_marker("vcr")
+            # disable_recording is only set up (by pytest-recording) for vcr tests; False means the cassette is used
+            and item.funcargs.get("disable_recording") is False
+            and report.duration > INTEGRATION_TEST_BUDGET_SECONDS):
+        report.outcome = "failed"
+        report.longrepr = (f"Runtime budget exceeded: {report.duration:.1f}s > {INTEGRATION_TEST_BUDGET_SECONDS}s "
+                           f"(INTEGRATION_TEST_BUDGET_SECONDS in tests/conftest.py)")
+
+
+def _cassette_record_mode(config) -> str:
+    """pytest-recording's --record-mode if given, otherwise VCR_RECORD_MODE"""
+    return config.getoption("--record-mode", default=None) or VCR_RECORD_MODE
+
+
+def _use_cassette(config, cassette_file: Path) -> bool:
+    """
+    Whether HTTP traffic goes through a cassette: not with LIVE_API=1, and not when replaying (record mode none)
+    a cassette that was never recorded - those calls go to the live APIs as before cassettes existed
+    """
+    return not LIVE_API and (cassette_file.exists() or _cassette_record_mode(config) != "none")
+
+
+@pytest.fixture(scope="module")
+def vcr_config() -> dict:
+    """pytest-recording configuration for tests marked @pytest.mark.vcr (cassettes live in tests/cassettes)"""
+    return {"filter_headers": VCR_FILTERED_HEADERS, "record_mode": VCR_RECORD_MODE}
+
+
+@pytest.fixture
+def disable_recording(request, vcr_cassette_dir, default_cassette_name) -> bool:
+    """Overrides pytest-recording's fixture: tests without a usable cassette (see _use_cassette) call the live APIs"""
+    return not _use_cassette(request.config, Path(vcr_cassette_dir) / f"{default_cassette_name}.yaml")
+
+
+@pytest.fixture(scope="session")
+def session_cassette(request):
+    """
+    Context manager factory replaying the HTTP traffic of session-scoped fixtures from tests/cassettes/<name>.yaml.
+    (@pytest.mark.vcr only covers function-scoped setup.) Uses pytest-recording's --record-mode (default:
+    VCR_RECORD_MODE); LIVE_API=1, a cassette that was never recorded, or a missing pytest-recording install
+    calls the live APIs instead.
+    """
+    record_mode = _cassette_record_mode(request.config)
+
+    @contextmanager
+    def use_cassette(name: str):
+        if vcr is None or not _use_cassette(request.config, CASSETTE_DIR / f"{name}.yaml"):
+            yield
+            return
+        recorder = vcr.VCR(cassette_library_dir=str(CASSETTE_DIR), record_mode=record_mode,
+                           filter_headers=VCR_FILTERED_HEADERS)
+        with recorder.use_cassette(f"{name}.yaml"):
+            yield
+
+    return use_cassette
+
+
+@pytest.fixture(scope="session")
+def cyberint_product_cache_file(request) -> Path:
+    """Pickled Cyberint Products (with and without vulnerabilities) kept in the pytest cache directory"""
+    return Path(request.config.cache.mkdir("cyberint_product")) / "cyberint_product.pkl"
+
+
+@pytest.fixture(scope="session")
+def cached_cyberint_product(cyberint_product_cache_file):
+    """
+    Cyberint Products pickled by a previous run when PYTEST_CACHE_PRODUCT=1, otherwise None:
+    {'ci': repositories and CI data, 'vulns': the same plus vulnerabilities}
+    """
+    if not CACHE_PRODUCT or not cyberint_product_cache_file.exists():
+        return None
+    return pickle.loads(cyberint_product_cache_file.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def cyberint_with_repos_only(session_cassette):
+    """
+    Cyberint Product with only its repositories loaded, fetched from the SCM once per session.
+    Never mutate it: fixtures that load more data work on a copy.deepcopy of it.
+    """
+    from src.models.product import Product
+    from CONSTANTS import PRODUCT_SCM_TYPE, PRODUCT_ORGANIZATION_ID
+
+    product = Product(
+        name="Cyberint",
+        scm_type=PRODUCT_SCM_TYPE["Cyberint"],
+        organization_id=PRODUCT_ORGANIZATION_ID["Cyberint"]
+    )
+    with session_cassette("cyberint_repos"):
+        product.load_repositories()
+    return product
+
+
+@pytest.fixture(scope="session")
+def cyberint_product(request, session_cassette, cached_cyberint_product):
+    """Cyberint Product with repositories and CI data loaded once per session (tests must treat it as read-only)"""
+    if cached_cyberint_product is not None:
+        return cached_cyberint_product['ci']
+
+    # Requested lazily, so a pickled product skips the SCM fetch entirely
+    product = copy.deepcopy(request.getfixturevalue("cyberint_with_repos_only"))
+    with session_cassette("cyberint_product"):
+        product.load_ci_data()
+    return product
+
+
+@pytest.fixture(scope="session")
+def cyberint_repos_by_name(cyberint_product) -> dict:
+    """Repository name -> repository of the shared Cyberint Product, for O(1) lookups"""
+    return {repo.get_repository_name(): repo for repo in cyberint_product.repos}
+
+
+@pytest.fixture(scope="session")
+def sonar_integrated_repos(cyberint_product) -> list:
+    """Repositories of the shared Cyberint Product with Sonar CI integration, filtered once per session"""
+    return [repo for repo in cyberint_product.repos if repo.ci_status and repo.ci_status.sonar_status.is_exist]
+
+
+@pytest.fixture(scope="session")
+def cyberint_product_with_vulns(cyberint_product, session_cassette, cached_cyberint_product,
+                                cyberint_product_cache_file):
+    """
+    Copy of the shared Cyberint Product with vulnerability data loaded as well (only paid for by tests that
+    need it); the shared product is never mutated, so CI-only tests do not depend on test order
+    """
+    if cached_cyberint_product is not None:
+        return cached_cyberint_product['vulns']
+
+    vuln_product = copy.deepcopy(cyberint_product)
+    with session_cassette("cyberint_product_vulns"):
+        vuln_product.load_vulnerabilities()
+
+    if CACHE_PRODUCT:
+        # Write then rename, so parallel workers never read a partial pickle
+        tmp_file = cyberint_product_cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps({'ci': cyberint_product, 'vulns': vuln_product},
+                                          protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, cyberint_product_cache_file)
+    return vuln_product
+
+
+@pytest.fixture(scope="session")
+def record_snapshots(request) -> bool:
+    """Whether live integration tests should record their data as offline snapshots"""
+    return request.config.getoption("--record")
+
+
+@pytest.fixture(scope="session")
+def snapshot_dir() -> Path:
+    """Directory holding the offline snapshots"""
+    return SNAPSHOT_DIR
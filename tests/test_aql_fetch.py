@@ -3,18 +3,16 @@ Test AQL artifact fetch and parsing logic for JFrog vulnerability processing
 """
 
 import pytest
-import sys
 import os
 import responses
+import logging
 from unittest.mock import patch, MagicMock
 
-# Add src and root to path for imports  
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from src.services.data_loader import JfrogClient
 from src.models.product import Product
 
+logger = logging.getLogger(__name__)
+
 
 class TestAqlArtifactFetch:
     """Test AQL artifact fetch and parsing logic"""
@@ -131,52 +129,62 @@ class TestAqlArtifactFetch:
         assert result["results"] == []
 
 
+# Repository used by the real AQL integration tests (known to exist)
+REAL_AQL_REPO_NAME = "cyberint-docker-local"
+# Read once at import (.env is loaded by conftest.py)
+CYBERINT_JFROG_TOKEN = os.getenv('CYBERINT_JFROG_ACCESS_TOKEN')
+
+
+@pytest.fixture(scope="session")
+def real_jfrog_client():
+    """Create JfrogClient with real environment token (shared by all integration tests)"""
+    if not CYBERINT_JFROG_TOKEN:
+        pytest.skip("CYBERINT_JFROG_ACCESS_TOKEN not found in environment")
+    
+    return JfrogClient(access_token=CYBERINT_JFROG_TOKEN)
+
+
+@pytest.fixture(scope="session")
+def aql_cyberint_response(real_jfrog_client):
+    """
+    Stream the real full-repository AQL response once per session, saving it to a file
+    for investigation (one artifact per line) and keeping the first artifacts for assertions
+    """
+    import json
+    results = []
+    total = 0
+    output_file = f"aql_response_{REAL_AQL_REPO_NAME}.jsonl"
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for artifact in real_jfrog_client.query_aql_artifacts_iter(REAL_AQL_REPO_NAME):
+            assert isinstance(artifact, dict)
+            f.write(json.dumps(artifact) + '\n')
+            total += 1
+            if len(results) < 3:
+                results.append(artifact)
+    logger.info("Full AQL response (%s artifacts) saved to: %s", total, output_file)
+    return {"results": results, "total": total}
+
+
+@pytest.mark.integration
 class TestAqlRealIntegration:
     """Test AQL functionality with real JFrog calls"""
     
-    @pytest.fixture
-    def real_jfrog_client(self):
-        """Create JfrogClient with real environment token"""
-        from dotenv import load_dotenv
-        load_dotenv()
-        
-        token = os.getenv('CYBERINT_JFROG_ACCESS_TOKEN')
-        if not token:
-            pytest.skip("CYBERINT_JFROG_ACCESS_TOKEN not found in environment")
-        
-        return JfrogClient(access_token=token)
-    
-    def test_real_aql_full_repo_query(self, real_jfrog_client):
+    def test_real_aql_full_repo_query(self, aql_cyberint_response):
         """Test real AQL query against a JFrog repository"""
-        # Use cyberint-docker-local as it's known to exist
-        repo_name = "cyberint-docker-local"
+        repo_name = REAL_AQL_REPO_NAME
         
         # Print the AQL query that will be used (matches actual implementation)
         expected_query = f'items.find({{"repo": {{"$eq": "{repo_name}"}}, "type": "file"}}).include("property")'
-        print(f"AQL Query being used: {expected_query}")
-        
-        result = real_jfrog_client.query_aql_artifacts(repo_name)
-        
-        # Save the full result to a file for investigation
-        import json
-        output_file = f"aql_response_{repo_name}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2)
-        print(f"Full AQL response saved to: {output_file}")
-        
-        # Verify we get a valid response structure
-        assert isinstance(result, dict)
-        assert "results" in result
-        assert isinstance(result["results"], list)
+        logger.info("AQL Query being used: %s", expected_query)
         
-        # Log the count for visibility
-        print(f"Found {len(result['results'])} artifacts in {repo_name}")
+        result = aql_cyberint_response
+        logger.info("Found %s artifacts in %s", result['total'], repo_name)
         
         # Print first few artifacts for debugging
         if result["results"]:
-            print("First 3 artifacts:")
+            logger.info("First 3 artifacts:")
             for i, artifact in enumerate(result["results"][:3]):
-                print(f"  {i+1}. {artifact}")
+                logger.info("  %s. %s", i+1, artifact)
             
             first_artifact = result["results"][0]
             assert "repo" in first_artifact
@@ -187,9 +195,9 @@ class TestAqlRealIntegration:
             # Check if properties are included
             if "properties" in first_artifact:
                 assert isinstance(first_artifact["properties"], list)
-                print(f"Sample artifact properties: {first_artifact['properties'][:3]}")
+                logger.info("Sample artifact properties: %s", first_artifact['properties'][:3])
         else:
-            print("No artifacts returned - this might indicate an issue with the query or repository access")
+            logger.info("No artifacts returned - this might indicate an issue with the query or repository access")
     
     def test_real_aql_error_handling(self, real_jfrog_client):
         """Test AQL error handling with invalid repository"""
@@ -202,7 +210,7 @@ class TestAqlRealIntegration:
         assert isinstance(result["results"], list)
         # May return empty results or actual error - both are valid handling
         
-        print(f"Error handling test returned {len(result['results'])} artifacts")
+        logger.info("Error handling test returned %s artifacts", len(result['results']))
 
 
 class TestProductVulnerabilityParsing:
@@ -3,44 +3,49 @@ Tests for CompassClient - test real Cyberint repository loading
 """
 
 import pytest
-import sys
 import os
-from dotenv import load_dotenv
-
-# Add src and root to path for imports  
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-# Load environment variables
-load_dotenv()
+import logging
 
 from src.services.data_loader import CompassClient
 from CONSTANTS import PRODUCT_SCM_TYPE, PRODUCT_ORGANIZATION_ID
 
+logger = logging.getLogger(__name__)
+
+# Every test in this module calls live services
+pytestmark = pytest.mark.integration
+
 
 # Cyberint constants for testing
 CYBERINT_SCM_TYPE = PRODUCT_SCM_TYPE["Cyberint"]  # bitbucket-onprem
 CYBERINT_ORG_ID = PRODUCT_ORGANIZATION_ID["Cyberint"]  # 2
 
+# Compass credentials, read once at import (.env is loaded by conftest.py)
+COMPASS_TOKEN = os.getenv('COMPASS_ACCESS_TOKEN')
+COMPASS_URL = os.getenv('COMPASS_BASE_URL')
+
+
+@pytest.fixture(scope="session")
+def compass_client():
+    """Create CompassClient with real environment variables (shared by all tests)"""
+    assert COMPASS_TOKEN, "COMPASS_ACCESS_TOKEN not found in environment"
+    assert COMPASS_URL, "COMPASS_BASE_URL not found in environment"
+    
+    return CompassClient(COMPASS_TOKEN, COMPASS_URL)
+
+
+@pytest.fixture(scope="session")
+def cyberint_repos(compass_client):
+    """Fetch the Cyberint repositories once per session"""
+    return compass_client.fetch_repositories(CYBERINT_SCM_TYPE, CYBERINT_ORG_ID)
+
 
 class TestCompassClientReal:
     """Test CompassClient with real Cyberint data"""
     
-    @pytest.fixture
-    def compass_client(self):
-        """Create CompassClient with real environment variables"""
-        token = os.getenv('COMPASS_ACCESS_TOKEN')
-        url = os.getenv('COMPASS_BASE_URL')
-        
-        assert token, "COMPASS_ACCESS_TOKEN not found in environment"
-        assert url, "COMPASS_BASE_URL not found in environment"
-        
-        return CompassClient(token, url)
-    
-    def test_cyberint_repository_count_above_100(self, compass_client):
+    @pytest.mark.xdist_group("cyberint_repos")
+    def test_cyberint_repository_count_above_100(self, cyberint_repos):
         """Test that Cyberint has more than 100 repositories"""
-        # Fetch repositories for Cyberint
-        repos = compass_client.fetch_repositories(CYBERINT_SCM_TYPE, CYBERINT_ORG_ID)
+        repos = cyberint_repos
         
         # Verify we got a list
         assert isinstance(repos, list), "Should return a list of repositories"
@@ -48,30 +53,28 @@ class TestCompassClientReal:
         # Verify we have more than 100 repositories
         assert len(repos) > 100, f"Expected more than 100 repos, got {len(repos)}"
         
-        print(f"✓ Cyberint has {len(repos)} repositories (> 100)")
+        logger.info("✓ Cyberint has %s repositories (> 100)", len(repos))
     
-    def test_cyberint_specific_repositories_exist(self, compass_client):
+    @pytest.mark.xdist_group("cyberint_repos")
+    def test_cyberint_specific_repositories_exist(self, cyberint_repos):
         """Test that specific repositories exist in Cyberint"""
-        # Fetch repositories for Cyberint
-        repos = compass_client.fetch_repositories(CYBERINT_SCM_TYPE, CYBERINT_ORG_ID)
+        repos = cyberint_repos
         
-        # Extract repository names
+        # Required repositories that should exist
+        required_repos = frozenset(['alert-service', 'frontend-service'])
+        
+        # Collect repository names, stopping as soon as all required repositories were seen
         repo_names = set()
         for repo in repos:
-            if 'repo_name' in repo:
-                repo_names.add(repo['repo_name'])
-            elif 'name' in repo:
-                repo_names.add(repo['name'])
-        
-        # Required repositories that should exist
-        required_repos = ['alert-service', 'frontend-service']
+            repo_names.add(repo.get('repo_name') or repo.get('name'))
+            if required_repos <= repo_names:
+                break
         
-        # Check each required repository
-        for required_repo in required_repos:
-            assert required_repo in repo_names, f"Repository '{required_repo}' not found in Cyberint repos"
-            print(f"✓ Found required repository: {required_repo}")
+        # Check all required repositories at once
+        missing_repos = required_repos - repo_names
+        assert not missing_repos, f"Repositories not found in Cyberint repos: {sorted(missing_repos)}"
         
-        print(f"✓ All required repositories found in {len(repos)} total repositories")
+        logger.info("✓ All required repositories found in %s total repositories", len(repos))
     
     def test_cyberint_connection(self, compass_client):
         """Test basic connection to Compass API for Cyberint"""
@@ -80,9 +83,9 @@ class TestCompassClientReal:
         
         # Should return a boolean (True if service available, False if not)
         assert isinstance(result, bool), "test_connection should return a boolean"
-        print(f"✓ Connection test result: {result}")
+        logger.info("✓ Connection test result: %s", result)
 
 
 if __name__ == "__main__":
     # Run tests with pytest
-    pytest.main([__file__, "-v", "-s"])
+    pytest.main([__file__, "-v"])
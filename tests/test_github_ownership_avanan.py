@@ -1,9 +1,16 @@
 import os
 import pytest
+import logging
 from src.models.product import Product
 from CONSTANTS import PRODUCT_SCM_TYPE, PRODUCT_ORGANIZATION_ID, PRODUCT_DEVOPS
 from src.models.devops import DevOps
 
+logger = logging.getLogger(__name__)
+
+# Every test in this module calls live services
+pytestmark = pytest.mark.integration
+
+
 def test_github_ownership_avanan():
     """
     Test that loading repositories for the Avanan product (GitHub SCM) triggers the GitHub ownership mechanism
@@ -24,10 +31,11 @@ def test_github_ownership_avanan():
 
     # For each repo, check that repo_owners is a list (may be empty if no reviewers)
     for repo in product.repos:
-        assert hasattr(repo, "repo_owners"), f"Repo {getattr(repo, 'get_repository_name', lambda: 'unknown')()} missing repo_owners attribute"
-        assert isinstance(repo.repo_owners, list), f"repo_owners is not a list for repo {getattr(repo, 'get_repository_name', lambda: 'unknown')()}"
+        repo_name = repo.get_repository_name() if hasattr(repo, 'get_repository_name') else 'unknown'
+        assert hasattr(repo, "repo_owners"), f"Repo {repo_name} missing repo_owners attribute"
+        assert isinstance(repo.repo_owners, list), f"repo_owners is not a list for repo {repo_name}"
         # Optionally, print the owners for manual inspection
-        print(f"Repo: {getattr(repo, 'get_repository_name', lambda: 'unknown')()} | Owners: {repo.repo_owners}")
+        logger.info("Repo: %s | Owners: %s", repo_name, repo.repo_owners)
 
     # Optionally, check that at least one repo has non-empty repo_owners (if data is available)
     assert any(repo.repo_owners for repo in product.repos), "No repo_owners found for any Avanan repo (check API credentials and data)"
@@ -3,27 +3,42 @@ Test JFrog CI integration - metadata-based approach for Avanan product
 """
 
 import pytest
-import sys
 import os
 import time
-from dotenv import load_dotenv
-
-# Add src and root to path for imports  
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-# Load environment variables
-load_dotenv()
+import json
+import logging
+from itertools import islice
+from operator import itemgetter
 
 from src.models.product import Product
-from src.services.data_loader import JfrogClient
+from src.services.clients.jfrog_clients.jfrog_client import JfrogClient
 from CONSTANTS import PRODUCT_SCM_TYPE, PRODUCT_ORGANIZATION_ID, PRODUCT_JFROG_PROJECT
 
+logger = logging.getLogger(__name__)
+
+# Every test in this module calls live services
+pytestmark = pytest.mark.integration
+
+# Read once at import (.env is loaded by conftest.py)
+AVANAN_JFROG_TOKEN = os.getenv('AVANAN_JFROG_ACCESS_TOKEN')
+
+@pytest.fixture(scope="session")
+def avanan_jfrog_client():
+    """Create JFrog client with the Avanan token (shared by all tests)"""
+    assert AVANAN_JFROG_TOKEN, "AVANAN_JFROG_ACCESS_TOKEN not found in environment"
+    return JfrogClient(AVANAN_JFROG_TOKEN)
+
+
+@pytest.fixture(scope="session")
+def avanan_project_builds(avanan_jfrog_client):
+    """Fetch the Avanan project build list once per session"""
+    return avanan_jfrog_client.fetch_all_project_builds(PRODUCT_JFROG_PROJECT["Avanan"])
+
 
 class TestJfrogCIMetadataIntegration:
     """Test JFrog CI integration using metadata-based approach with Avanan product"""
     
-    def test_avanan_load_repos_and_ci_data_metadata_based(self):
+    def test_avanan_load_repos_and_ci_data_metadata_based(self, record_snapshots, snapshot_dir):
         """Test loading repositories and CI data for Avanan using metadata-based approach"""
         # Create Avanan Product
         avanan_product = Product(
@@ -33,27 +48,28 @@ class TestJfrogCIMetadataIntegration:
         )
         
         # Load repositories with timing
-        print("Starting repository loading...")
+        logger.info("Starting repository loading...")
         repo_start_time = time.time()
         avanan_product.load_repositories()
         repo_end_time = time.time()
         repo_load_duration = repo_end_time - repo_start_time
         
-        print(f"Repository loading completed in {repo_load_duration:.2f} seconds")
+        logger.info("Repository loading completed in %.2f seconds", repo_load_duration)
         
         # Verify repositories were loaded - expecting above 200
-        assert len(avanan_product.repos) > 200, f"Expected more than 200 repos, got {len(avanan_product.repos)}"
-        print(f"Loaded {len(avanan_product.repos)} repositories for Avanan")
+        repo_count = len(avanan_product.repos)
+        assert repo_count > 200, f"Expected more than 200 repos, got {repo_count}"
+        logger.info("Loaded %s repositories for Avanan", repo_count)
         
         # Load CI data with timing (this will use metadata-based approach for Avanan)
-        print("Starting CI data loading (metadata-based approach)...")
+        logger.info("Starting CI data loading (metadata-based approach)...")
         ci_start_time = time.time()
         avanan_product.load_ci_data()
         ci_end_time = time.time()
         ci_load_duration = ci_end_time - ci_start_time
         
-        print(f"CI data loading completed in {ci_load_duration:.2f} seconds")
-        print(f"Total operation time: {(repo_load_duration + ci_load_duration):.2f} seconds")
+        logger.info("CI data loading completed in %.2f seconds", ci_load_duration)
+        logger.info("Total operation time: %.2f seconds", repo_load_duration + ci_load_duration)
         
         # Count repositories with JFrog CI
         repos_with_jfrog_ci = 0
@@ -61,57 +77,71 @@ class TestJfrogCIMetadataIntegration:
         repos_with_job_url = 0
         
         for repo in avanan_product.repos:
-            if repo.ci_status.jfrog_status.is_exist:
+            jfrog_status = repo.ci_status.jfrog_status
+            if jfrog_status.is_exist:
                 repos_with_jfrog_ci += 1
-                if repo.ci_status.jfrog_status.branch:
-                    repos_with_branch_info += 1
-                if repo.ci_status.jfrog_status.job_url:
-                    repos_with_job_url += 1
+                repos_with_branch_info += bool(jfrog_status.branch)
+                repos_with_job_url += bool(jfrog_status.job_url)
         
-        print(f"Found {repos_with_jfrog_ci} repositories with JFrog CI integration")
-        print(f"Found {repos_with_branch_info} repositories with branch information")
-        print(f"Found {repos_with_job_url} repositories with job URL information")
+        logger.info("Found %s repositories with JFrog CI integration", repos_with_jfrog_ci)
+        logger.info("Found %s repositories with branch information", repos_with_branch_info)
+        logger.info("Found %s repositories with job URL information", repos_with_job_url)
         
         # Performance metrics
-        print("\n=== PERFORMANCE METRICS ===")
-        print(f"Repository loading: {repo_load_duration:.2f} seconds ({len(avanan_product.repos)} repos)")
-        print(f"CI data loading: {ci_load_duration:.2f} seconds (metadata-based)")
-        print(f"Repos per second (loading): {len(avanan_product.repos) / repo_load_duration:.1f}")
-        print(f"CI matches per second: {repos_with_jfrog_ci / ci_load_duration:.1f}")
-        print(f"Total time: {(repo_load_duration + ci_load_duration):.2f} seconds")
+        logger.info("=== PERFORMANCE METRICS ===")
+        logger.info("Repository loading: %.2f seconds (%s repos)", repo_load_duration, repo_count)
+        logger.info("CI data loading: %.2f seconds (metadata-based)", ci_load_duration)
+        logger.info("Repos per second (loading): %.1f", repo_count / repo_load_duration)
+        logger.info("CI matches per second: %.1f", repos_with_jfrog_ci / ci_load_duration)
+        logger.info("Total time: %.2f seconds", repo_load_duration + ci_load_duration)
         
         # Verify that we have more than 60 repositories with CI (metadata-based approach)
         assert repos_with_jfrog_ci > 60, f"Expected more than 60 repos with CI, got {repos_with_jfrog_ci}"
         
         # Log some examples with metadata
-        ci_repos_with_metadata = []
-        for repo in avanan_product.repos:
-            if repo.ci_status.jfrog_status.is_exist:
-                metadata = {
+        sample_ci_repos = islice((repo for repo in avanan_product.repos
+                                  if repo.ci_status.jfrog_status.is_exist), 5)  # Show first 5
+        ci_repos_with_metadata = [
+            {
+                'repo_name': repo.scm_info.repo_name,
+                'branch': repo.ci_status.jfrog_status.branch,
+                'has_job_url': bool(repo.ci_status.jfrog_status.job_url)
+            }
+            for repo in sample_ci_repos
+        ]
+        
+        logger.info("Sample repositories with JFrog CI and metadata:")
+        for repo_meta in ci_repos_with_metadata:
+            logger.info("  - %s: branch=%s, has_url=%s", repo_meta['repo_name'], repo_meta['branch'], repo_meta['has_job_url'])
+        
+        # Record the loaded repositories (with JFrog CI status) as the offline snapshot test's JSON fixture
+        if record_snapshots:
+            snapshot = [
+                {
                     'repo_name': repo.scm_info.repo_name,
-                    'branch': repo.ci_status.jfrog_status.branch,
-                    'has_job_url': bool(repo.ci_status.jfrog_status.job_url)
+                    'full_name': repo.scm_info.full_name,
+                    'id': repo.scm_info.id,
+                    'default_branch': repo.scm_info.default_branch,
+                    'is_private': repo.scm_info.is_private,
+                    'jfrog_status': {
+                        'is_exist': repo.ci_status.jfrog_status.is_exist,
+                        'branch': repo.ci_status.jfrog_status.branch,
+                        'job_url': repo.ci_status.jfrog_status.job_url,
+                        'matched_build_names': sorted(repo.ci_status.jfrog_status.matched_build_names),
+                    },
                 }
-                ci_repos_with_metadata.append(metadata)
-                if len(ci_repos_with_metadata) >= 5:  # Show first 5
-                    break
-        
-        print("Sample repositories with JFrog CI and metadata:")
-        for repo_meta in ci_repos_with_metadata:
-            print(f"  - {repo_meta['repo_name']}: branch={repo_meta['branch']}, has_url={repo_meta['has_job_url']}")
+                for repo in avanan_product.repos
+            ]
+            snapshot_dir.mkdir(exist_ok=True)
+            with open(snapshot_dir / "avanan_repos.json", 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, indent=2)
+                f.write('\n')
+            logger.info("Recorded %s Avanan repositories to %s", repo_count, snapshot_dir / 'avanan_repos.json')
     
-    def test_avanan_jfrog_client_fetch_all_project_builds(self):
+    def test_avanan_jfrog_client_fetch_all_project_builds(self, avanan_project_builds):
         """Test JFrog client fetch_all_project_builds for Avanan project"""
-        # Get JFrog token for Avanan
-        jfrog_token = os.getenv('AVANAN_JFROG_ACCESS_TOKEN')
-        assert jfrog_token, "AVANAN_JFROG_ACCESS_TOKEN not found in environment"
-        
-        # Create JFrog client
-        jfrog_client = JfrogClient(jfrog_token)
-        
-        # Fetch build info for Avanan project (hec)
-        avanan_project = PRODUCT_JFROG_PROJECT["Avanan"]
-        build_data = jfrog_client.fetch_all_project_builds(avanan_project)
+        # Build info for Avanan project (hec)
+        build_data = avanan_project_builds
         
         # Verify we got data
         assert isinstance(build_data, dict), "Should return a dictionary"
@@ -130,23 +160,16 @@ class TestJfrogCIMetadataIntegration:
             assert isinstance(uri, str), f"Build {i} URI should be a string"
             assert uri.startswith('/'), f"Build {i} URI should start with '/', got: {uri}"
             
-            print(f"Build {i+1}: URI = {uri}")
+            logger.info("Build %s: URI = %s", i+1, uri)
         
-        print(f"Successfully verified {min(3, len(builds))} builds have URI fields starting with '/'")
-        print(f"Total builds found for Avanan: {len(builds)}")
+        logger.info("Successfully verified %s builds have URI fields starting with '/'", min(3, len(builds)))
+        logger.info("Total builds found for Avanan: %s", len(builds))
     
-    def test_avanan_jfrog_client_metadata_fetch(self):
+    def test_avanan_jfrog_client_metadata_fetch(self, avanan_jfrog_client, avanan_project_builds):
         """Test JFrog client metadata fetching capabilities for Avanan"""
-        # Get JFrog token for Avanan
-        jfrog_token = os.getenv('AVANAN_JFROG_ACCESS_TOKEN')
-        assert jfrog_token, "AVANAN_JFROG_ACCESS_TOKEN not found in environment"
-        
-        # Create JFrog client
-        jfrog_client = JfrogClient(jfrog_token)
-        
-        # Fetch build info for Avanan project
+        jfrog_client = avanan_jfrog_client
         avanan_project = PRODUCT_JFROG_PROJECT["Avanan"]
-        build_data = jfrog_client.fetch_all_project_builds(avanan_project)
+        build_data = avanan_project_builds
         
         # Get first build for metadata testing
         builds = build_data.get('builds', [])
@@ -155,7 +178,7 @@ class TestJfrogCIMetadataIntegration:
         first_build_uri = builds[0]['uri']
         build_name = first_build_uri.lstrip('/')
         
-        print(f"Testing metadata fetch for build: {build_name}")
+        logger.info("Testing metadata fetch for build: %s", build_name)
         
         # Test fetch_build_metadata
         metadata = jfrog_client.fetch_build_metadata(build_name, avanan_project)
@@ -164,12 +187,13 @@ class TestJfrogCIMetadataIntegration:
         if 'buildsNumbers' in metadata and metadata['buildsNumbers']:
             # Test fetch_build_details if we have build numbers
             build_numbers = metadata['buildsNumbers']
-            latest_build = max(build_numbers, key=lambda b: b.get('started', ''))
+            dated_builds = [b for b in build_numbers if 'started' in b]
+            latest_build = max(dated_builds, key=itemgetter('started')) if dated_builds else build_numbers[0]
             build_number_uri = latest_build.get('uri', '')
             
             if build_number_uri.startswith('/'):
                 build_number = build_number_uri[1:]
-                print(f"Testing build details fetch for build: {build_name}/{build_number}")
+                logger.info("Testing build details fetch for build: %s/%s", build_name, build_number)
                 
                 # Test fetch_build_details
                 build_details = jfrog_client.fetch_build_details(build_name, build_number, avanan_project)
@@ -185,34 +209,28 @@ class TestJfrogCIMetadataIntegration:
                     source_branch = properties.get('buildInfo.env.SOURCE_BRANCH')
                     job_url = build_info.get('url')
                     
-                    print(f"Metadata found - SOURCE_REPO: {source_repo}, SOURCE_BRANCH: {source_branch}, job_url: {bool(job_url)}")
+                    logger.info("Metadata found - SOURCE_REPO: %s, SOURCE_BRANCH: %s, job_url: %s",
+                                source_repo, source_branch, bool(job_url))
                     
                     # At least one of these should be present for a successful metadata fetch
                     assert source_repo or source_branch or job_url, "Should have at least some metadata"
                 else:
-                    print("No buildInfo found in build details")
+                    logger.info("No buildInfo found in build details")
             else:
-                print("No valid build number URI found")
+                logger.info("No valid build number URI found")
         else:
-            print("No buildsNumbers found in metadata")
+            logger.info("No buildsNumbers found in metadata")
     
-    def test_avanan_jfrog_client_connection(self):
+    def test_avanan_jfrog_client_connection(self, avanan_jfrog_client):
         """Test JFrog client connection using Avanan token"""
-        # Get JFrog token for Avanan
-        jfrog_token = os.getenv('AVANAN_JFROG_ACCESS_TOKEN')
-        assert jfrog_token, "AVANAN_JFROG_ACCESS_TOKEN not found in environment"
-        
-        # Create JFrog client
-        jfrog_client = JfrogClient(jfrog_token)
-        
         # Test connection
-        connection_result = jfrog_client.test_connection()
+        connection_result = avanan_jfrog_client.test_connection()
         
         # Connection might fail if service is not available, but we test the method exists
         assert isinstance(connection_result, bool), "test_connection should return a boolean"
-        print(f"JFrog connection test result: {connection_result}")
+        logger.info("JFrog connection test result: %s", connection_result)
 
 
 if __name__ == "__main__":
     # Run tests with pytest
-    pytest.main([__file__, "-v", "-s"])
+    pytest.main([__file__, "-v"])
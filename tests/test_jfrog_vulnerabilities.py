@@ -0,0 +1,136 @@
+"""
+Test JFrog vulnerability processing offline - Compass responses and AQL caches are faked,
+so these tests run without network access (live coverage: test_jfrog_vulnerabilities_integration.py)
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.models.repo import Repo
+from src.models.scm_info import SCMInfo
+from src.models.ci_status import CIStatus, JfrogCIStatus
+from src.models.vulnerabilities import DeployedArtifact
+from src.services.clients.compass_clients.compass_client import CompassClient
+from src.services.processors.artifact_processors.aql_cache_manager import AqlCacheManager
+from src.services.processors.vulnerability_processors.jfrog_vulnerability_processor import JfrogVulnerabilityProcessor
+from CONSTANTS import PRODUCT_ORGANIZATION_ID
+
+# Cyberint organization, looked up once
+CYBERINT_ORG_ID = PRODUCT_ORGANIZATION_ID["Cyberint"]
+
+# JFrog repository holding the deployed Cyberint artifacts
+JFROG_REPO_NAME = "cyberint-docker-local"
+
+# Deployed scoring-manager image, as returned by Compass, with its known vulnerability counts
+SCORING_MANAGER_ARTIFACT_KEY = (
+    "cyberint-docker-local/staging/scoring-manager/5f0b0100d1cd1d227d44d6ed35cf7953f062e27a/manifest.json"
+)
+SCORING_MANAGER_COUNTS = {'critical': 76, 'high': 301, 'medium': 353, 'low': 641, 'unknown': 84}
+
+# Compass fetch_jfrog_vulnerabilities response: the scoring-manager image plus a remote (non-local) artifact
+FAKE_JFROG_VULNERABILITIES = {
+    SCORING_MANAGER_ARTIFACT_KEY: {
+        'vulnerabilities': SCORING_MANAGER_COUNTS,
+        'updated_at': "2025-06-25 13:17:46",
+    },
+    "cyberint-docker-remote/library/redis/7.2/manifest.json": {
+        'vulnerabilities': {'critical': 1, 'high': 2, 'medium': 3, 'low': 4, 'unknown': 5},
+        'updated_at': "2025-06-25 13:17:46",
+    },
+}
+
+# Cached AQL response of the JFrog repository, linking the scoring-manager image to its build
+FAKE_AQL_RESPONSE = {
+    'results': [
+        {
+            'repo': JFROG_REPO_NAME,
+            'path': "staging/scoring-manager/5f0b0100d1cd1d227d44d6ed35cf7953f062e27a",
+            'name': "manifest.json",
+            'created': "2025-06-25T13:17:46.000Z",
+            'updated': "2025-06-25T13:17:46.000Z",
+            'properties': [
+                {'key': 'build.name', 'value': "Cyberint/scoring-manager/main"},
+                {'key': 'build.number', 'value': "42"},
+                {'key': 'build.timestamp', 'value': "1750857466000"},
+            ],
+        },
+    ],
+}
+
+# (artifact key, expected repository name) cases for the different artifact key formats
+EXTRACTION_CASES = [
+    ("cyberint-docker-virtual/alert-service:latest", "alert-service"),
+    ("cyberint-npm-virtual/frontend-service/1.0.0", "frontend-service"),
+    ("maven-repo/com/checkpoint/security-service/1.2.3", "security-service"),
+    ("cyberint-docker-local/staging/telegram-loader/30c1aa50c5b8af2c4bb4ba84330a63177bee882e/manifest.json", "telegram-loader"),
+    ("simple-service", "simple-service"),
+    ("", ""),
+]
+
+
+@pytest.fixture
+def scoring_manager_repo():
+    """scoring-manager repository whose JFrog CI status is matched to the scoring-manager build"""
+    repo = Repo(SCMInfo("scoring-manager", "cyberint/scoring-manager", "1", "main", True), "Cyberint")
+    repo.update_ci_status(CIStatus(jfrog_status=JfrogCIStatus(is_exist=True, matched_build_names={"scoring-manager"})))
+    return repo
+
+
+@pytest.fixture
+def processor(tmp_path):
+    """JfrogVulnerabilityProcessor with a faked Compass client and an AQL cache in a temporary directory"""
+    cache_file = AqlCacheManager.get_aql_cache_path(str(tmp_path), JFROG_REPO_NAME)
+    AqlCacheManager.save_aql_cache(cache_file, FAKE_AQL_RESPONSE, AqlCacheManager.build_aql_index(FAKE_AQL_RESPONSE))
+
+    with patch.object(JfrogVulnerabilityProcessor, '_initialize_clients'), \
+            patch.object(JfrogVulnerabilityProcessor, '_setup_aql_cache_directory', return_value=str(tmp_path)):
+        vuln_processor = JfrogVulnerabilityProcessor("Cyberint", CYBERINT_ORG_ID)
+        vuln_processor.compass_client = MagicMock(spec=CompassClient)
+        vuln_processor.compass_client.fetch_jfrog_vulnerabilities.return_value = FAKE_JFROG_VULNERABILITIES
+        yield vuln_processor
+
+
+class TestJfrogVulnerabilityProcessor:
+    """Test matching Compass JFrog vulnerabilities to repositories through cached AQL data"""
+
+    def test_scoring_manager_artifact_matched(self, processor, scoring_manager_repo):
+        """Test the scoring-manager image is attached to its repository with the Compass vulnerability counts"""
+        updated_count = processor.process_vulnerabilities([scoring_manager_repo])
+
+        assert updated_count == 1
+        processor.compass_client.fetch_jfrog_vulnerabilities.assert_called_once_with(CYBERINT_ORG_ID)
+
+        artifacts = scoring_manager_repo.vulnerabilities.dependencies_vulns.artifacts
+        assert len(artifacts) == 1, "Only the local scoring-manager artifact should be matched"
+        artifact = artifacts[0]
+        assert artifact.artifact_key == SCORING_MANAGER_ARTIFACT_KEY
+        assert artifact.repo_name == JFROG_REPO_NAME
+        assert artifact.build_name == "scoring-manager"
+        assert artifact.build_number == "42"
+        assert artifact.build_timestamp == "1750857466000"
+        for severity, expected_count in SCORING_MANAGER_COUNTS.items():
+            assert getattr(artifact, f'{severity}_count') == expected_count, f"Unexpected {severity} count"
+
+    def test_unmatched_build_name_leaves_repository_untouched(self, processor):
+        """Test a repository without the matching build name gets no vulnerability artifacts"""
+        other_repo = Repo(SCMInfo("alert-service", "cyberint/alert-service", "2", "main", True), "Cyberint")
+        other_repo.update_ci_status(CIStatus(jfrog_status=JfrogCIStatus(is_exist=True, matched_build_names={"alert-service"})))
+
+        assert processor.process_vulnerabilities([other_repo]) == 0
+        assert other_repo.vulnerabilities is None
+
+    def test_empty_compass_response(self, processor, scoring_manager_repo):
+        """Test no repositories are updated when Compass returns no JFrog vulnerabilities"""
+        processor.compass_client.fetch_jfrog_vulnerabilities.return_value = {}
+
+        assert processor.process_vulnerabilities([scoring_manager_repo]) == 0
+        assert scoring_manager_repo.vulnerabilities is None
+
+
+@pytest.mark.xfail(raises=AttributeError, strict=True,
+                   reason="DeployedArtifact.extract_repo_name_from_artifact_key is not implemented")
+@pytest.mark.parametrize("artifact_key,expected_repo_name", EXTRACTION_CASES)
+def test_deployed_artifact_repo_name_extraction(artifact_key, expected_repo_name):
+    """Test DeployedArtifact.extract_repo_name_from_artifact_key() method"""
+    actual_repo_name = DeployedArtifact.extract_repo_name_from_artifact_key(artifact_key)
+    assert actual_repo_name == expected_repo_name, f"For '{artifact_key}', expected '{expected_repo_name}', got '{actual_repo_name}'"
@@ -3,49 +3,139 @@ Test JFrog vulnerabilities integration - specific tests for Cyberint product
 """
 
 import pytest
-import sys
+import copy
 import os
-from dotenv import load_dotenv
+import re
+import json
+import logging
+import operator
+from collections import defaultdict
+from itertools import islice
+from typing import Optional
 
-# Add src and root to path for imports  
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.services.clients.compass_clients.compass_client import CompassClient
+from src.models.vulnerabilities import DeployedArtifact, Vulnerabilities
+from src.services.processors.vulnerability_processors.jfrog_vulnerability_processor import JfrogVulnerabilityProcessor
+from src.services.processors.artifact_processors.aql_cache_manager import (
+    AqlCacheManager, AQL_CACHE_SUFFIX, NDJSON_AQL_CACHE_SUFFIX, LEGACY_AQL_CACHE_SUFFIX,
+)
+from CONSTANTS import PRODUCT_ORGANIZATION_ID, PRODUCT_JFROG_PROJECT
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-from src.models.product import Product
-from src.services.compass_clients.compass_client import CompassClient
-from src.models.vulnerabilities import DeployedArtifact
-from CONSTANTS import PRODUCT_SCM_TYPE, PRODUCT_ORGANIZATION_ID
+# Cyberint organization, looked up once
+CYBERINT_ORG_ID = PRODUCT_ORGANIZATION_ID["Cyberint"]
 
+# Compass credentials, read once at import (.env is loaded by conftest.py)
+COMPASS_TOKEN = os.getenv('COMPASS_ACCESS_TOKEN')
+COMPASS_URL = os.getenv('COMPASS_BASE_URL')
+HAS_COMPASS_CREDS = bool(COMPASS_TOKEN and COMPASS_URL)
 
+# Every test in this module calls live services (or replays them), which needs Compass credentials
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.slow,
+    pytest.mark.skipif(not HAS_COMPASS_CREDS, reason="Compass credentials required (COMPASS_ACCESS_TOKEN, COMPASS_BASE_URL)"),
+]
+
+# Run the live Compass regression test (never replayed from a cassette)
+COMPASS_LIVE_TESTS = os.getenv('COMPASS_LIVE_TESTS') == '1'
+
+# Run the assertion-free vulnerability matching debug test (only useful when investigating locally)
+RUN_DEBUG_TESTS = os.getenv('RUN_DEBUG_TESTS') == '1'
+
+# Per-severity vulnerability counts of a DeployedArtifact, fetched in one call
+SEVERITY_COUNTS = operator.attrgetter('critical_count', 'high_count', 'medium_count', 'low_count', 'unknown_count')
+
+# Artifact key layout: [scheme://]repo[/path]/name
+ARTIFACT_KEY_PATTERN = re.compile(r"^(?:[A-Za-z]+://)?(?P<repo>[^/]+)(?:/(?P<path>.+))?/(?P<name>[^/]+)$")
+
+
+@pytest.fixture(scope="session")
+def cyberint_vuln_product(session_cassette, cyberint_product):
+    """Cyberint product with repositories, CI data and JFrog vulnerabilities loaded once per test session"""
+    # Copy of the shared product (JFrog artifacts are matched through its CI build names), never mutated in place
+    vuln_product = copy.deepcopy(cyberint_product)
+    assert vuln_product.get_repos_count() > 0, "Should have repositories loaded"
+    with session_cassette("cyberint_vuln_product"):
+        JfrogVulnerabilityProcessor(vuln_product.name, CYBERINT_ORG_ID).process_vulnerabilities(vuln_product.repos)
+
+    # Ensure all repositories have vulnerability objects initialized
+    for repo in vuln_product.repos:
+        if repo.vulnerabilities is None:
+            repo.vulnerabilities = Vulnerabilities()
+    return vuln_product
+
+
+@pytest.fixture(scope="session")
+def cyberint_repos_by_name(cyberint_vuln_product):
+    """Repository name -> repository of this module's Cyberint product (overrides the conftest fixture)"""
+    return {repo.get_repository_name(): repo for repo in cyberint_vuln_product.repos}
+
+
+def _cached_repo_names(aql_cache_dir: str) -> list:
+    """Names of the repositories with an AQL cache in aql_cache_dir, in any cache format"""
+    repo_names = set()
+    with os.scandir(aql_cache_dir) as entries:
+        for entry in entries:
+            # Skip the side-files (build name maps, '<repo>.idx.json' indexes) kept next to the caches
+            if not entry.is_file() or entry.name.startswith('_') or entry.name.endswith('.idx.json'):
+                continue
+            for suffix in (AQL_CACHE_SUFFIX, NDJSON_AQL_CACHE_SUFFIX, LEGACY_AQL_CACHE_SUFFIX):
+                if entry.name.endswith(suffix):
+                    repo_names.add(entry.name[:-len(suffix)])
+                    break
+    return sorted(repo_names)
+
+
+def _load_repo_aql_cache(aql_cache_dir: str, repo_name: str) -> Optional[dict]:
+    """Load a repository's AQL cache the way the processors do (binary or legacy JSON, else NDJSON)"""
+    aql_data = AqlCacheManager.load_aql_cache(AqlCacheManager.get_aql_cache_path(aql_cache_dir, repo_name))
+    if aql_data is None:
+        aql_data = AqlCacheManager.load_aql_cache(AqlCacheManager.get_aql_cache_path(aql_cache_dir, repo_name, debug=True))
+    return aql_data
+
+
+def _aql_entries_by_path_name(aql_data: dict) -> dict:
+    """Index the results of AQL data by (path, name)"""
+    entries = defaultdict(list)
+    for aql_entry in aql_data.get('results', []):
+        entries[(aql_entry.get('path', ''), aql_entry.get('name', ''))].append(aql_entry)
+    return entries
+
+
+def _build_timestamps(artifacts):
+    """Yield the artifacts' build timestamps (as int when numeric), skipping artifacts without one"""
+    for artifact in artifacts:
+        ts = getattr(artifact, 'build_timestamp', None)
+        if ts is None:
+            continue
+        try:
+            yield int(ts)
+        except (TypeError, ValueError):
+            yield ts
+
+
+def _first_ascending_pair(timestamps) -> Optional[tuple]:
+    """Return the first (previous, next) pair that breaks descending order, stopping there, or None if sorted"""
+    previous = None
+    for ts in timestamps:
+        if previous is not None and previous < ts:
+            return previous, ts
+        previous = ts
+    return None
+
+
+@pytest.mark.vcr
 class TestJfrogVulnerabilitiesIntegration:
     """Test JFrog vulnerabilities integration using Cyberint product"""
     
-    def test_cyberint_load_repos_and_jfrog_vulnerabilities(self):
+    @pytest.mark.xdist_group("cyberint_vuln_product")
+    def test_cyberint_load_repos_and_jfrog_vulnerabilities(self, cyberint_vuln_product):
         """Test loading repositories and JFrog vulnerabilities for Cyberint"""
-        # Get Cyberint constants
-        cyberint_scm_type = PRODUCT_SCM_TYPE["Cyberint"]
-        cyberint_org_id = PRODUCT_ORGANIZATION_ID["Cyberint"]
-        
-        # Create Cyberint product
-        cyberint_product = Product("Cyberint", cyberint_scm_type, cyberint_org_id)
-        
-        # Load repositories first
-        cyberint_product.load_repositories()
-        
-        # Verify we have repositories
-        assert cyberint_product.get_repos_count() > 0, "Should have repositories loaded"
-        
-        # Load JFrog vulnerabilities
-        cyberint_product._load_jfrog_vulnerabilities()
-        
-        # Ensure all repositories have vulnerability objects initialized
-        for repo in cyberint_product.repos:
-            if repo.vulnerabilities is None:
-                from src.models.vulnerabilities import Vulnerabilities
-                repo.vulnerabilities = Vulnerabilities()
+        cyberint_product = cyberint_vuln_product
+        # Resolve the debug level once instead of per artifact (the severity breakdown is only built when logged)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         # Check if any repositories have vulnerabilities
         repos_with_vulnerabilities = 0
@@ -60,147 +150,42 @@ class TestJfrogVulnerabilitiesIntegration:
                     assert artifact.repo_name == repo.get_repository_name(), "Artifact repo name should match repository"
                     
                     # Verify vulnerability counts are non-negative
-                    assert artifact.critical_count >= 0, "Critical count should be non-negative"
-                    assert artifact.high_count >= 0, "High count should be non-negative"
-                    assert artifact.medium_count >= 0, "Medium count should be non-negative"
-                    assert artifact.low_count >= 0, "Low count should be non-negative"
-                    assert artifact.unknown_count >= 0, "Unknown count should be non-negative"
+                    assert min(SEVERITY_COUNTS(artifact)) >= 0, \
+                        f"Vulnerability counts of '{artifact.artifact_key}' should be non-negative: {artifact.get_severity_breakdown()}"
                     
-                    print(f"Repository '{repo.get_repository_name()}' has artifact '{artifact.artifact_key}' with vulnerabilities: {artifact.get_severity_breakdown()}")
+                    if debug_enabled:
+                        logger.debug("Repository '%s' has artifact '%s' with vulnerabilities: %s",
+                                     repo.get_repository_name(), artifact.artifact_key, artifact.get_severity_breakdown())
 
 
-    def test_artifacts_sorted_by_build_timestamp_desc(self):
+    @pytest.mark.xdist_group("cyberint_vuln_product")
+    def test_artifacts_sorted_by_build_timestamp_desc(self, cyberint_vuln_product):
         """Test that all JFrog vulnerability artifacts are sorted by build_timestamp descending for all repos"""
-        cyberint_scm_type = PRODUCT_SCM_TYPE["Cyberint"]
-        cyberint_org_id = PRODUCT_ORGANIZATION_ID["Cyberint"]
-        cyberint_product = Product("Cyberint", cyberint_scm_type, cyberint_org_id)
-        cyberint_product.load_repositories()
-        cyberint_product._load_jfrog_vulnerabilities()
-        for repo in cyberint_product.repos:
-            if repo.vulnerabilities is None:
-                from src.models.vulnerabilities import Vulnerabilities
-                repo.vulnerabilities = Vulnerabilities()
+        for repo in cyberint_vuln_product.repos:
             artifacts = repo.vulnerabilities.dependencies_vulns.artifacts
             if not artifacts:
                 continue
-            timestamps = []
-            for artifact in artifacts:
-                # Accept both int and str timestamps, try to parse if needed
-                ts = getattr(artifact, 'build_timestamp', None)
-                if ts is None:
-                    continue
-                # Try to convert to int if possible
-                try:
-                    ts = int(ts)
-                except Exception:
-                    pass
-                timestamps.append(ts)
-            if len(timestamps) > 1:
-                sorted_desc = all(timestamps[i] >= timestamps[i+1] for i in range(len(timestamps)-1))
-                assert sorted_desc, f"Artifacts for repo '{repo.get_repository_name()}' are not sorted by build_timestamp descending: {timestamps}"
-        print("\u2713 All JFrog vulnerability artifacts are sorted by build_timestamp descending for all repos")
-    
-    def test_compass_client_fetch_jfrog_vulnerabilities(self):
-        """Test CompassClient fetch_jfrog_vulnerabilities returns valid data"""
-        # Get Compass credentials
-        compass_token = os.getenv('COMPASS_ACCESS_TOKEN')
-        compass_url = os.getenv('COMPASS_BASE_URL')
-        
-        assert compass_token, "COMPASS_ACCESS_TOKEN not found in environment"
-        assert compass_url, "COMPASS_BASE_URL not found in environment"
-        
-        # Create CompassClient
-        compass_client = CompassClient(compass_token, compass_url)
-        
-        # Fetch JFrog vulnerabilities for Cyberint organization
-        cyberint_org_id = PRODUCT_ORGANIZATION_ID["Cyberint"]
-        jfrog_vulns = compass_client.fetch_jfrog_vulnerabilities(cyberint_org_id)
-        
-        # Verify we got data
-        assert isinstance(jfrog_vulns, dict), "Should return a dictionary"
-        
-        if jfrog_vulns:
-            # Verify structure of first few entries
-            for i, (artifact_key, vuln_data) in enumerate(list(jfrog_vulns.items())[:3]):
-                assert isinstance(artifact_key, str), f"Artifact key {i} should be string"
-                assert isinstance(vuln_data, dict), f"Vulnerability data {i} should be dict"
-                
-                # Verify vulnerability data structure
-                assert 'vulnerabilities' in vuln_data, f"Entry {i} should have 'vulnerabilities' key"
-                vuln_counts = vuln_data['vulnerabilities']
-                
-                required_fields = ['critical', 'high', 'medium', 'low', 'unknown']
-                for field in required_fields:
-                    assert field in vuln_counts, f"Entry {i} should have '{field}' in vulnerabilities"
-                    assert isinstance(vuln_counts[field], int), f"Entry {i} '{field}' should be integer"
-                    assert vuln_counts[field] >= 0, f"Entry {i} '{field}' should be non-negative"
-                
-                print(f"Artifact {i+1}: {artifact_key} - C:{vuln_counts['critical']}, H:{vuln_counts['high']}, M:{vuln_counts['medium']}, L:{vuln_counts['low']}, U:{vuln_counts['unknown']}")
-            
-            print(f"✓ Successfully fetched JFrog vulnerabilities: {len(jfrog_vulns)} artifacts")
-        else:
-            print("! No JFrog vulnerability data returned (endpoint might not be available)")
+            unsorted_pair = _first_ascending_pair(_build_timestamps(artifacts))
+            assert unsorted_pair is None, \
+                f"Artifacts for repo '{repo.get_repository_name()}' are not sorted by build_timestamp descending at {unsorted_pair}"
+        logger.info("✓ All JFrog vulnerability artifacts are sorted by build_timestamp descending for all repos")
     
-    def test_deployed_artifact_repo_name_extraction(self):
-        """Test DeployedArtifact.extract_repo_name_from_artifact_key() method"""
-        # Test cases for different artifact key formats
-        test_cases = [
-            ("cyberint-docker-virtual/alert-service:latest", "alert-service"),
-            ("cyberint-npm-virtual/frontend-service/1.0.0", "frontend-service"),
-            ("maven-repo/com/checkpoint/security-service/1.2.3", "security-service"),
-            ("cyberint-docker-local/staging/telegram-loader/30c1aa50c5b8af2c4bb4ba84330a63177bee882e/manifest.json", "telegram-loader"),
-            ("simple-service", "simple-service"),
-            ("", ""),
-        ]
-        
-        for artifact_key, expected_repo_name in test_cases:
-            actual_repo_name = DeployedArtifact.extract_repo_name_from_artifact_key(artifact_key)
-            assert actual_repo_name == expected_repo_name, f"For '{artifact_key}', expected '{expected_repo_name}', got '{actual_repo_name}'"
-            print(f"✓ '{artifact_key}' → '{actual_repo_name}'")
-        
-        print("✓ All artifact key extraction tests passed")
-
-    def test_cyberint_scoring_manager_specific_artifact(self):
+    @pytest.mark.xdist_group("cyberint_vuln_product")
+    def test_cyberint_scoring_manager_specific_artifact(self, cyberint_repos_by_name):
         """Test specific scoring-manager artifact from Cyberint with expected vulnerability counts"""
-        # Get Cyberint constants
-        cyberint_scm_type = PRODUCT_SCM_TYPE["Cyberint"]
-        cyberint_org_id = PRODUCT_ORGANIZATION_ID["Cyberint"]
-        
-        # Create Cyberint product
-        cyberint_product = Product("Cyberint", cyberint_scm_type, cyberint_org_id)
-        
-        # Load repositories first
-        cyberint_product.load_repositories()
-        
-        # Verify we have repositories
-        assert cyberint_product.get_repos_count() > 0, "Should have repositories loaded"
-        
-        # Load JFrog vulnerabilities
-        cyberint_product._load_jfrog_vulnerabilities()
-        
-        # Ensure all repositories have vulnerability objects initialized
-        for repo in cyberint_product.repos:
-            if repo.vulnerabilities is None:
-                from src.models.vulnerabilities import Vulnerabilities
-                repo.vulnerabilities = Vulnerabilities()
-        
         # Find scoring-manager repository
-        scoring_manager_repo = None
-        for repo in cyberint_product.repos:
-            if repo.get_repository_name() == "scoring-manager":
-                scoring_manager_repo = repo
-                break
+        scoring_manager_repo = cyberint_repos_by_name.get("scoring-manager")
         
         assert scoring_manager_repo is not None, "Should find scoring-manager repository in Cyberint"
-        print(f"✓ Found scoring-manager repository: {scoring_manager_repo.get_repository_name()}")
+        logger.info("✓ Found scoring-manager repository: %s", scoring_manager_repo.get_repository_name())
         
         # Check if scoring-manager has vulnerability artifacts
         artifacts = scoring_manager_repo.vulnerabilities.dependencies_vulns.artifacts
-        print(f"Scoring-manager has {len(artifacts)} vulnerability artifacts")
+        logger.info("Scoring-manager has %s vulnerability artifacts", len(artifacts))
         
         # If no artifacts from API, create a test artifact with expected data to verify the structure works
         if len(artifacts) == 0:
-            print("! No vulnerability artifacts returned from API (likely 404). Creating test artifact to verify structure...")
+            logger.info("! No vulnerability artifacts returned from API (likely 404). Creating test artifact to verify structure...")
             
             # Create a test artifact with expected vulnerability counts based on your data:
             # docker://staging/scoring-manager:5f0b0100d1cd1d227d44d6ed35cf7953f062e27a	low:641	medium: 353	high:301	critical:76	unknown:84
@@ -217,24 +202,17 @@ class TestJfrogVulnerabilitiesIntegration:
                 updated_at="2025-06-25 13:17:46"
             )
             
-            # Add the test artifact to verify the structure works
-            scoring_manager_repo.vulnerabilities.dependencies_vulns.add_artifact(test_artifact)
-            artifacts = scoring_manager_repo.vulnerabilities.dependencies_vulns.artifacts
-            print(f"Added test artifact. Scoring-manager now has {len(artifacts)} vulnerability artifacts")
-        
-        # Look for the specific artifact with the expected hash
-        expected_artifact_key = "docker://staging/scoring-manager:5f0b0100d1cd1d227d44d6ed35cf7953f062e27a"
-        found_artifact = None
+            # Check the test artifact locally - the session-wide product is shared with the other tests
+            artifacts = [test_artifact]
+            logger.info("Using test artifact. Checking %s vulnerability artifacts", len(artifacts))
         
-        for artifact in artifacts:
-            print(f"Checking artifact: {artifact.artifact_key}")
-            if expected_artifact_key in artifact.artifact_key or "scoring-manager" in artifact.artifact_key:
-                found_artifact = artifact
-                break
+        # Look for the first scoring-manager artifact (covers the expected
+        # docker://staging/scoring-manager:5f0b0100d1cd1d227d44d6ed35cf7953f062e27a key)
+        found_artifact = next((artifact for artifact in artifacts if "scoring-manager" in artifact.artifact_key), None)
         
         if found_artifact:
-            print(f"✓ Found scoring-manager artifact: {found_artifact.artifact_key}")
-            print(f"Vulnerability breakdown: {found_artifact.get_severity_breakdown()}")
+            logger.info("✓ Found scoring-manager artifact: %s", found_artifact.artifact_key)
+            logger.info("Vulnerability breakdown: %s", found_artifact.get_severity_breakdown())
             
             # Verify the expected vulnerability counts based on your data:
             # docker://staging/scoring-manager:5f0b0100d1cd1d227d44d6ed35cf7953f062e27a	low:641	medium: 353	high:301	critical:76	unknown:84
@@ -249,7 +227,7 @@ class TestJfrogVulnerabilitiesIntegration:
             # Verify each count matches expected values (allow some tolerance for data changes)
             for severity, expected_count in expected_counts.items():
                 actual_count = getattr(found_artifact, f'{severity}_count')
-                print(f"{severity.capitalize()}: expected={expected_count}, actual={actual_count}")
+                logger.info("%s: expected=%s, actual=%s", severity.capitalize(), expected_count, actual_count)
                 
                 # Allow for small variations in data (±10% tolerance)
                 tolerance = max(1, int(expected_count * 0.1))
@@ -262,59 +240,56 @@ class TestJfrogVulnerabilitiesIntegration:
             # Verify repo name extraction
             assert found_artifact.repo_name == "scoring-manager", f"Expected repo name 'scoring-manager', got {found_artifact.repo_name}"
             
-            print("✓ All scoring-manager artifact validations passed!")
+            logger.info("✓ All scoring-manager artifact validations passed!")
             
         else:
-            print("! No scoring-manager artifact found - this might indicate the artifact hasn't been deployed recently")
+            logger.info("! No scoring-manager artifact found - this might indicate the artifact hasn't been deployed recently")
             # Still pass the test but log the issue
             assert len(artifacts) >= 0, "Should have some artifacts (even if not the specific one)"
 
 
+    @pytest.mark.debug
+    @pytest.mark.skipif(not RUN_DEBUG_TESTS, reason="debug-only test - set RUN_DEBUG_TESTS=1")
     def test_debug_vulnerability_matching_issue(self):
-        """Debug the vulnerability matching issue step by step"""
-        print("\n🔍 DEBUGGING VULNERABILITY MATCHING ISSUE")
-        
-        # Get Cyberint constants
-        cyberint_org_id = PRODUCT_ORGANIZATION_ID["Cyberint"]
+        """Debug the vulnerability matching issue step by step (output with --log-cli-level=DEBUG)"""
+        logger.debug("🔍 DEBUGGING VULNERABILITY MATCHING ISSUE")
         
         # Get vulnerability processor
-        from src.services.vulnerability_processors.jfrog_vulnerability_processor import JfrogVulnerabilityProcessor
-        vuln_processor = JfrogVulnerabilityProcessor("Cyberint", cyberint_org_id)
+        vuln_processor = JfrogVulnerabilityProcessor("Cyberint", CYBERINT_ORG_ID)
         
         # Check if we have compass client
         assert vuln_processor.compass_client is not None, "Should have CompassClient"
-        print("✓ CompassClient initialized")
+        logger.debug("✓ CompassClient initialized")
         
         # Fetch vulnerability data from Compass API
-        jfrog_vulnerabilities = vuln_processor.compass_client.fetch_jfrog_vulnerabilities(cyberint_org_id)
-        print(f"✓ Fetched {len(jfrog_vulnerabilities)} vulnerability artifacts from Compass API")
+        jfrog_vulnerabilities = vuln_processor.compass_client.fetch_jfrog_vulnerabilities(CYBERINT_ORG_ID)
+        logger.debug("✓ Fetched %s vulnerability artifacts from Compass API", len(jfrog_vulnerabilities))
         
         # Check a few artifact keys to understand the format
-        print("\n📋 Sample artifact keys:")
-        for i, artifact_key in enumerate(list(jfrog_vulnerabilities.keys())[:5]):
-            print(f"  {i+1}. {artifact_key}")
+        logger.debug("📋 Sample artifact keys:")
+        for i, artifact_key in enumerate(islice(jfrog_vulnerabilities, 5)):
+            logger.debug("  %s. %s", i+1, artifact_key)
         
         # Get JFrog project and AQL cache directory
-        from CONSTANTS import PRODUCT_JFROG_PROJECT
         jfrog_project = PRODUCT_JFROG_PROJECT.get("Cyberint", "")
-        print(f"✓ JFrog project: {jfrog_project}")
+        logger.debug("✓ JFrog project: %s", jfrog_project)
         
         cache_dir = os.path.join(os.path.dirname(__file__), '..', 'build_info_cache_dir')
         product_cache_dir = os.path.join(cache_dir, jfrog_project)
         aql_cache_dir = os.path.join(product_cache_dir, "cache_repo_responses")
-        print(f"✓ AQL cache directory: {aql_cache_dir}")
+        logger.debug("✓ AQL cache directory: %s", aql_cache_dir)
         
-        # Check what's in the AQL cache directory
-        cache_files = []
+        # Check which repositories have an AQL cache (binary, NDJSON or legacy JSON)
+        cached_repo_names = []
         if os.path.exists(aql_cache_dir):
-            cache_files = [f for f in os.listdir(aql_cache_dir) if f.endswith('.json')]
-            print(f"✓ Found {len(cache_files)} AQL cache files")
-            if cache_files:
-                print("  Sample cache files:")
-                for i, cache_file in enumerate(cache_files[:5]):
-                    print(f"    {i+1}. {cache_file}")
+            cached_repo_names = _cached_repo_names(aql_cache_dir)
+            logger.debug("✓ Found %s AQL caches", len(cached_repo_names))
+            if cached_repo_names:
+                logger.debug("  Sample cached repositories:")
+                for i, cached_repo_name in enumerate(cached_repo_names[:5]):
+                    logger.debug("    %s. %s", i+1, cached_repo_name)
         else:
-            print("❌ AQL cache directory does not exist!")
+            logger.debug("❌ AQL cache directory does not exist!")
         
         # Load and examine build name map from JFrog CI processor cache files
         build_name_map_file = os.path.join(product_cache_dir, "build_name_to_repo_map.json")
@@ -322,10 +297,9 @@ class TestJfrogVulnerabilitiesIntegration:
         
         if os.path.exists(build_name_map_file):
             try:
-                import json
                 with open(build_name_map_file, 'r', encoding='utf-8') as f:
                     build_name_to_repo_map = json.load(f)
-                print(f"✓ Loaded build name to repo map with {len(build_name_to_repo_map)} entries")
+                logger.debug("✓ Loaded build name to repo map with %s entries", len(build_name_to_repo_map))
                 
                 # Reverse the mapping: repo_name -> set of build names
                 for build_name, repo_name in build_name_to_repo_map.items():
@@ -334,17 +308,15 @@ class TestJfrogVulnerabilitiesIntegration:
                     repo_build_names_map[repo_name].add(build_name)
                     
             except (FileNotFoundError, json.JSONDecodeError) as e:
-                print(f"❌ Error loading build name map: {e}")
+                logger.debug("❌ Error loading build name map: %s", e)
         else:
-            print("❌ Build name to repo map file does not exist!")
+            logger.debug("❌ Build name to repo map file does not exist!")
             
             # Try to create a simple test mapping from the AQL cache data itself
-            print("🔧 Attempting to create test mapping from AQL cache...")
-            if cache_files:
+            logger.debug("🔧 Attempting to create test mapping from AQL cache...")
+            if cached_repo_names:
                 try:
-                    import json
-                    with open(os.path.join(aql_cache_dir, cache_files[0]), 'r', encoding='utf-8') as f:
-                        sample_aql_data = json.load(f)
+                    sample_aql_data = _load_repo_aql_cache(aql_cache_dir, cached_repo_names[0]) or {}
                     
                     # Extract build names from AQL data and create simple mapping
                     build_names_found = set()
@@ -362,157 +334,165 @@ class TestJfrogVulnerabilitiesIntegration:
                                         # Create a simple test mapping
                                         repo_build_names_map[extracted_name] = {extracted_name}
                     
-                    print(f"✓ Created test mapping from AQL cache with {len(build_names_found)} build names: {list(build_names_found)[:5]}")
+                    logger.debug("✓ Created test mapping from AQL cache with %s build names: %s",
+                                 len(build_names_found), list(islice(build_names_found, 5)))
                     
-                except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                    print(f"❌ Error creating test mapping: {e}")
+                except KeyError as e:
+                    logger.debug("❌ Error creating test mapping: %s", e)
+        
+        logger.debug("✓ Built repository lookup map with %s repositories", len(repo_build_names_map))
         
-        print(f"✓ Built repository lookup map with {len(repo_build_names_map)} repositories")
+        # Reverse index (build name -> repositories), built once instead of scanning the map per build name
+        build_name_to_repos = defaultdict(list)
+        for project_repo_name, build_names in repo_build_names_map.items():
+            for build_name in build_names:
+                build_name_to_repos[build_name].append(project_repo_name)
         
         # Show some repository build names for debugging
-        print("\n🏗️ Sample repositories with build names:")
+        logger.debug("🏗️ Sample repositories with build names:")
         count = 0
         for repo_name, build_names in repo_build_names_map.items():
             if count < 5:
-                print(f"  {repo_name}: {list(build_names)}")
+                logger.debug("  %s: %s", repo_name, list(build_names))
                 count += 1
         
         # Now test processing a few artifacts manually
-        print("\n🔧 Testing artifact processing:")
+        logger.debug("🔧 Testing artifact processing:")
         
         # Take first 5 artifacts for detailed testing
-        test_artifacts = list(jfrog_vulnerabilities.items())[:5]
+        test_artifacts = list(islice(jfrog_vulnerabilities.items(), 5))
         successful_matches = 0
         
         for i, (artifact_key, _) in enumerate(test_artifacts):
-            print(f"\n--- Testing artifact {i+1}: {artifact_key} ---")
+            logger.debug("--- Testing artifact %s: %s ---", i+1, artifact_key)
             
-            # Parse artifact manually
-            repo_name = ""
-            path = ""
-            name = ""
-            
-            try:
-                if "://" in artifact_key:
-                    # Handle docker://... format
-                    parts = artifact_key.split("/")
-                    if len(parts) >= 3:
-                        repo_name = parts[1] if len(parts) > 1 else ""
-                        name = parts[-1] if parts else ""
-                        path = "/".join(parts[2:-1]) if len(parts) > 3 else ""
-                else:
-                    # Handle regular path format
-                    parts = artifact_key.split("/")
-                    if len(parts) >= 2:
-                        repo_name = parts[0]
-                        name = parts[-1]
-                        path = "/".join(parts[1:-1]) if len(parts) > 2 else ""
-                        
-                print(f"  Parsed: repo_name='{repo_name}', path='{path}', name='{name}'")
-            except (ValueError, IndexError) as e:
-                print(f"  ❌ Error parsing: {e}")
-                continue
+            # Parse artifact manually (repo/path/name, optionally prefixed with a docker://-style scheme)
+            match = ARTIFACT_KEY_PATTERN.match(artifact_key)
+            repo_name, path, name = (match['repo'], match['path'] or "", match['name']) if match else ("", "", "")
+            logger.debug("  Parsed: repo_name='%s', path='%s', name='%s'", repo_name, path, name)
             
             # Check if it's a local repo
             is_local = "local" in repo_name.lower()
-            print(f"  Is local repo: {is_local}")
+            logger.debug("  Is local repo: %s", is_local)
             
             if not is_local:
-                print("  Skipping non-local repository")
+                logger.debug("  Skipping non-local repository")
                 continue
             
             # Check AQL cache
-            aql_cache_file = os.path.join(aql_cache_dir, f"{repo_name}.json")
-            print(f"  AQL cache file: {aql_cache_file}")
-            print(f"  Cache file exists: {os.path.exists(aql_cache_file)}")
+            cache_file_exists = repo_name in cached_repo_names
+            logger.debug("  Cache file exists: %s", cache_file_exists)
             
-            if os.path.exists(aql_cache_file):
-                try:
-                    import json
-                    with open(aql_cache_file, 'r', encoding='utf-8') as f:
-                        aql_data = json.load(f)
+            if cache_file_exists:
+                aql_data = _load_repo_aql_cache(aql_cache_dir, repo_name)
+                
+                if aql_data:
+                    results = aql_data.get('results', [])
+                    logger.debug("  AQL data loaded: %s results", len(results))
+                    
+                    # Look up matching artifacts in the (path, name) index of the AQL data
+                    matches = []
+                    for aql_entry in _aql_entries_by_path_name(aql_data).get((path, name), ()):
+                        # Extract build name from properties
+                        properties = aql_entry.get('properties', [])
+                        for prop in properties:
+                            if prop.get('key') == 'build.name':
+                                full_build_name = prop.get('value', '')
+                                # Extract the build name using the same logic as the processor
+                                if '/' not in full_build_name:
+                                    extracted_build_name = full_build_name
+                                else:
+                                    parts = full_build_name.split('/')
+                                    if len(parts) >= 3:
+                                        extracted_build_name = parts[1]  # Middle part
+                                    elif len(parts) == 2:
+                                        extracted_build_name = parts[1]  # Second part
+                                    else:
+                                        extracted_build_name = full_build_name
+                                matches.append(f"{extracted_build_name} (from: {full_build_name})")
+                    
+                    logger.debug("  Found %s AQL matches with build names: %s", len(matches), matches)
+                    
+                    # Check if any build names match our repository map
+                    repo_matches = [project_repo_name for build_name in matches
+                                    for project_repo_name in build_name_to_repos.get(build_name, ())]
                     
-                    if aql_data:
-                        results = aql_data.get('results', [])
-                        print(f"  AQL data loaded: {len(results)} results")
-                        
-                        # Look for matching artifacts in AQL data
-                        matches = []
-                        for aql_entry in results:
-                            aql_path = aql_entry.get('path', '')
-                            aql_name = aql_entry.get('name', '')
-                            if aql_path == path and aql_name == name:
-                                # Extract build name from properties
-                                properties = aql_entry.get('properties', [])
-                                for prop in properties:
-                                    if prop.get('key') == 'build.name':
-                                        full_build_name = prop.get('value', '')
-                                        # Extract the build name using the same logic as the processor
-                                        if '/' not in full_build_name:
-                                            extracted_build_name = full_build_name
-                                        else:
-                                            parts = full_build_name.split('/')
-                                            if len(parts) >= 3:
-                                                extracted_build_name = parts[1]  # Middle part
-                                            elif len(parts) == 2:
-                                                extracted_build_name = parts[1]  # Second part
-                                            else:
-                                                extracted_build_name = full_build_name
-                                        matches.append(f"{extracted_build_name} (from: {full_build_name})")
-                        
-                        print(f"  Found {len(matches)} AQL matches with build names: {matches}")
-                        
-                        # Check if any build names match our repository map
-                        repo_matches = []
-                        for build_name in matches:
-                            for project_repo_name, build_names in repo_build_names_map.items():
-                                if build_name in build_names:
-                                    repo_matches.append(project_repo_name)
-                        
-                        print(f"  Repository matches: {repo_matches}")
-                        if repo_matches:
-                            successful_matches += 1
-                    else:
-                        print("  ❌ Failed to load AQL data")
-                except (FileNotFoundError, json.JSONDecodeError) as e:
-                    print(f"  ❌ Error loading AQL cache: {e}")
+                    logger.debug("  Repository matches: %s", repo_matches)
+                    if repo_matches:
+                        successful_matches += 1
+                else:
+                    logger.debug("  ❌ Failed to load AQL data")
             else:
-                print("  ❌ AQL cache file missing")
+                logger.debug("  ❌ AQL cache file missing")
         
-        print("\n🎯 DEBUGGING SUMMARY:")
-        print(f"- Fetched {len(jfrog_vulnerabilities)} vulnerability artifacts")
-        print(f"- Found {len(repo_build_names_map)} repositories with build names")
-        print(f"- AQL cache directory: {aql_cache_dir}")
-        print(f"- Cache files available: {len(cache_files)}")
-        print(f"- Successful matches from test artifacts: {successful_matches}/{len(test_artifacts)}")
+        logger.debug("🎯 DEBUGGING SUMMARY:")
+        logger.debug("- Fetched %s vulnerability artifacts", len(jfrog_vulnerabilities))
+        logger.debug("- Found %s repositories with build names", len(repo_build_names_map))
+        logger.debug("- AQL cache directory: %s", aql_cache_dir)
+        logger.debug("- AQL caches available: %s", len(cached_repo_names))
+        logger.debug("- Successful matches from test artifacts: %s/%s", successful_matches, len(test_artifacts))
         
         # Show some specific examples to help debug
         if successful_matches == 0:
-            print("\n❌ NO MATCHES FOUND - Potential issues:")
-            print("1. AQL cache files might not contain the vulnerability artifacts")
-            print("2. Build names in AQL data might not match build names in repo map")
-            print("3. Path/name parsing might be incorrect")
+            logger.debug("❌ NO MATCHES FOUND - Potential issues:")
+            logger.debug("1. AQL cache files might not contain the vulnerability artifacts")
+            logger.debug("2. Build names in AQL data might not match build names in repo map")
+            logger.debug("3. Path/name parsing might be incorrect")
             
             # Let's examine one cache file in detail if available
-            if cache_files:
-                sample_cache_file = os.path.join(aql_cache_dir, cache_files[0])
-                try:
-                    with open(sample_cache_file, 'r', encoding='utf-8') as f:
-                        sample_aql_data = json.load(f)
-                    sample_results = sample_aql_data.get('results', [])
-                    if sample_results:
-                        print(f"\n📋 Sample AQL entry from {cache_files[0]}:")
-                        sample_entry = sample_results[0]
-                        print(f"  path: '{sample_entry.get('path', '')}'")
-                        print(f"  name: '{sample_entry.get('name', '')}'")
-                        print(f"  build.name: '{sample_entry.get('build.name', '')}'")
-                except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                    print(f"  Error examining cache file: {e}")
+            if cached_repo_names:
+                sample_aql_data = _load_repo_aql_cache(aql_cache_dir, cached_repo_names[0]) or {}
+                sample_results = sample_aql_data.get('results', [])
+                if sample_results:
+                    logger.debug("📋 Sample AQL entry from %s:", cached_repo_names[0])
+                    sample_entry = sample_results[0]
+                    logger.debug("  path: '%s'", sample_entry.get('path', ''))
+                    logger.debug("  name: '%s'", sample_entry.get('name', ''))
+                    logger.debug("  build.name: '%s'", sample_entry.get('build.name', ''))
         
         # This test is for debugging, so we don't need to assert anything specific
         # The goal is to understand why artifacts aren't matching repositories
 
 
+@pytest.mark.skipif(not COMPASS_LIVE_TESTS, reason="set COMPASS_LIVE_TESTS=1 to run against the live Compass API")
+def test_compass_client_fetch_jfrog_vulnerabilities():
+    """Test CompassClient fetch_jfrog_vulnerabilities returns valid data"""
+    assert COMPASS_TOKEN, "COMPASS_ACCESS_TOKEN not found in environment"
+    assert COMPASS_URL, "COMPASS_BASE_URL not found in environment"
+    
+    # Create CompassClient
+    compass_client = CompassClient(COMPASS_TOKEN, COMPASS_URL)
+    
+    # Fetch JFrog vulnerabilities for Cyberint organization
+    jfrog_vulns = compass_client.fetch_jfrog_vulnerabilities(CYBERINT_ORG_ID)
+    
+    # Verify we got data
+    assert isinstance(jfrog_vulns, dict), "Should return a dictionary"
+    
+    if jfrog_vulns:
+        # Verify structure of first few entries
+        for i, (artifact_key, vuln_data) in enumerate(islice(jfrog_vulns.items(), 3)):
+            assert isinstance(artifact_key, str), f"Artifact key {i} should be string"
+            assert isinstance(vuln_data, dict), f"Vulnerability data {i} should be dict"
+            
+            # Verify vulnerability data structure
+            assert 'vulnerabilities' in vuln_data, f"Entry {i} should have 'vulnerabilities' key"
+            vuln_counts = vuln_data['vulnerabilities']
+            
+            required_fields = ['critical', 'high', 'medium', 'low', 'unknown']
+            for field in required_fields:
+                assert field in vuln_counts, f"Entry {i} should have '{field}' in vulnerabilities"
+                assert isinstance(vuln_counts[field], int), f"Entry {i} '{field}' should be integer"
+                assert vuln_counts[field] >= 0, f"Entry {i} '{field}' should be non-negative"
+            
+            logger.info("Artifact %s: %s - C:%s, H:%s, M:%s, L:%s, U:%s",
+                        i+1, artifact_key, vuln_counts['critical'], vuln_counts['high'], vuln_counts['medium'], vuln_counts['low'], vuln_counts['unknown'])
+        
+        logger.info("✓ Successfully fetched JFrog vulnerabilities: %s artifacts", len(jfrog_vulns))
+    else:
+        logger.info("! No JFrog vulnerability data returned (endpoint might not be available)")
+
+
 if __name__ == "__main__":
     # Run tests with pytest
-    pytest.main([__file__, "-v", "-s"])
+    pytest.main([__file__, "-v"])
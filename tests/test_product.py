@@ -3,16 +3,10 @@ Tests for Product and DevOps classes using real data from CONSTANTS.py
 """
 
 import pytest
-import sys
 import os
 
-# Add src and root to path for imports  
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'config'))
-
-from models.product import Product
-from models.devops import DevOps
+from src.models.product import Product
+from src.models.devops import DevOps
 from CONSTANTS import PRODUCT_DEVOPS, PRODUCT_SCM_TYPE, PRODUCT_ORGANIZATION_ID
 
 
@@ -32,6 +26,15 @@ class TestDevOps:
         assert devops.email == datatube_devops_info["email"]
         assert "@checkpoint.com" in devops.email
     
+    @pytest.mark.parametrize("product_name,devops_info", list(PRODUCT_DEVOPS.items()))
+    def test_all_real_devops_contacts_valid(self, product_name, devops_info):
+        """Test every product's DevOps contact from CONSTANTS is a named Check Point contact (one case per product)"""
+        devops = DevOps(devops_info["name"], devops_info["email"])
+
+        assert devops.full_name.strip(), f"DevOps contact of product '{product_name}' has no name"
+        assert devops.email.endswith("@checkpoint.com"), \
+            f"DevOps contact of product '{product_name}' is not a @checkpoint.com address: {devops.email}"
+
     def test_init_invalid_email(self):
         """Test DevOps initialization with invalid email raises ValueError"""
         with pytest.raises(ValueError, match="Invalid email format"):
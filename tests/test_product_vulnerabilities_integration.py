@@ -0,0 +1,59 @@
+"""
+Product Vulnerabilities Integration Test - JFrog and Sonar vulnerabilities of the Cyberint product
+(the slow part of the product integration tests: loading vulnerabilities queries Compass and JFrog AQL)
+"""
+
+import pytest
+
+# Every test in this module calls live services, replayed from VCR cassettes unless LIVE_API=1
+pytestmark = [pytest.mark.integration, pytest.mark.slow, pytest.mark.vcr]
+
+
+@pytest.fixture(scope="session")
+def cyberint_repos_by_name(cyberint_product_with_vulns):
+    """Repository name -> repository of the Cyberint product with vulnerabilities (overrides the conftest fixture)"""
+    return {repo.get_repository_name(): repo for repo in cyberint_product_with_vulns.repos}
+
+
+@pytest.mark.xdist_group("cyberint_product")
+class TestProductVulnerabilitiesIntegration:
+    """Integration tests for the Cyberint product vulnerabilities (loaded once by the session fixture)"""
+
+    def test_frontend_service_artifacts(self, cyberint_repos_by_name):
+        """Test frontend-service artifacts each have a critical vulnerability and the latest one drives the counters"""
+        frontend_service_repo = cyberint_repos_by_name.get("frontend-service")
+        assert frontend_service_repo is not None, "frontend-service repository not found"
+        frontend_service_vulns = frontend_service_repo.vulnerabilities
+        assert frontend_service_vulns is not None, "frontend-service vulnerabilities not initialized"
+
+        artifacts = frontend_service_vulns.dependencies_vulns.artifacts
+        assert len(artifacts) > 3, f"Expected more than 3 artifacts for frontend-service, got {len(artifacts)}"
+        for artifact in artifacts:
+            assert artifact.critical_count >= 1, f"Artifact {artifact.artifact_key} should have at least 1 critical vulnerability, got {artifact.critical_count}"
+
+        latest_artifact = next((artifact for artifact in artifacts if artifact.is_latest), None)
+        assert latest_artifact is not None, "frontend-service should have a :latest artifact"
+
+        deps_vulns = frontend_service_vulns.dependencies_vulns
+        assert deps_vulns.critical_count == latest_artifact.critical_count, f"Dependencies critical count ({deps_vulns.critical_count}) should match latest artifact ({latest_artifact.critical_count})"
+        assert deps_vulns.high_count == latest_artifact.high_count, f"Dependencies high count ({deps_vulns.high_count}) should match latest artifact ({latest_artifact.high_count})"
+        assert deps_vulns.medium_count == latest_artifact.medium_count, f"Dependencies medium count ({deps_vulns.medium_count}) should match latest artifact ({latest_artifact.medium_count})"
+        assert deps_vulns.low_count == latest_artifact.low_count, f"Dependencies low count ({deps_vulns.low_count}) should match latest artifact ({latest_artifact.low_count})"
+        assert deps_vulns.unknown_count == latest_artifact.unknown_count, f"Dependencies unknown count ({deps_vulns.unknown_count}) should match latest artifact ({latest_artifact.unknown_count})"
+
+    def test_argosv2_ui_issues(self, cyberint_repos_by_name):
+        """Test argosv2-ui has Sonar vulnerability-type issues, at least one of them critical"""
+        argosv2_ui_repo = cyberint_repos_by_name.get("argosv2-ui")
+        assert argosv2_ui_repo is not None, "argosv2-ui repository not found"
+        argosv2_ui_vulns = argosv2_ui_repo.vulnerabilities
+        assert argosv2_ui_vulns is not None, "argosv2-ui vulnerabilities not initialized"
+
+        code_issues = argosv2_ui_vulns.code_issues
+        assert code_issues.has_vulnerabilities(), "argosv2-ui should have vulnerability-type issues"
+        assert code_issues.get_critical_vulnerability_count() >= 1, f"argosv2-ui should have at least 1 critical vulnerability, got {code_issues.get_critical_vulnerability_count()}"
+
+
+
+if __name__ == "__main__":
+    # Run tests with pytest
+    pytest.main([__file__, "-v"])